@@ -0,0 +1,11 @@
+"""
+Microbenchmarks for the hot paths of coala.
+
+The benchmarks run on a generated project of configurable size and don't
+need network access. Run them with::
+
+    python -m benchmarks --output results.json
+
+and compare the JSON output between commits, e.g. with
+``python -m benchmarks --compare results.json``.
+"""
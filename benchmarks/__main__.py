@@ -0,0 +1,128 @@
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from collections import OrderedDict
+
+from benchmarks.project import SyntheticProject
+from benchmarks.suite import BENCHMARKS, result_footprint, run_benchmarks
+from coalib import VERSION
+
+
+def default_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Times the hot paths of coala on a generated project and '
+                    'prints the timings as JSON.')
+    parser.add_argument('--files', type=int, default=20,
+                        help='number of generated files')
+    parser.add_argument('--lines', type=int, default=200,
+                        help='number of lines per file')
+    parser.add_argument('--line-length', type=int, default=60,
+                        help='approximate length of the lines')
+    parser.add_argument('--results', type=int, default=5,
+                        help='number of results per file')
+    parser.add_argument('--noqa-density', type=float, default=0.05,
+                        help='fraction of lines with an ignore comment')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed for generating the project')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of times each benchmark is run')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='number of processes to run bears with')
+    parser.add_argument('--benchmarks', nargs='+', choices=list(BENCHMARKS),
+                        metavar='NAME',
+                        help='benchmarks to run, one of: ' +
+                             ', '.join(BENCHMARKS))
+    parser.add_argument('--output',
+                        help='file to write the JSON results to instead of '
+                             'stdout')
+    parser.add_argument('--compare',
+                        help='JSON results of an earlier run to compare the '
+                             'median timings with')
+    return parser
+
+
+def get_commit():
+    """
+    :return: The commit the working directory is at or ``None`` if it can't
+             be determined.
+    """
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'],
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(timings, previous):
+    """
+    Adds the ratio of the median timings to the ones of an earlier run to the
+    timings.
+
+    >>> timings = {'a': {'median': 3.0}, 'b': {'median': 1.0}}
+    >>> compare(timings, {'a': {'median': 2.0}})
+    >>> timings['a']['change'], 'change' in timings['b']
+    (1.5, False)
+
+    :param timings:  The timings of the benchmarks, see
+                     ``benchmarks.suite.run_benchmarks``.
+    :param previous: The timings of the earlier run.
+    """
+    for name, timing in timings.items():
+        if name in previous and previous[name]['median'] > 0:
+            timing['change'] = timing['median'] / previous[name]['median']
+
+
+def write_report(report, file):
+    json.dump(report, file, indent=2)
+    file.write('\n')
+
+
+def main(arg_list=None):
+    args = default_arg_parser().parse_args(arg_list)
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as file:
+            previous = json.load(file)['benchmarks']
+
+    with SyntheticProject(files=args.files,
+                          lines=args.lines,
+                          line_length=args.line_length,
+                          results_per_file=args.results,
+                          noqa_density=args.noqa_density,
+                          seed=args.seed) as project:
+        timings = run_benchmarks(project,
+                                 names=args.benchmarks,
+                                 repeat=args.repeat,
+                                 jobs=args.jobs)
+        memory = OrderedDict((('bytes_per_result',
+                               result_footprint(project)),))
+        parameters = project.parameters
+
+    if previous is not None:
+        compare(timings, previous)
+
+    report = OrderedDict((('coala', VERSION),
+                          ('commit', get_commit()),
+                          ('python', platform.python_version()),
+                          ('platform', platform.platform()),
+                          ('project', parameters),
+                          ('repeat', args.repeat),
+                          ('jobs', args.jobs),
+                          ('benchmarks', timings),
+                          ('memory', memory)))
+    if args.output:
+        with open(args.output, 'w') as file:
+            write_report(report, file)
+    else:
+        write_report(report, sys.stdout)
+    return 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,51 @@
+from coalib.bears.LocalBear import LocalBear
+from coalib.core.FileBear import FileBear
+from coalib.results.Result import Result
+
+
+def stub_results(origin, filename, file, results_per_file):
+    """
+    Yields results spread evenly over the lines of a file.
+
+    :param origin:           The bear the results originate from.
+    :param filename:         The name of the file.
+    :param file:             The lines of the file.
+    :param results_per_file: The number of results to yield.
+    """
+    if not file:
+        return
+
+    step = max(len(file) // max(results_per_file, 1), 1)
+    for index in range(results_per_file):
+        line = min(index * step, len(file) - 1) + 1
+        yield Result.from_values(origin,
+                                 'Stub result {}.'.format(index),
+                                 filename,
+                                 line=line,
+                                 column=1,
+                                 end_line=line,
+                                 end_column=len(file[line - 1]))
+
+
+class StubLocalBear(LocalBear):
+    """
+    Yields a fixed number of results for every file, without analyzing it.
+    """
+
+    def run(self, filename, file, results_per_file: int = 5):
+        """
+        :param results_per_file: The number of results to yield per file.
+        """
+        return stub_results(self, filename, file, results_per_file)
+
+
+class StubFileBear(FileBear):
+    """
+    The ``StubLocalBear`` for the next generation core.
+    """
+
+    def analyze(self, filename, file, results_per_file: int = 5):
+        """
+        :param results_per_file: The number of results to yield per file.
+        """
+        return list(stub_results(self, filename, file, results_per_file))
@@ -0,0 +1,136 @@
+import os
+import random
+import shutil
+import string
+import tempfile
+
+from benchmarks.bears import StubLocalBear
+
+
+class SyntheticProject:
+    """
+    A generated project of Python-like source files in a temporary directory.
+
+    >>> with SyntheticProject(files=2, lines=3) as project:
+    ...     sorted(os.path.basename(path) for path in project.file_paths)
+    ['module_0.py', 'module_1.py']
+    """
+
+    def __init__(self,
+                 files=20,
+                 lines=200,
+                 line_length=60,
+                 results_per_file=5,
+                 noqa_density=0.05,
+                 seed=0):
+        """
+        :param files:            The number of files to generate.
+        :param lines:            The number of lines per file.
+        :param line_length:      The approximate length of the lines.
+        :param results_per_file: The number of results the stub bears yield
+                                 per file.
+        :param noqa_density:     The fraction of lines carrying an ignore
+                                 comment.
+        :param seed:             The seed for generating the contents, so
+                                 the same parameters always generate the
+                                 same project.
+        """
+        self.files = files
+        self.lines = lines
+        self.line_length = line_length
+        self.results_per_file = results_per_file
+        self.noqa_density = noqa_density
+        self.seed = seed
+
+        self.directory = None
+        self.file_paths = []
+
+    @property
+    def parameters(self):
+        """
+        :return: The parameters the project was generated with as dictionary.
+        """
+        return {'files': self.files,
+                'lines': self.lines,
+                'line_length': self.line_length,
+                'results_per_file': self.results_per_file,
+                'noqa_density': self.noqa_density,
+                'seed': self.seed}
+
+    @property
+    def file_glob(self):
+        """
+        :return: A glob matching all source files of the project.
+        """
+        return os.path.join(self.directory, '**', '*.py')
+
+    def generate_line(self, rng, number):
+        """
+        Generates a line of source code.
+
+        :param rng:    The ``random.Random`` object to use.
+        :param number: The number of the line.
+        :return:       The line including its trailing newline.
+        """
+        line = 'value_{} = "'.format(number)
+        payload_length = max(self.line_length - len(line) - 1, 0)
+        line += ''.join(rng.choice(string.ascii_letters)
+                        for _ in range(payload_length)) + '"'
+
+        if rng.random() < self.noqa_density:
+            line += rng.choice(('  # noqa',
+                                '  # Ignore ' + StubLocalBear.name))
+        return line + '\n'
+
+    def generate_file(self, rng):
+        """
+        :param rng: The ``random.Random`` object to use.
+        :return:    The lines of a new file.
+        """
+        return [self.generate_line(rng, number)
+                for number in range(self.lines)]
+
+    def modify_file(self, file, rng):
+        """
+        Simulates an edit of a file, changing, removing and adding some of its
+        lines.
+
+        :param file: The lines of the file.
+        :param rng:  The ``random.Random`` object to use.
+        :return:     The lines of the modified file.
+        """
+        modified = []
+        for number, line in enumerate(file):
+            choice = rng.random()
+            if choice < 0.02:
+                continue
+            elif choice < 0.05:
+                modified.append(self.generate_line(rng, number))
+            else:
+                modified.append(line)
+                if choice > 0.98:
+                    modified.append(self.generate_line(rng, number))
+        return modified
+
+    def __enter__(self):
+        rng = random.Random(self.seed)
+        self.directory = tempfile.mkdtemp(prefix='coala-benchmark-')
+        self.file_paths = []
+
+        for index in range(self.files):
+            # Spread the files over a few nested packages.
+            subdirectory = os.path.join(self.directory,
+                                        *('package_{}'.format(level)
+                                          for level in range(index % 4)))
+            os.makedirs(subdirectory, exist_ok=True)
+            path = os.path.join(subdirectory, 'module_{}.py'.format(index))
+            with open(path, 'w') as file:
+                file.writelines(self.generate_file(rng))
+            self.file_paths.append(path)
+
+        return self
+
+    def __exit__(self, *exc_info):
+        shutil.rmtree(self.directory)
+        self.directory = None
+        self.file_paths = []
@@ -0,0 +1,276 @@
+import gc
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from pyprint.ConsolePrinter import ConsolePrinter
+
+from benchmarks.bears import StubFileBear, StubLocalBear, stub_results
+from coalib.collecting.Collectors import collect_files
+from coalib.core.Core import run
+from coalib.misc import Constants
+from coalib.misc.Caching import FileCache
+from coalib.output.JSONEncoder import create_json_encoder
+from coalib.processes.Processing import (
+    check_result_ignore, execute_section, get_file_dict, yield_ignore_ranges)
+from coalib.results.AbsolutePosition import calc_line_col
+from coalib.results.Diff import Diff
+from coalib.results.ResultFilter import filter_results
+from coalib.settings.Section import Section
+from coalib.settings.Setting import Setting
+
+# Maps the benchmark names to functions preparing them. They get the
+# ``SyntheticProject`` and the number of jobs to use and return the function
+# to time.
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(name):
+    """
+    Registers a function preparing a benchmark.
+
+    :param name: The name of the benchmark.
+    """
+    def register(prepare):
+        BENCHMARKS[name] = prepare
+        return prepare
+
+    return register
+
+
+def _file_dict(project):
+    return get_file_dict(project.file_paths)
+
+
+def _results(project, file_dict):
+    return [result
+            for filename, file in sorted(file_dict.items())
+            for result in stub_results(StubLocalBear.name, filename, file,
+                                       project.results_per_file)]
+
+
+def _section(project, jobs):
+    section = Section('benchmark')
+    section.append(Setting('files', project.file_glob))
+    section.append(Setting('results_per_file',
+                           str(project.results_per_file)))
+    section.append(Setting('jobs', str(jobs)))
+    return section
+
+
+@benchmark('create_results')
+def prepare_create_results(project, jobs):
+    file_dict = _file_dict(project)
+    return lambda: _results(project, file_dict)
+
+
+@benchmark('collect_files')
+def prepare_collect_files(project, jobs):
+    return lambda: collect_files([project.file_glob])
+
+
+@benchmark('get_file_dict')
+def prepare_get_file_dict(project, jobs):
+    return lambda: get_file_dict(project.file_paths)
+
+
+@benchmark('yield_ignore_ranges')
+def prepare_yield_ignore_ranges(project, jobs):
+    file_dict = _file_dict(project)
+    return lambda: list(yield_ignore_ranges(file_dict))
+
+
+@benchmark('check_result_ignore')
+def prepare_check_result_ignore(project, jobs):
+    file_dict = _file_dict(project)
+    ignore_ranges = list(yield_ignore_ranges(file_dict))
+    results = _results(project, file_dict)
+    return lambda: [result for result in results
+                    if not check_result_ignore(result, ignore_ranges)]
+
+
+@benchmark('calc_line_col')
+def prepare_calc_line_col(project, jobs):
+    files = [(file, len(''.join(file)))
+             for file in _file_dict(project).values()]
+    return lambda: [calc_line_col(file, position)
+                    for file, length in files
+                    for position in range(0, length, 7)]
+
+
+def _modified_file_dict(project, file_dict):
+    rng = random.Random(project.seed)
+    return {filename: project.modify_file(file, rng)
+            for filename, file in sorted(file_dict.items())}
+
+
+@benchmark('diff_from_string_arrays')
+def prepare_diff_from_string_arrays(project, jobs):
+    file_dict = _file_dict(project)
+    modified_file_dict = _modified_file_dict(project, file_dict)
+    return lambda: [Diff.from_string_arrays(file, modified_file_dict[name])
+                    for name, file in file_dict.items()]
+
+
+@benchmark('diff_from_string_arrays_patience')
+def prepare_diff_from_string_arrays_patience(project, jobs):
+    file_dict = _file_dict(project)
+    modified_file_dict = _modified_file_dict(project, file_dict)
+    return lambda: [Diff.from_string_arrays(file, modified_file_dict[name],
+                                            algorithm='patience')
+                    for name, file in file_dict.items()]
+
+
+@benchmark('diff_modified')
+def prepare_diff_modified(project, jobs):
+    file_dict = _file_dict(project)
+    modified_file_dict = _modified_file_dict(project, file_dict)
+    diffs = [Diff.from_string_arrays(file, modified_file_dict[name])
+             for name, file in file_dict.items()]
+    return lambda: [diff.modified for diff in diffs]
+
+
+@benchmark('filter_results')
+def prepare_filter_results(project, jobs):
+    file_dict = _file_dict(project)
+    modified_file_dict = _modified_file_dict(project, file_dict)
+    original_results = _results(project, file_dict)
+    modified_results = _results(project, modified_file_dict)
+    return lambda: filter_results(file_dict, modified_file_dict,
+                                  original_results, modified_results)
+
+
+@benchmark('json_encode')
+def prepare_json_encode(project, jobs):
+    results = {'results': {'cli': _results(project, _file_dict(project))}}
+    encoder = create_json_encoder(use_relpath=False)
+    return lambda: json.dumps(results,
+                              cls=encoder,
+                              sort_keys=True,
+                              indent=2,
+                              separators=(',', ': '))
+
+
+@benchmark('file_cache_write')
+def prepare_file_cache_write(project, jobs):
+    cache = FileCache(None, project.directory, flush_cache=True)
+    cache.track_files(project.file_paths)
+    return cache.write
+
+
+@benchmark('file_cache_load')
+def prepare_file_cache_load(project, jobs):
+    cache = FileCache(None, project.directory, flush_cache=True)
+    cache.track_files(project.file_paths)
+    cache.write()
+    return lambda: FileCache(None, project.directory)
+
+
+@benchmark('execute_section')
+def prepare_execute_section(project, jobs):
+    section = _section(project, jobs)
+    console_printer = ConsolePrinter()
+    return lambda: execute_section(section,
+                                   [],
+                                   [StubLocalBear],
+                                   lambda *args: True,
+                                   None,
+                                   None,
+                                   console_printer=console_printer)
+
+
+@benchmark('core_run')
+def prepare_core_run(project, jobs):
+    section = _section(project, jobs)
+    file_dict = _file_dict(project)
+
+    def run_core():
+        results = []
+        run([StubFileBear(section, file_dict)],
+            results.append,
+            executor=ProcessPoolExecutor(max_workers=jobs))
+        return results
+
+    return run_core
+
+
+@benchmark('startup')
+def prepare_startup(project, jobs):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return lambda: subprocess.check_call(
+        [sys.executable, '-c', 'from coalib.coala import main; main()',
+         '--version'],
+        cwd=root,
+        stdout=subprocess.DEVNULL)
+
+
+def result_footprint(project):
+    """
+    Measures the memory the results of the stub bears take.
+
+    :param project: An entered ``SyntheticProject``.
+    :return:        The average number of bytes allocated per result, as
+                    traced by ``tracemalloc``.
+    """
+    file_dict = _file_dict(project)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        results = _results(project, file_dict)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return (after - before) / max(len(results), 1)
+
+
+def time_function(function, repeat):
+    """
+    Times a function.
+
+    :param function: The function to time.
+    :param repeat:   The number of times to run it.
+    :return:         A dictionary with the minimal, median and mean duration
+                     in seconds and the number of runs.
+    """
+    durations = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return OrderedDict((('min', min(durations)),
+                        ('median', statistics.median(durations)),
+                        ('mean', statistics.mean(durations)),
+                        ('runs', repeat)))
+
+
+def run_benchmarks(project, names=None, repeat=5, jobs=1):
+    """
+    Runs benchmarks on a generated project. Caches are written to a data
+    directory inside the project, so the user's data directory is left alone.
+
+    :param project: An entered ``SyntheticProject``.
+    :param names:   The names of the benchmarks to run or ``None`` for all.
+    :param repeat:  The number of times each benchmark is run.
+    :param jobs:    The number of processes to use for running bears.
+    :return:        A dictionary mapping the benchmark names to their timings,
+                    see ``time_function``.
+    """
+    original_data_dir = Constants.USER_DATA_DIR
+    Constants.USER_DATA_DIR = os.path.join(project.directory, '.coala-data')
+    try:
+        return OrderedDict(
+            (name, time_function(BENCHMARKS[name](project, jobs), repeat))
+            for name in (BENCHMARKS if names is None else names))
+    finally:
+        Constants.USER_DATA_DIR = original_data_dir
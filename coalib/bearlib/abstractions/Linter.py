@@ -14,6 +14,8 @@ from coalib.bears.LocalBear import LocalBear
 from coalib.bears.GlobalBear import GlobalBear
 from coala_utils.ContextManagers import make_temp
 from coala_utils.decorators import assert_right_type, enforce_signature
+from coalib.misc.PrerequisiteCache import (
+    executable_state, get_prerequisite_cache)
 from coalib.misc.Shell import run_shell_command
 from coalib.results.Diff import Diff
 from coalib.results.Result import Result
@@ -220,13 +222,23 @@ def _create_linter(klass, options):
                          if options['executable_check_fail_info'] else
                          ''))
             else:
-                if options['prerequisite_check_command']:
-                    try:
-                        check_call(options['prerequisite_check_command'],
-                                   stdout=DEVNULL,
-                                   stderr=DEVNULL)
-                        return True
-                    except (OSError, CalledProcessError):
+                command = options['prerequisite_check_command']
+                if command:
+                    def run_check_command():
+                        try:
+                            check_call(command, stdout=DEVNULL, stderr=DEVNULL)
+                            return True
+                        except (OSError, CalledProcessError):
+                            return False
+
+                    # The command is only run again if it or the executables
+                    # involved changed.
+                    key = (('linter',) +
+                           executable_state(cls.get_executable()) +
+                           (tuple(command),) +
+                           executable_state(command[0]))
+                    if not get_prerequisite_cache().check(key,
+                                                          run_check_command):
                         return options['prerequisite_check_fail_message']
                 return True
 
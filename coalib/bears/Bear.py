@@ -1,3 +1,4 @@
+import copy
 import inspect
 import cProfile
 import pdb
@@ -7,7 +8,6 @@ import logging
 from functools import partial
 from os import makedirs, getcwd
 from os.path import join, abspath, exists, isdir
-import requests
 from appdirs import user_data_dir
 
 from pyprint.Printer import Printer
@@ -17,6 +17,7 @@ from coala_utils.decorators import (enforce_signature, classproperty,
 
 from coalib.bears.BEAR_KIND import BEAR_KIND
 from coalib.output.printers.LogPrinter import LogPrinterMixin
+from coalib.misc.PrerequisiteCache import is_requirement_installed
 from coalib.results.Result import Result
 from coalib.results.TextPosition import ZeroOffsetError
 from coalib.settings.FunctionMetadata import FunctionMetadata
@@ -27,6 +28,20 @@ from coalib.settings.ConfigurationGathering import get_config_directory
 from .meta import bearclass
 
 
+def _section_state(section):
+    """
+    Retrieves a comparable snapshot of the settings and the language of the
+    given section and its defaults, without converting any setting.
+    """
+    state = [section.language]
+    while section is not None:
+        state.append(tuple((setting.key, setting._value, setting.origin,
+                            setting.to_append)
+                           for setting in section.contents.values()))
+        section = section.defaults
+    return state
+
+
 def _setting_is_enabled(bear, key):
     """
     Check setting key is in section.
@@ -334,6 +349,10 @@ class Bear(Printer, LogPrinterMixin, metaclass=bearclass):
         return (cls.AUTHORS_EMAILS if cls.MAINTAINERS_EMAILS == set()
                 else cls.MAINTAINERS_EMAILS)
 
+    # The state of the section and the keyword arguments bound from it by
+    # ``bind_section_params``.
+    _bound_params = None
+
     @enforce_signature
     def __init__(self,
                  section: Section,
@@ -415,19 +434,49 @@ class Bear(Printer, LogPrinterMixin, metaclass=bearclass):
         self._dump_bear_profile_data(profiler)
         return results
 
-    def run_bear_from_section(self, args, kwargs):
+    def bind_section_params(self):
+        """
+        Converts the settings of the section into the keyword arguments the
+        ``run`` method is invoked with.
+
+        The arguments are only converted again if a setting of the section
+        (or its defaults) or the language of the section changed since the
+        last call, so this is cheap enough to be called for every file. A
+        setting that cannot be converted is reported only once.
+        ``run_bear_from_section`` passes copies of the argument values to
+        every run, so bears modifying them don't affect later runs.
+
+        :return: The dictionary of keyword arguments or None if a setting
+                 cannot be converted.
+        """
+        key = _section_state(self.section)
+        if self._bound_params is not None and self._bound_params[0] == key:
+            return self._bound_params[1]
+
+        metadata = self.get_metadata()
         try:
+            params = {}
             # Don't get `language` setting from `section.contents`
             if self.section.language and (
-                    'language' in self.get_metadata()._optional_params or
-                    'language' in self.get_metadata()._non_optional_params):
-                kwargs['language'] = self.section.language
-            kwargs.update(
-                self.get_metadata().create_params_from_section(self.section))
+                    'language' in metadata._optional_params or
+                    'language' in metadata._non_optional_params):
+                params['language'] = self.section.language
+            params.update(metadata.create_params_from_section(self.section))
         except ValueError as err:
             self.warn('The bear {} cannot be executed.'.format(
                 self.name), str(err))
+            params = None
+
+        self._bound_params = (key, params)
+        return params
+
+    def run_bear_from_section(self, args, kwargs):
+        params = self.bind_section_params()
+        if params is None:
             return
+        # Mutable values like lists mustn't leak changes into later runs.
+        kwargs.update((name, copy.copy(value))
+                      for name, value in params.items())
         if self.debugger:
             return debug_run(self.run, Debugger(bear=self), *args, **kwargs)
         elif self.profile:
@@ -593,7 +642,7 @@ class Bear(Printer, LogPrinterMixin, metaclass=bearclass):
                  that serves a more detailed description of what's missing.
         """
         for requirement in cls.REQUIREMENTS:
-            if not requirement.is_installed():
+            if not is_requirement_installed(requirement):
                 return str(requirement) + ' is not installed. You can ' + (
                     'install it using ') + (
                     ' '.join(requirement.install_command()))
@@ -641,6 +690,7 @@ class Bear(Printer, LogPrinterMixin, metaclass=bearclass):
         self.info('Downloading {filename!r} for bear {bearname} from {url}.'
                   .format(filename=filename, bearname=self.name, url=url))
 
+        import requests
         response = requests.get(url, stream=True, timeout=20)
         response.raise_for_status()
 
@@ -2,7 +2,6 @@ from collections import defaultdict
 
 from coalib.bearlib.aspects.collections import AspectList
 from coalib.bearlib.languages.Language import Languages
-from coalib.collecting.Collectors import get_all_languages
 
 
 class bearclass(type):
@@ -30,6 +29,7 @@ class bearclass(type):
         type.__init__(cls, clsname, bases, clsattrs, *varargs)
         if aspects is not None:
             if languages is None:
+                from coalib.collecting.Collectors import get_all_languages
                 languages = get_all_languages(include_unknown=True)
             cls.languages = Languages(languages)
             cls.aspects = defaultdict(
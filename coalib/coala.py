@@ -16,10 +16,6 @@ import sys
 
 from pyprint.ConsolePrinter import ConsolePrinter
 
-from dependency_management.requirements.PipRequirement import PipRequirement
-
-from coalib.parsing.FilterHelper import (
-    apply_filter, apply_filters, InvalidFilterException)
 from coalib.output.Logging import configure_logging
 from coalib.parsing.DefaultArgParser import default_arg_parser
 from coalib.misc.Exceptions import get_exitcode
@@ -34,6 +30,8 @@ def main(debug=False):
         # not.
         args = default_arg_parser().parse_args()
         if args.debug:
+            from dependency_management.requirements.PipRequirement import (
+                PipRequirement)
             req_ipdb = PipRequirement('ipdb')
             if not req_ipdb.is_installed():
                 logging.error('--debug flag requires ipdb. '
@@ -54,11 +52,16 @@ def main(debug=False):
         configure_logging(not args.no_color)
 
         if args.show_bears:
+            from coalib.collecting.Collectors import load_section_bears
+            from coalib.parsing.FilterHelper import (
+                apply_filters, InvalidFilterException)
             from coalib.settings.ConfigurationGathering import get_all_bears
             kwargs = {}
             if args.bears:
                 kwargs['bear_globs'] = args.bears
-            filtered_bears = get_all_bears(**kwargs)
+            # Filters are applied on the bear manifest, only the bears shown
+            # are imported.
+            filtered_bears = get_all_bears(lazy=True, **kwargs)
             if args.filter_by_language:
                 logging.warning(
                     "'--filter-by-language ...' is deprecated. "
@@ -77,7 +80,8 @@ def main(debug=False):
                     console_printer.print(ex)
                     return 2
 
-            local_bears, global_bears = filtered_bears
+            local_bears, global_bears = map(load_section_bears,
+                                            filtered_bears)
             show_bears(local_bears,
                        global_bears,
                        args.show_description or args.show_details,
@@ -89,7 +93,10 @@ def main(debug=False):
         elif args.show_capabilities:
             from coalib.collecting.Collectors import (
                 filter_capabilities_by_languages)
-            local_bears, _ = apply_filter('language', args.show_capabilities)
+            from coalib.parsing.FilterHelper import apply_filter
+            from coalib.settings.ConfigurationGathering import get_all_bears
+            local_bears, _ = apply_filter('language', args.show_capabilities,
+                                          get_all_bears(lazy=True))
             capabilities = filter_capabilities_by_languages(
                 local_bears, args.show_capabilities)
             show_language_bears_capabilities(capabilities, console_printer)
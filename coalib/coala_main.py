@@ -4,7 +4,11 @@ import os
 import platform
 
 from coalib import VERSION
+from coalib.collecting.Collectors import bear_collection_cache
+from coalib.io.DirectorySnapshot import directory_snapshot
 from coalib.misc.Exceptions import get_exitcode
+from coalib.misc.PrerequisiteCache import get_prerequisite_cache
+from coalib.misc.Timings import Timings
 from coalib.output.Interactions import fail_acquire_settings
 from coalib.output.Logging import CounterHandler
 from coalib.processes.Processing import execute_section, simplify_section_result
@@ -50,6 +54,8 @@ def format_lines(lines, symbol='', line_nr=''):
                      for line in lines.rstrip('\n').split('\n'))
 
 
+@directory_snapshot()
+@bear_collection_cache()
 def run_coala(console_printer=None,
               log_printer=None,
               print_results=do_nothing,
@@ -61,11 +67,15 @@ def run_coala(console_printer=None,
               arg_parser=None,
               arg_list=None,
               args=None,
-              debug=False):
+              debug=False,
+              timings=None):
     """
     This is a main method that should be usable for almost all purposes and
     reduces executing coala to one function call.
 
+    Directory listings and discovered bears are shared between all sections
+    of a run.
+
     :param console_printer:         Object to print messages on the console.
     :param log_printer:             A LogPrinter object to use for logging.
     :param print_results:           A callback that takes a LogPrinter, a
@@ -96,6 +106,12 @@ def run_coala(console_printer=None,
     :param debug:                   Run in debug mode, bypassing
                                     multiprocessing, and not catching any
                                     exceptions.
+    :param timings:                 A ``misc.Timings.Timings`` object to record
+                                    the timings of all bear runs in. If
+                                    ``None``, the timings are only recorded
+                                    if the ``timings`` or ``trace`` setting is
+                                    given and a summary is printed if
+                                    ``timings`` is given.
     :return:                        A dictionary containing a list of results
                                     for all analyzed sections as key.
     """
@@ -146,7 +162,18 @@ def run_coala(console_printer=None,
                       .format(platform.system(), platform.python_version(),
                               VERSION))
 
-        settings_hash = get_settings_hash(sections, targets)
+        if sections['cli'].get('flush_cache', False):
+            get_prerequisite_cache().flush()
+
+        print_timings = False
+        if timings is None and (sections['cli'].get('timings', False) or
+                                'trace' in sections['cli']):
+            timings = Timings()
+            print_timings = bool(sections['cli'].get('timings', False))
+
+        settings_hash = get_settings_hash(
+            sections, targets,
+            ignore_settings=['disable_caching', 'timings', 'trace'])
         flush_cache = bool(sections['cli'].get('flush_cache', False) or
                            settings_changed(None, settings_hash))
 
@@ -181,7 +208,8 @@ def run_coala(console_printer=None,
                 debug=debug or args and args.debug,
                 apply_single=(apply_single
                               if apply_single is not None else
-                              False))
+                              False),
+                timings=timings)
             yielded, yielded_unfixed, results[section_name] = (
                 simplify_section_result(section_result))
 
@@ -196,6 +224,16 @@ def run_coala(console_printer=None,
         if cache:
             cache.write()
 
+        if 'trace' in sections['cli']:
+            timings.write_chrome_trace(str(sections['cli']['trace']))
+
+        if print_timings:
+            if console_printer is None:
+                # Don't mix the summary into machine readable output.
+                logging.info(timings.format_summary())
+            else:
+                console_printer.print(timings.format_summary())
+
         if CounterHandler.get_num_calls_for_level('ERROR') > 0:
             exitcode = 1
         elif did_nothing:
@@ -60,16 +60,22 @@ def mode_json(args, debug=False):
     from coalib.coala_main import run_coala
     from coalib.output.Logging import configure_json_logging
     from coalib.output.JSONEncoder import create_json_encoder
+    from coalib.misc.Timings import Timings
 
     if args.log_json:
         log_stream = configure_json_logging()
 
     JSONEncoder = create_json_encoder(use_relpath=args.relpath)
 
-    results, exitcode, _ = run_coala(args=args, debug=debug)
+    timings = Timings() if args.timings else None
+
+    results, exitcode, _ = run_coala(args=args, debug=debug, timings=timings)
 
     retval = {'results': results}
 
+    if timings is not None:
+        retval['timings'] = timings
+
     if args.log_json:
         retval['logs'] = [json.loads(line) for line in
                           log_stream.getvalue().splitlines()]
@@ -1,18 +1,21 @@
 import functools
 import logging
 import os
-import pkg_resources
 import itertools
-import re
+import sys
+from contextlib import contextmanager
 from types import ModuleType
 
 from coalib.bears.BEAR_KIND import BEAR_KIND
 from coalib.collecting.Importers import iimport_objects
+from coalib.io.DirectorySnapshot import isdir, isfile
 from coala_utils.decorators import yield_once
+from coalib.misc.CachingUtilities import pickle_dump, pickle_load
+from coalib.misc.Constants import VERSION
 from coalib.misc.Exceptions import log_exception
-from coalib.misc.IterUtilities import partition
 from coalib.output.printers.LOG_LEVEL import LOG_LEVEL
-from coalib.parsing.Globbing import fnmatch, iglob, glob_escape
+from coalib.parsing.Globbing import (
+    compile_glob_set, fnmatch, glob_escape, iglob, imulti_glob)
 from coalib.bearlib.languages.Language import Languages
 from coalib.bearlib.languages import definitions
 
@@ -24,22 +27,240 @@ def _get_kind(bear_class):
         return None
 
 
+def _has_kind(bear_class, kinds):
+    kind = _get_kind(bear_class)
+    return kind is not None if kinds is None else kind in kinds
+
+
 def _import_bears(file_path, kinds):
     # recursive imports:
     for bear_list in iimport_objects(file_path,
                                      names='__additional_bears__',
                                      types=list):
         for bear_class in bear_list:
-            if _get_kind(bear_class) in kinds:
+            if _has_kind(bear_class, kinds):
                 yield bear_class
     # normal import
     for bear_class in iimport_objects(file_path,
                                       attributes='kind',
                                       local=True):
-        if _get_kind(bear_class) in kinds:
+        if _has_kind(bear_class, kinds):
             yield bear_class
 
 
+class BearManifestEntry:
+    """
+    Describes a bear class without keeping its module imported.
+
+    Entries provide the attributes the bear filters and capability listings
+    need (``name``, ``kind()``, ``LANGUAGES``, ``CAN_DETECT``, ``CAN_FIX``
+    and ``can_detect``), so they can be used in place of bear classes until
+    the class itself is needed, which is then imported with ``load()``.
+    """
+
+    def __init__(self, file_path, bear_class):
+        """
+        :param file_path:  The module file the bear was collected from.
+        :param bear_class: The bear class to describe.
+        """
+        self.file_path = file_path
+        self.name = bear_class.name
+        self._kind = _get_kind(bear_class)
+        self.LANGUAGES = set(bear_class.LANGUAGES)
+        self.CAN_DETECT = set(bear_class.CAN_DETECT)
+        self.CAN_FIX = set(bear_class.CAN_FIX)
+        aspects = getattr(bear_class, 'aspects', {})
+        self.aspect_names = frozenset(
+            leaf_aspect.__qualname__
+            for key in ('detect', 'fix') if key in aspects
+            for leaf_aspect in aspects[key].get_leaf_aspects())
+
+    def kind(self):
+        return self._kind
+
+    @property
+    def can_detect(self):
+        return self.CAN_DETECT | self.CAN_FIX
+
+    def may_analyze(self, aspect):
+        """
+        Checks whether the bear may be able to analyze the given leaf aspect.
+        This only compares aspect names, the bear class has to be checked
+        for a definite answer.
+
+        :param aspect: A leaf aspectclass or aspectclass instance.
+        :return:       False if the bear surely can't analyze the aspect.
+        """
+        aspect = aspect if isinstance(aspect, type) else type(aspect)
+        return aspect.__qualname__ in self.aspect_names
+
+    def load(self):
+        """
+        Imports the described bear class.
+
+        :return:            The bear class.
+        :raises ImportError: If the module doesn't provide the bear anymore.
+        """
+        for bear_class in _import_bears(self.file_path, [self._kind]):
+            if bear_class.name == self.name:
+                return bear_class
+        raise ImportError('{} cannot be found in {}.'.format(
+            self.name, self.file_path))
+
+    def __repr__(self):
+        return '<{} {} from {!r}>'.format(
+            type(self).__name__, self.name, self.file_path)
+
+
+def _installed_distributions():
+    """
+    Lists the installed distributions without importing ``pkg_resources``,
+    which is slow.
+
+    :return: A frozenset of the names of the metadata directories of all
+             distributions on ``sys.path``, like
+             ``requests-2.18.4.dist-info``. They contain the versions of the
+             distributions.
+    """
+    distributions = set()
+    for path in sys.path:
+        if path.endswith('.egg'):
+            distributions.add(os.path.basename(path))
+
+        try:
+            names = os.listdir(path or os.curdir)
+        except OSError:  # Zipped eggs, removed directories etc.
+            continue
+
+        distributions.update(name for name in names
+                             if name.endswith(('.dist-info', '.egg-info')))
+    return frozenset(distributions)
+
+
+class BearManifest:
+    """
+    Persistent index of the bears every bear module provides.
+
+    The entries of a module are only computed again (by importing it) if the
+    modification time or size of the module file changed. The index is
+    stored in the user data directory and is discarded entirely when the
+    coala or Python version changes or when any distribution, e.g. a
+    dependency of a bear, is installed, upgraded or removed.
+    """
+
+    IDENTIFIER = 'bear_manifest'
+
+    def __init__(self):
+        data = pickle_load(None, self.IDENTIFIER, {})
+        if data.get('version') != self._version():
+            data = {}
+        self._modules = data.get('modules', {})
+        self._changed = False
+
+    @staticmethod
+    def _version():
+        return VERSION, sys.version_info[:3], _installed_distributions()
+
+    def entries(self, file_path):
+        """
+        Retrieves the entries of all bears a module provides, importing the
+        module only if it changed since it was indexed.
+
+        :param file_path: The path to the bear module.
+        :return:          A list of ``BearManifestEntry`` objects.
+        """
+        stat = os.stat(file_path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._modules.get(file_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        entries = [BearManifestEntry(file_path, bear_class)
+                   for bear_class in _import_bears(file_path, None)]
+        self._modules[file_path] = (key, entries)
+        self._changed = True
+        return entries
+
+    def write(self):
+        """
+        Stores the index if it was changed.
+        """
+        if self._changed:
+            pickle_dump(None, self.IDENTIFIER,
+                        {'version': self._version(),
+                         'modules': self._modules})
+            self._changed = False
+
+
+_bear_manifest = None
+
+
+def get_bear_manifest():
+    """
+    :return: The ``BearManifest`` shared within this process.
+    """
+    global _bear_manifest
+    if _bear_manifest is None:
+        _bear_manifest = BearManifest()
+    return _bear_manifest
+
+
+def _log_collection_failure(file_path, exception):
+    import pkg_resources
+    if isinstance(exception, pkg_resources.VersionConflict):
+        log_exception(
+            ('Unable to collect bears from {file} because there '
+             'is a conflict with the version of a dependency '
+             'you have installed. This may be resolved by '
+             'creating a separate virtual environment for coala '
+             'or running `pip3 install \"{pkg}\"`. Be aware that '
+             'the latter solution might break other python '
+             'packages that depend on the currently installed '
+             'version.').format(file=file_path, pkg=exception.req),
+            exception, log_level=LOG_LEVEL.WARNING)
+    else:
+        log_exception(
+            'Unable to collect bears from {file}. Probably the '
+            'file is malformed or the module code raises an '
+            'exception.'.format(file=file_path),
+            exception,
+            log_level=LOG_LEVEL.WARNING)
+
+
+def _load_bear(entry):
+    """
+    Imports the bear class of a ``BearManifestEntry``, logging a warning if
+    that fails.
+
+    :return: The bear class or None.
+    """
+    try:
+        return entry.load()
+    except BaseException as exception:
+        _log_collection_failure(entry.file_path, exception)
+
+
+def load_section_bears(bears):
+    """
+    Imports the bear classes of ``BearManifestEntry`` objects.
+
+    Bears that cannot be imported anymore are skipped with a warning.
+
+    :param bears: Dictionary with sections as keys and lists of bear classes
+                  or ``BearManifestEntry`` objects as values.
+    :return:      New dictionary with lists of bear classes as values.
+    """
+    loaded = {}
+    for section, section_bears in bears.items():
+        loaded[section] = []
+        for bear in section_bears:
+            if isinstance(bear, BearManifestEntry):
+                bear = _load_bear(bear)
+            if bear is not None:
+                loaded[section].append(bear)
+    return loaded
+
+
 def _sort_bears(bears, key=lambda x: x.name.lower(), reverse=False):
     """
     Sort the bear list according to the key provided.
@@ -55,14 +276,20 @@ def _sort_bears(bears, key=lambda x: x.name.lower(), reverse=False):
 
 
 @yield_once
-def icollect(file_paths, ignored_globs=None, match_cache={},
+def icollect(file_paths, ignored_globs=None, match_cache=None,
              match_function=fnmatch):
     """
     Evaluate globs in file paths and return all matching files.
 
+    Directories whose whole contents are ignored by ``ignored_globs`` are
+    not walked into.
+
     :param file_paths:      File path or list of such that can include globs
     :param ignored_globs:   List of globs to ignore when matching files
-    :param match_cache:     Dictionary to use for caching results
+    :param match_cache:     Dictionary to use for caching results. Glob
+                            results are not cached across calls if not
+                            given, directory listings are still shared
+                            while a ``directory_snapshot`` is active.
     :param match_function:  The function to use for glob matching
     :return:                Iterator that yields tuple of path of a matching
                             file, the glob where it was found
@@ -70,37 +297,111 @@ def icollect(file_paths, ignored_globs=None, match_cache={},
     if isinstance(file_paths, str):
         file_paths = [file_paths]
 
+    if match_cache is None:
+        match_cache = {}
+
+    pruned_globs = tuple(ignored_globs) if ignored_globs else ()
     for file_path in file_paths:
-        if file_path not in match_cache:
-            match_cache[file_path] = list(iglob(file_path))
+        cache_key = (file_path, pruned_globs)
+        if cache_key not in match_cache:
+            match_cache[cache_key] = list(iglob(file_path, pruned_globs))
 
-        for match in match_cache[file_path]:
+        for match in match_cache[cache_key]:
             if not ignored_globs or not match_function(match, ignored_globs):
                 yield match, file_path
 
 
+class _DirOrFilePatternMatcher:
+    """
+    Matches paths against ignore globs the way ``match_dir_or_file_pattern``
+    does, but expands the globs only once on construction.
+
+    Globs ending with ``**`` ignore everything below their directory anyway
+    and are therefore matched directly with a compiled regex instead of
+    being expanded. All other globs are expanded on the filesystem: the
+    resulting directories are stored in a path trie, the resulting files in
+    a set, so that matching a path only needs one walk over its components.
+
+    >>> matcher = _DirOrFilePatternMatcher([os.path.join('a', 'b', '**')])
+    >>> matcher(os.path.join('a', 'b', 'c.py'))
+    True
+    >>> matcher(os.path.join('a', 'bc.py'))
+    False
+    """
+
+    # Marks a trie node whose path is an ignored directory.
+    _IGNORED = None
+
+    def __init__(self, ignore_patterns=None):
+        """
+        :param ignore_patterns: List of globs that match a file or a
+                                directory.
+        """
+        recursive_globs = []
+        self.dir_trie = {}
+        self.files = set()
+
+        expanded_ignores = []
+        for pattern in ignore_patterns if ignore_patterns else ():
+            if pattern.endswith('**'):
+                recursive_globs.append(pattern)
+            else:
+                expanded_ignores += iglob(pattern)
+
+        self.recursive_globs = compile_glob_set(tuple(recursive_globs))
+
+        for path in expanded_ignores:
+            if isfile(path):
+                self.files.add(path)
+            else:
+                node = self.dir_trie
+                for component in self._split(path):
+                    node = node.setdefault(component, {})
+                node[self._IGNORED] = True
+
+    @staticmethod
+    def _split(path):
+        return path.rstrip(os.sep).split(os.sep)
+
+    def _match_dir(self, path):
+        node = self.dir_trie
+        for component in self._split(path):
+            if self._IGNORED in node:
+                return True
+            node = node.get(component)
+            if node is None:
+                return False
+        return self._IGNORED in node
+
+    def __call__(self, path, ignore_patterns=None):
+        """
+        Tests whether the given path is ignored.
+
+        :param path:            Valid file path.
+        :param ignore_patterns: Ignored, the patterns given on construction
+                                are used. This allows using the matcher as
+                                a ``match_function`` for ``icollect``.
+        :return:                True if any of the ignore patterns match.
+        """
+        return (path in self.files or
+                self._match_dir(path) or
+                self.recursive_globs.match(path) is not None)
+
+
 def match_dir_or_file_pattern(path, ignore_patterns=None):
     """
-    Tries to match the given path with the directory (substring match) or file
+    Tries to match the given path with the directory (prefix match) or file
     (enforced full match) patterns.
 
+    Every call expands the given globs again, use ``_DirOrFilePatternMatcher``
+    to match many paths against the same patterns.
+
     :param path:                Valid file path
-    :param ignore_patterns:     List of regex patterns that match a file or a
+    :param ignore_patterns:     List of glob patterns that match a file or a
                                 directory
     :return:                    True if any of the given pattern match
     """
-    def escape(pattern):
-        return pattern.replace('\\', '\\\\')
-
-    expanded_ignores = list_glob_results(ignore_patterns)
-
-    file_patterns, dir_patterns = partition(
-        expanded_ignores,
-        os.path.isfile)
-
-    return (
-        any((re.match(escape(pattern), path) for pattern in dir_patterns)) or
-        any((re.fullmatch(escape(pattern), path) for pattern in file_patterns)))
+    return _DirOrFilePatternMatcher(ignore_patterns)(path)
 
 
 def list_glob_results(values=None):
@@ -127,14 +428,20 @@ def collect_files(file_paths, log_printer=None, ignored_file_paths=None,
     :param section_name:       Name of currently executing section
     :return:                   List of paths of all matching files
     """
-    limit_fnmatch = (functools.partial(fnmatch, globs=limit_file_paths)
-                     if limit_file_paths else lambda fname: True)
+    if isinstance(file_paths, str):
+        file_paths = [file_paths]
+
+    limit_globs = compile_glob_set(tuple(limit_file_paths or ()))
+    limit_fnmatch = ((lambda fname: limit_globs.match(fname) is not None)
+                     if limit_file_paths else (lambda fname: True))
+    is_ignored = (_DirOrFilePatternMatcher(ignored_file_paths)
+                  if ignored_file_paths else lambda fname: False)
 
-    valid_files = list(
-        filter(lambda fname: os.path.isfile(fname[0]),
-               icollect(file_paths,
-                        ignored_file_paths,
-                        match_function=match_dir_or_file_pattern)))
+    # All globs are matched in a single walk over the filesystem.
+    valid_files = [(fname, file_glob)
+                   for fname, file_glob in imulti_glob(file_paths,
+                                                       ignored_file_paths)
+                   if isfile(fname) and not is_ignored(fname)]
 
     # Find globs that gave no files and warn the user
     if valid_files:
@@ -159,7 +466,7 @@ def collect_dirs(dir_paths, ignored_dir_paths=None):
     :param ignored_dir_paths: List of globs that match to-be-ignored dirs
     :return:                  List of paths of all matching directories
     """
-    valid_dirs = list(filter(lambda fname: os.path.isdir(fname[0]),
+    valid_dirs = list(filter(lambda fname: isdir(fname[0]),
                              icollect(dir_paths, ignored_dir_paths)))
     if valid_dirs:
         collected_dirs, _ = zip(*valid_dirs)
@@ -168,8 +475,65 @@ def collect_dirs(dir_paths, ignored_dir_paths=None):
         return []
 
 
+_bear_collection_cache = None
+
+
+@contextmanager
+def bear_collection_cache():
+    """
+    Shares the bear directories, bear module files and bears found by
+    ``icollect_bears`` (and thus ``collect_bears``) and the registered bear
+    directories between all collections while the context is active, so that
+    sections using the same bear directories discover their bears only once.
+
+    Entering the context while it is already active reuses the active cache.
+    """
+    global _bear_collection_cache
+    if _bear_collection_cache is not None:
+        yield
+        return
+
+    _bear_collection_cache = {}
+    try:
+        yield
+    finally:
+        _bear_collection_cache = None
+
+
+def _memoized(key, function):
+    """
+    Returns ``function()``, cached in the active bear collection cache.
+    """
+    if _bear_collection_cache is None:
+        return function()
+    if key not in _bear_collection_cache:
+        _bear_collection_cache[key] = function()
+    return _bear_collection_cache[key]
+
+
+def _collect_file_bears(file_path, kinds, manifest=None):
+    """
+    Collects the bears of a module. Failures are logged and give no bears.
+
+    :param file_path: The path to the bear module.
+    :param kinds:     List of bear kinds to be collected.
+    :param manifest:  The ``BearManifest`` to take ``BearManifestEntry``
+                      objects from instead of importing bear classes.
+    :return:          A list of bear classes or manifest entries.
+    """
+    try:
+        if manifest is not None:
+            return [entry for entry in manifest.entries(file_path)
+                    if entry.kind() in kinds]
+        return list(_import_bears(file_path, kinds))
+    except BaseException as exception:
+        _log_collection_failure(file_path, exception)
+        return []
+
+
 @yield_once
-def icollect_bears(bear_dir_glob, bear_globs, kinds, log_printer=None):
+def icollect_bears(bear_dir_glob, bear_globs, kinds, log_printer=None,
+                   lazy=False):
     """
     Collect all bears from bear directories that have a matching kind.
 
@@ -177,46 +541,44 @@ def icollect_bears(bear_dir_glob, bear_globs, kinds, log_printer=None):
     :param bear_globs:    Globs of bears to collect
     :param kinds:         List of bear kinds to be collected
     :param log_printer:   Log_printer to handle logging
+    :param lazy:          Whether to yield ``BearManifestEntry`` objects from
+                          the ``BearManifest`` instead of bear classes, so
+                          that only changed bear modules are imported.
     :return:              Iterator that yields a tuple with bear class and
                           which bear_glob was used to find that bear class.
     """
-    for bear_dir, dir_glob in filter(lambda x: os.path.isdir(x[0]),
-                                     icollect(bear_dir_glob)):
-        # Since we get a real directory here and since we
-        # pass this later to iglob, we need to escape this.
-        bear_dir = glob_escape(bear_dir)
+    manifest = get_bear_manifest() if lazy else None
+    if isinstance(bear_dir_glob, str):
+        bear_dir_glob = [bear_dir_glob]
+
+    # Since we get real directories here and since we
+    # pass them later to iglob, we need to escape them.
+    bear_dirs = _memoized(
+        ('bear_dirs', tuple(bear_dir_glob)),
+        lambda: [glob_escape(bear_dir)
+                 for bear_dir, dir_glob in icollect(bear_dir_glob)
+                 if isdir(bear_dir)])
+    for bear_dir in bear_dirs:
         for bear_glob in bear_globs:
-            matching_files = iglob(os.path.join(bear_dir, bear_glob + '.py'))
-
-            matching_files = sorted(matching_files)
+            matching_files = _memoized(
+                ('bear_files', bear_dir, bear_glob),
+                lambda: sorted(iglob(os.path.join(bear_dir,
+                                                  bear_glob + '.py'))))
 
             for matching_file in matching_files:
-                try:
-                    for bear in _import_bears(matching_file, kinds):
-                        yield bear, bear_glob
-                except pkg_resources.VersionConflict as exception:
-                    log_exception(
-                        ('Unable to collect bears from {file} because there '
-                         'is a conflict with the version of a dependency '
-                         'you have installed. This may be resolved by '
-                         'creating a separate virtual environment for coala '
-                         'or running `pip3 install \"{pkg}\"`. Be aware that '
-                         'the latter solution might break other python '
-                         'packages that depend on the currently installed '
-                         'version.').format(file=matching_file,
-                                            pkg=exception.req),
-                        exception, log_level=LOG_LEVEL.WARNING)
-                except BaseException as exception:
-                    log_exception(
-                        'Unable to collect bears from {file}. Probably the '
-                        'file is malformed or the module code raises an '
-                        'exception.'.format(file=matching_file),
-                        exception,
-                        log_level=LOG_LEVEL.WARNING)
+                bears = _memoized(
+                    ('bears', matching_file, tuple(kinds), lazy),
+                    lambda: _collect_file_bears(matching_file, kinds,
+                                                manifest))
+                for bear in bears:
+                    yield bear, bear_glob
+
+    if manifest is not None:
+        manifest.write()
 
 
 def collect_bears(bear_dirs, bear_globs, kinds, log_printer=None,
-                  warn_if_unused_glob=True):
+                  warn_if_unused_glob=True, lazy=False):
     """
     Collect all bears from bear directories that have a matching kind
     matching the given globs.
@@ -228,13 +590,16 @@ def collect_bears(bear_dirs, bear_globs, kinds, log_printer=None,
     :param log_printer:         log_printer to handle logging.
     :param warn_if_unused_glob: True if warning message should be shown if a
                                 glob didn't give any bears.
+    :param lazy:                Whether to collect ``BearManifestEntry``
+                                objects instead of bear classes.
     :return:                    Tuple of list of matching bear classes based on
                                 kind. The lists are in the same order as kinds
                                 and not sorted based upon bear name.
     """
     bears_found = tuple([] for i in range(len(kinds)))
     bear_globs_with_bears = set()
-    for bear, glob in icollect_bears(bear_dirs, bear_globs, kinds):
+    for bear, glob in icollect_bears(bear_dirs, bear_globs, kinds,
+                                     lazy=lazy):
         index = kinds.index(_get_kind(bear))
         bears_found[index].append(bear)
         bear_globs_with_bears.add(glob)
@@ -251,7 +616,8 @@ def collect_bears(bear_dirs, bear_globs, kinds, log_printer=None,
                 suffix_globs[glob + 'Bear'] = glob
 
     for bear, glob in icollect_bears(bear_dirs,
-                                     set(suffix_globs.keys()), kinds):
+                                     set(suffix_globs.keys()), kinds,
+                                     lazy=lazy):
         index = kinds.index(_get_kind(bear))
         bears_found[index].append(bear)
         bear_globs_with_bears.add(suffix_globs[glob])
@@ -297,11 +663,18 @@ def collect_bears_by_aspects(aspects, kinds):
                     in the same order as kinds and not sorted based upon bear
                     name.
     """
-    all_bears = get_all_bears()
+    all_bears = get_all_bears(lazy=True)
     bears_found = tuple([] for i in range(len(kinds)))
     unfulfilled_aspects = []
     for aspect in aspects.get_leaf_aspects():
-        for bear in all_bears:
+        # Only the bears that may analyze the aspect according to the
+        # manifest are imported.
+        for entry in all_bears:
+            if not entry.may_analyze(aspect):
+                continue
+            bear = _load_bear(entry)
+            if bear is None:
+                continue
             if (aspect in bear.aspects['detect'] or
                     aspect in bear.aspects['fix']):
                 index = kinds.index(_get_kind(bear))
@@ -349,16 +722,20 @@ def filter_capabilities_by_languages(bears, languages):
     return language_bears_capabilities
 
 
-def get_all_bears():
+def get_all_bears(lazy=False):
     """
     Get an unsorted ``list`` of all available bears.
+
+    :param lazy: Whether to return ``BearManifestEntry`` objects instead of
+                 bear classes.
     """
     from coalib.settings.Section import Section
     local_bears, global_bears = collect_bears(
         Section('').bear_dirs(),
         ['**'],
         [BEAR_KIND.LOCAL, BEAR_KIND.GLOBAL],
-        warn_if_unused_glob=False)
+        warn_if_unused_glob=False,
+        lazy=lazy)
     return list(itertools.chain(local_bears, global_bears))
 
 
@@ -366,11 +743,7 @@ def get_all_bears_names():
     """
     Get an unsorted ``list`` of names of all available bears.
     """
-    return [bear.name for bear in get_all_bears()]
-
-
-def _argcomplete_bears_names(*args, **kwargs):
-    return get_all_bears_names()
+    return [bear.name for bear in get_all_bears(lazy=True)]
 
 
 def get_all_languages(include_unknown=False):
@@ -390,15 +763,19 @@ def get_all_languages(include_unknown=False):
     return Languages(languages)
 
 
+@bear_collection_cache()
 def collect_all_bears_from_sections(sections,
                                     log_printer=None,
-                                    bear_globs=('**',)):
+                                    bear_globs=('**',),
+                                    lazy=False):
     """
     Collect all kinds of bears from bear directories given in the sections.
 
     :param sections:    List of sections so bear_dirs are taken into account
     :param log_printer: Log_printer to handle logging
     :param bear_globs:  List of glob patterns.
+    :param lazy:        Whether to collect ``BearManifestEntry`` objects
+                        instead of bear classes.
     :return:            Tuple of dictionaries of unsorted local and
                         global bears. The dictionary key is section class and
                         dictionary value is a list of Bear classes
@@ -411,7 +788,8 @@ def collect_all_bears_from_sections(sections,
             bear_dirs,
             bear_globs,
             [BEAR_KIND.LOCAL, BEAR_KIND.GLOBAL],
-            warn_if_unused_glob=False)
+            warn_if_unused_glob=False,
+            lazy=lazy)
     return local_bears, global_bears
 
 
@@ -439,6 +817,12 @@ def collect_registered_bears_dirs(entrypoint):
     :param entrypoint: The entrypoint to find packages with.
     :return:           List of bear directories.
     """
+    return list(_memoized(('registered_bears_dirs', entrypoint),
+                          lambda: _collect_registered_bears_dirs(entrypoint)))
+
+
+def _collect_registered_bears_dirs(entrypoint):
+    import pkg_resources
     collected_dirs = []
     for ep in pkg_resources.iter_entry_points(entrypoint):
         registered_package = None
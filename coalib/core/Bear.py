@@ -10,8 +10,7 @@ from appdirs import user_data_dir
 from coala_utils.decorators import (enforce_signature, classproperty,
                                     get_public_members)
 
-import requests
-
+from coalib.misc.PrerequisiteCache import is_requirement_installed
 from coalib.results.Result import Result
 from coalib.settings.ConfigurationGathering import get_config_directory
 from coalib.settings.FunctionMetadata import FunctionMetadata
@@ -337,7 +336,8 @@ class Bear:
         """
         not_installed_requirements = [requirement
                                       for requirement in cls.REQUIREMENTS
-                                      if not requirement.is_installed()]
+                                      if not is_requirement_installed(
+                                          requirement)]
 
         if not_installed_requirements:
             return 'Following requirements are not installed: ' + ', '.join(
@@ -397,6 +397,7 @@ class Bear:
         logging.info('{}: Downloading {} into {!r}.'
                      .format(cls.name, url, filename))
 
+        import requests
         response = requests.get(url, stream=True, timeout=20)
         response.raise_for_status()
 
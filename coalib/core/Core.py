@@ -6,6 +6,7 @@ import logging
 from coalib.core.DependencyTracker import DependencyTracker
 from coalib.core.Graphs import traverse_graph
 from coalib.core.PersistentHash import persistent_hash
+from coalib.misc.Timings import finish_measurement, start_measurement
 
 
 def group(iterable, key=lambda x: x):
@@ -154,6 +155,28 @@ def initialize_dependencies(bears):
     return dependency_tracker, bears
 
 
+def execute_task_timed(bear, args, kwargs):
+    """
+    Executes a task of a bear and measures the resources it takes.
+
+    :param bear:
+        The bear to execute the task of.
+    :param args:
+        The arguments of the task.
+    :param kwargs:
+        The keyword-arguments of the task.
+    :return:
+        A tuple of the results of the task and its ``BearTiming``.
+    """
+    measurement = start_measurement()
+    results = bear.execute_task(args, kwargs)
+    # File based bears get the filename as first argument.
+    filename = args[0] if args and isinstance(args[0], str) else None
+    return results, finish_measurement(
+        measurement, bear.name, filename,
+        len(results) if hasattr(results, '__len__') else 0)
+
+
 class Session:
     """
     Maintains a session for a coala execution. For each session, there are set
@@ -165,7 +188,8 @@ class Session:
     first BearB will be executed, followed by BearA.
     """
 
-    def __init__(self, bears, result_callback, cache=None, executor=None):
+    def __init__(self, bears, result_callback, cache=None, executor=None,
+                 timings=None):
         """
         :param bears:
             The bear instances to run.
@@ -201,10 +225,15 @@ class Session:
             ``ProcessPoolExecutor`` is used using as many processes as cores
             available on the system. Note that a passed custom executor is
             closed after the core has finished.
+        :param timings:
+            A ``misc.Timings.Timings`` object the timings of all executed tasks
+            are added to under the name of the section of their bear. If
+            ``None``, tasks aren't measured.
         """
         self.bears = bears
         self.result_callback = result_callback
         self.cache = cache
+        self.timings = timings
 
         # Set up event loop and executor.
         self.event_loop = asyncio.SelectorEventLoop()
@@ -255,9 +284,8 @@ class Session:
                     bear_args, bear_kwargs = task
 
                     if self.cache is None:
-                        future = self.event_loop.run_in_executor(
-                            self.executor, bear.execute_task,
-                            bear_args, bear_kwargs)
+                        future = self._run_task_in_executor(
+                            bear, bear_args, bear_kwargs)
                     else:
                         # Execute the cache lookup in the default
                         # ThreadPoolExecutor, so cache updates reflect properly
@@ -325,6 +353,28 @@ class Session:
 
             self.event_loop.stop()
 
+    def _run_task_in_executor(self, bear, args, kwargs):
+        """
+        Schedules a task of a bear onto the executor.
+
+        :param bear:
+            The bear to execute the task of.
+        :param args:
+            The arguments of the task.
+        :param kwargs:
+            The keyword-arguments of the task.
+        :return:
+            The future of the task. It yields the results of the task or, if
+            timings are recorded, a tuple of the results and the
+            ``BearTiming`` of the task.
+        """
+        if self.timings is None:
+            return self.event_loop.run_in_executor(
+                self.executor, bear.execute_task, args, kwargs)
+        else:
+            return self.event_loop.run_in_executor(
+                self.executor, execute_task_timed, bear, args, kwargs)
+
     def _execute_task_with_cache(self, bear, task):
         if type(bear) not in self.cache:
             bear_cache = {}
@@ -336,22 +386,23 @@ class Session:
 
         if fingerprint in bear_cache:
             results = bear_cache[fingerprint]
+            # Cache hits don't run the bear, so there's nothing to measure.
+            return results if self.timings is None else (results, None)
         else:
             bear_args, bear_kwargs = task
 
             future = asyncio.run_coroutine_threadsafe(
                 asyncio.wait_for(
-                    self.event_loop.run_in_executor(
-                        self.executor, bear.execute_task,
-                        bear_args, bear_kwargs),
+                    self._run_task_in_executor(bear, bear_args, bear_kwargs),
                     None,
                     loop=self.event_loop),
                 loop=self.event_loop)
 
-            results = future.result()
-            bear_cache[fingerprint] = results
+            task_result = future.result()
+            bear_cache[fingerprint] = (task_result if self.timings is None else
+                                       task_result[0])
 
-        return results
+        return task_result
 
     def _finish_task(self, bear, future):
         """
@@ -368,6 +419,11 @@ class Session:
         try:
             results = future.result()
 
+            if self.timings is not None:
+                results, timing = results
+                if timing is not None:
+                    self.timings.add(bear.section.name, (timing,))
+
             for dependant in self.dependency_tracker.get_dependants(bear):
                 dependant.dependency_results[type(bear)] += results
         except Exception as ex:
@@ -409,7 +465,7 @@ class Session:
                         exc_info=ex)
 
 
-def run(bears, result_callback, cache=None, executor=None):
+def run(bears, result_callback, cache=None, executor=None, timings=None):
     """
     Initiates a session with the given parameters and runs it.
 
@@ -446,5 +502,9 @@ def run(bears, result_callback, cache=None, executor=None):
         Custom executor used to run the bears. If ``None``, a
         ``ProcessPoolExecutor`` is used using as many processes as cores
         available on the system.
+    :param timings:
+        A ``misc.Timings.Timings`` object the timings of all executed tasks are
+        added to under the name of the section of their bear. If ``None``,
+        tasks aren't measured.
     """
-    Session(bears, result_callback, cache, executor).run()
+    Session(bears, result_callback, cache, executor, timings).run()
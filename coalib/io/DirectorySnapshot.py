@@ -0,0 +1,141 @@
+import os
+from contextlib import contextmanager
+
+
+class DirectorySnapshot:
+    """
+    Caches the listings of directories, so that a directory tree globbed
+    several times (e.g. by multiple sections) is read from the filesystem
+    only once.
+
+    A cached listing is used as long as the modification time of its
+    directory did not change. The types of the entries are cached along with
+    the listing.
+
+    >>> snapshot = DirectorySnapshot()
+    >>> snapshot.scandir('tests/io/DirectoryTestDir') is snapshot.scandir(
+    ...     os.path.abspath('tests/io/DirectoryTestDir'))
+    True
+    >>> snapshot.isdir('tests/io/DirectoryTestDir/Dir1')
+    True
+    >>> snapshot.isfile('tests/io/DirectoryTestDir/Dir1')
+    False
+    """
+
+    def __init__(self):
+        self._listings = {}
+
+    def _listing(self, path):
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns
+        listing = self._listings.get(path)
+        if listing is None or listing[0] != mtime:
+            entries = tuple(os.scandir(path))
+            listing = (mtime,
+                       entries,
+                       {entry.name: entry for entry in entries})
+            self._listings[path] = listing
+        return listing
+
+    def scandir(self, path):
+        """
+        Lists a directory like ``os.scandir``.
+
+        :param path:   The directory to list.
+        :return:       A tuple of ``os.DirEntry`` objects.
+        :raises OSError: If the directory cannot be listed.
+        """
+        return self._listing(path)[1]
+
+    def _entry(self, path):
+        """
+        Looks the path up in the cached listing of its parent directory.
+        Parent directories that were not listed yet are not listed just for
+        this.
+        """
+        dirname, basename = os.path.split(os.path.abspath(path))
+        if dirname not in self._listings:
+            return None
+        try:
+            return self._listing(dirname)[2].get(basename)
+        except OSError:
+            return None
+
+    def isfile(self, path):
+        """
+        Checks whether the path is an existing file like ``os.path.isfile``.
+        """
+        entry = self._entry(path)
+        if entry is None:
+            return os.path.isfile(path)
+        try:
+            return entry.is_file()
+        except OSError:
+            return False
+
+    def isdir(self, path):
+        """
+        Checks whether the path is an existing directory like
+        ``os.path.isdir``.
+        """
+        entry = self._entry(path)
+        if entry is None:
+            return os.path.isdir(path)
+        try:
+            return entry.is_dir()
+        except OSError:
+            return False
+
+
+_active_snapshot = None
+
+
+@contextmanager
+def directory_snapshot(snapshot=None):
+    """
+    Makes all directory listings done via ``scandir``, ``isfile`` and
+    ``isdir`` of this module share the given snapshot while the context is
+    active.
+
+    :param snapshot: The ``DirectorySnapshot`` to use, a new one is created
+                     if not given.
+    :return:         The active ``DirectorySnapshot``.
+    """
+    global _active_snapshot
+    previous_snapshot = _active_snapshot
+    _active_snapshot = (snapshot if snapshot is not None
+                        else DirectorySnapshot())
+    try:
+        yield _active_snapshot
+    finally:
+        _active_snapshot = previous_snapshot
+
+
+def scandir(path):
+    """
+    Lists a directory, using the active snapshot if there is one.
+
+    :param path: The directory to list.
+    :return:     An iterable of ``os.DirEntry`` objects.
+    """
+    if _active_snapshot is None:
+        return list(os.scandir(path))
+    return _active_snapshot.scandir(path)
+
+
+def isfile(path):
+    """
+    ``os.path.isfile`` using the active snapshot if there is one.
+    """
+    if _active_snapshot is None:
+        return os.path.isfile(path)
+    return _active_snapshot.isfile(path)
+
+
+def isdir(path):
+    """
+    ``os.path.isdir`` using the active snapshot if there is one.
+    """
+    if _active_snapshot is None:
+        return os.path.isdir(path)
+    return _active_snapshot.isdir(path)
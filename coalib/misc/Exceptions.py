@@ -4,7 +4,11 @@ import traceback
 from coalib.misc import Constants
 from coalib.output.printers.LOG_LEVEL import LOG_LEVEL
 
-from pkg_resources import VersionConflict
+
+def _is_version_conflict(exception):
+    # pkg_resources takes long to import, so it's only imported on errors.
+    from pkg_resources import VersionConflict
+    return isinstance(exception, VersionConflict)
 
 
 def get_exitcode(exception, log_printer=None):
@@ -16,7 +20,7 @@ def get_exitcode(exception, log_printer=None):
         exitcode = 0
     elif isinstance(exception, SystemExit):
         exitcode = exception.code
-    elif isinstance(exception, VersionConflict):
+    elif _is_version_conflict(exception):
         log_message = Constants.VERSION_CONFLICT_MESSAGE % str(exception.req)
         log_exception(log_message, exception)
         exitcode = 13
@@ -0,0 +1,145 @@
+import os
+import shutil
+import sys
+import time
+
+from coalib import VERSION
+from coalib.misc.CachingUtilities import pickle_dump, pickle_load
+
+
+class PrerequisiteCache:
+    """
+    Caches the outcomes of prerequisite checks of bears, like checking
+    whether a package is installed or running a linter's version check
+    command, which usually means starting a process.
+
+    Outcomes are cached for the lifetime of the cache object. Successful
+    checks that are persisted are also stored in the user data directory, so
+    that later runs of coala don't need to check again until ``ttl`` seconds
+    passed. Only checks whose keys contain everything their outcome depends
+    on, e.g. the path and modification time of the executable that is checked
+    (see ``executable_state``), should be persisted.
+
+    >>> cache = PrerequisiteCache(persistent=False)
+    >>> cache.check(('example',), lambda: True)
+    True
+    >>> cache.check(('example',), lambda: False)
+    True
+    """
+
+    IDENTIFIER = 'prerequisites'
+    DEFAULT_TTL = 24 * 60 * 60
+
+    def __init__(self, ttl=DEFAULT_TTL, persistent=True):
+        """
+        :param ttl:        The number of seconds a successful check is
+                           reused in later runs.
+        :param persistent: Whether successful checks are stored on disk.
+        """
+        self.ttl = ttl
+        self.persistent = persistent
+        self._outcomes = {}
+        self._stored = None
+
+    def _load(self):
+        if self._stored is None:
+            self._stored = (pickle_load(None, self.IDENTIFIER, {})
+                            if self.persistent else {})
+        return self._stored
+
+    def check(self, key, check, persist=True):
+        """
+        Retrieves the outcome of a prerequisite check, running the check only
+        if its outcome isn't cached.
+
+        :param key:     A hashable and picklable key identifying the check.
+        :param check:   The function performing the check.
+        :param persist: Whether a successful outcome may be stored on disk
+                        and reused in later runs.
+        :return:        The outcome of the check.
+        """
+        key = (VERSION, sys.executable) + tuple(key)
+        if key in self._outcomes:
+            return self._outcomes[key]
+
+        persist = persist and self.persistent
+        stored = self._load().get(key) if persist else None
+        if stored is not None and time.time() - stored[0] < self.ttl:
+            outcome = stored[1]
+        else:
+            outcome = check()
+            if outcome is True and persist:
+                now = time.time()
+                self._stored = {
+                    stored_key: value
+                    for stored_key, value in self._stored.items()
+                    if now - value[0] < self.ttl}
+                self._stored[key] = (now, outcome)
+                pickle_dump(None, self.IDENTIFIER, self._stored)
+
+        self._outcomes[key] = outcome
+        return outcome
+
+    def flush(self):
+        """
+        Forgets all cached outcomes, including the ones stored on disk.
+        """
+        self._outcomes = {}
+        self._stored = {}
+        if self.persistent:
+            pickle_dump(None, self.IDENTIFIER, self._stored)
+
+
+def executable_state(executable):
+    """
+    Retrieves the path of an executable together with its modification time
+    and size, so that cached checks are invalidated once the executable is
+    changed.
+
+    :param executable: The name or path of the executable.
+    :return:           A tuple of the path, modification time and size or
+                       ``(executable,)`` if it can't be found.
+    """
+    path = shutil.which(executable)
+    if path is None:
+        return executable,
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return path,
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+_prerequisite_cache = None
+
+
+def get_prerequisite_cache():
+    """
+    :return: The ``PrerequisiteCache`` shared within this process.
+    """
+    global _prerequisite_cache
+    if _prerequisite_cache is None:
+        _prerequisite_cache = PrerequisiteCache()
+    return _prerequisite_cache
+
+
+def is_requirement_installed(requirement):
+    """
+    Checks whether a requirement of a bear is installed, using the
+    ``PrerequisiteCache`` shared within this process.
+
+    Only requirements on an executable that can be found are persisted, since
+    the path and modification time of the executable tell whether they
+    changed. Other requirements, e.g. on Python packages, are checked again in
+    every run of coala.
+
+    :param requirement: A ``PackageRequirement``.
+    :return:            True if the requirement is installed.
+    """
+    key = ('requirement', type(requirement).__module__,
+           type(requirement).__qualname__, str(requirement))
+    executable = getattr(requirement, 'executable', None)
+    state = executable_state(executable) if executable else ()
+    return get_prerequisite_cache().check(
+        key + state, lambda: bool(requirement.is_installed()),
+        persist=len(state) > 1)
@@ -0,0 +1,37 @@
+def slot_names(cls):
+    """
+    Retrieves the names of all slots of a class, including the ones of its
+    base classes.
+
+    >>> class Base:
+    ...     __slots__ = ('a',)
+    >>> class Derived(Base):
+    ...     __slots__ = ('b',)
+    >>> list(slot_names(Derived))
+    ['b', 'a']
+
+    :param cls: The class.
+    :return:    An iterator over the slot names.
+    """
+    for klass in cls.__mro__:
+        yield from getattr(klass, '__slots__', ())
+
+
+class PickleSlots:
+    """
+    Makes objects of classes that only use ``__slots__`` picklable with all
+    pickle protocols. Protocols 0 and 1 can't pickle objects without a
+    ``__dict__`` unless they provide ``__getstate__``. The state holds the
+    values of all slots that are set.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self):
+        return {name: getattr(self, name)
+                for name in slot_names(type(self))
+                if hasattr(self, name)}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
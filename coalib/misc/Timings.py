@@ -0,0 +1,213 @@
+import json
+import os
+import sys
+import time
+from collections import OrderedDict, namedtuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # Not available on Windows.
+    resource = None
+
+
+# The resource usage of one bear run, i.e. of a local bear on one file or of
+# a global bear. ``file`` is ``None`` for runs not bound to a file, ``start``
+# is a UNIX timestamp, ``wall_time`` and ``cpu_time`` are given in seconds and
+# ``peak_rss`` is the peak resident set size of the running process in bytes
+# (or ``None`` if unavailable).
+BearTiming = namedtuple('BearTiming', ('bear', 'file', 'start', 'wall_time',
+                                       'cpu_time', 'results', 'peak_rss',
+                                       'pid'))
+
+
+def get_peak_rss():
+    """
+    :return: The peak resident set size of the current process in bytes or
+             ``None`` if it can't be determined on this platform.
+    """
+    if resource is None:  # pragma: no cover
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+
+
+def start_measurement():
+    """
+    Starts measuring the resources a bear run takes.
+
+    :return: The state to pass to ``finish_measurement``.
+    """
+    return time.time(), time.perf_counter(), time.process_time()
+
+
+def finish_measurement(state, bear, file, results):
+    """
+    Finishes measuring the resources a bear run took.
+
+    >>> state = start_measurement()
+    >>> timing = finish_measurement(state, 'SomeBear', 'file.py', 2)
+    >>> timing.bear, timing.file, timing.results
+    ('SomeBear', 'file.py', 2)
+    >>> timing.wall_time >= 0 and timing.cpu_time >= 0
+    True
+
+    :param state:   The state returned by ``start_measurement``.
+    :param bear:    The name of the bear that was run.
+    :param file:    The file the bear was run on or ``None``.
+    :param results: The number of results the bear yielded.
+    :return:        A ``BearTiming``.
+    """
+    start, wall_time, cpu_time = state
+    return BearTiming(bear=bear,
+                      file=file,
+                      start=start,
+                      wall_time=time.perf_counter() - wall_time,
+                      cpu_time=time.process_time() - cpu_time,
+                      results=results,
+                      peak_rss=get_peak_rss(),
+                      pid=os.getpid())
+
+
+def _max(values):
+    values = [value for value in values if value is not None]
+    return max(values) if values else None
+
+
+class Timings:
+    """
+    Collects the ``BearTiming`` records of the bear runs of all sections of a
+    coala run and exports them.
+
+    >>> timings = Timings()
+    >>> timings.add('python', [
+    ...     BearTiming('SomeBear', 'a.py', 0, 2.0, 1.5, 3, 1024, 1),
+    ...     BearTiming('SomeBear', 'b.py', 2, 1.0, 0.5, 0, 2048, 1),
+    ...     BearTiming('OtherBear', 'a.py', 0, 0.5, 0.5, 1, None, 2)])
+    >>> summary = timings.summarize('python', 'bear')
+    >>> list(summary)
+    ['SomeBear', 'OtherBear']
+    >>> summary['SomeBear']['wall_time'], summary['SomeBear']['peak_rss']
+    (3.0, 2048)
+    >>> list(timings.summarize('python', 'file'))
+    ['a.py', 'b.py']
+    """
+
+    def __init__(self):
+        self.sections = OrderedDict()
+
+    def add(self, section_name, timings):
+        """
+        Adds the timings of bear runs.
+
+        :param section_name: The name of the section the bears ran in.
+        :param timings:      An iterable of ``BearTiming`` objects.
+        """
+        self.sections.setdefault(section_name, []).extend(timings)
+
+    def summarize(self, section_name, field):
+        """
+        Aggregates the timings of a section per bear or per file.
+
+        :param section_name: The name of the section.
+        :param field:        ``'bear'`` or ``'file'``.
+        :return:             An ``OrderedDict`` mapping the bears or files to
+                             dictionaries holding the number of ``runs``, the
+                             total ``wall_time``, ``cpu_time`` and
+                             ``results`` and the maximal ``peak_rss``, sorted
+                             by wall time, longest first.
+        """
+        groups = OrderedDict()
+        for timing in self.sections.get(section_name, ()):
+            key = getattr(timing, field)
+            # Runs of global bears aren't bound to a file.
+            if key is not None:
+                groups.setdefault(key, []).append(timing)
+
+        summaries = (
+            (key, OrderedDict((
+                ('runs', len(timings)),
+                ('wall_time', sum(timing.wall_time for timing in timings)),
+                ('cpu_time', sum(timing.cpu_time for timing in timings)),
+                ('results', sum(timing.results for timing in timings)),
+                ('peak_rss', _max(timing.peak_rss for timing in timings)))))
+            for key, timings in groups.items())
+        return OrderedDict(sorted(summaries,
+                                  key=lambda item: -item[1]['wall_time']))
+
+    def __json__(self):
+        """
+        :return: A dictionary mapping the section names to dictionaries with
+                 the timings summarized per bear and per file and all
+                 individual runs.
+        """
+        return OrderedDict(
+            (section_name,
+             OrderedDict((('bears', self.summarize(section_name, 'bear')),
+                          ('files', self.summarize(section_name, 'file')),
+                          ('runs', [timing._asdict()
+                                    for timing in timings]))))
+            for section_name, timings in self.sections.items())
+
+    def to_chrome_trace(self):
+        """
+        Converts the timings into the Chrome trace event format, which can be
+        viewed with ``chrome://tracing`` or https://ui.perfetto.dev.
+
+        :return: The trace as JSON serializable dictionary.
+        """
+        events = []
+        for section_name, timings in self.sections.items():
+            for timing in timings:
+                events.append({
+                    'name': timing.bear,
+                    'cat': section_name,
+                    'ph': 'X',
+                    'ts': timing.start * 1e6,
+                    'dur': timing.wall_time * 1e6,
+                    'pid': timing.pid,
+                    'tid': timing.pid,
+                    'args': {'file': timing.file,
+                             'cpu_time': timing.cpu_time,
+                             'results': timing.results,
+                             'peak_rss': timing.peak_rss}})
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, filename):
+        """
+        Writes the timings as Chrome trace, see ``to_chrome_trace``.
+
+        :param filename: The file to write the trace to.
+        """
+        with open(filename, 'w') as file:
+            json.dump(self.to_chrome_trace(), file)
+
+    def format_summary(self, limit=10):
+        """
+        Formats the bears and files that took the longest in each section as
+        table for the console.
+
+        :param limit: The maximal number of bears and files to list per
+                      section.
+        :return:      The formatted summary.
+        """
+        lines = []
+        for section_name in self.sections:
+            lines.append('Timings of section {}:'.format(section_name))
+            for field, header in (('bear', 'Bear'), ('file', 'File')):
+                summary = self.summarize(section_name, field)
+                lines.append('  {:<50} {:>6} {:>9} {:>9} {:>8} {:>9}'.format(
+                    header, 'Runs', 'Wall (s)', 'CPU (s)', 'Results',
+                    'RSS (MB)'))
+                for key, values in list(summary.items())[:limit]:
+                    peak_rss = ('-' if values['peak_rss'] is None else
+                                '{:.1f}'.format(values['peak_rss'] / 2**20))
+                    lines.append(
+                        '  {:<50} {:>6} {:>9.3f} {:>9.3f} {:>8} {:>9}'.format(
+                            str(key)[-50:], values['runs'],
+                            values['wall_time'], values['cpu_time'],
+                            values['results'], peak_rss))
+        return '\n'.join(lines)
@@ -33,6 +33,7 @@ from coalib.results.result_actions.ShowPatchAction import ShowPatchAction
 from coalib.results.RESULT_SEVERITY import (
     RESULT_SEVERITY, RESULT_SEVERITY_COLORS)
 from coalib.settings.Setting import Setting
+from coala_utils.decorators import get_public_members
 from coala_utils.string_processing.Core import join_names
 
 from pygments import highlight
@@ -371,7 +372,8 @@ def print_results_formatted(log_printer,
 
     for result in result_list:
         severity_str = RESULT_SEVERITY.__str__(result.severity)
-        format_args = vars(result)
+        # Includes the message.
+        format_args = get_public_members(result)
         try:
             if len(result.affected_code) == 0:
                 format_args['affected_code'] = None
@@ -381,7 +383,6 @@ def print_results_formatted(log_printer,
                                         column=None,
                                         end_column=None,
                                         severity_str=severity_str,
-                                        message=result.message,
                                         **format_args))
                 continue
 
@@ -394,7 +395,6 @@ def print_results_formatted(log_printer,
                                         column=range.start.column,
                                         end_column=range.end.column,
                                         severity_str=severity_str,
-                                        message=result.message,
                                         **format_args))
         except KeyError as exception:
             log_exception(
@@ -27,7 +27,7 @@ def create_json_encoder(**kwargs):
                 return obj.isoformat()
             elif hasattr(obj, '__getitem__') and hasattr(obj, 'keys'):
                 return dict(obj)
-            elif hasattr(obj, '__dict__'):
+            elif hasattr(obj, '__dict__') or hasattr(obj, '__slots__'):
                 return {member: getattr(obj, member)
                         for member in get_public_members(obj)}
             elif isinstance(obj, re._pattern_type):
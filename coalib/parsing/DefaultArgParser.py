@@ -43,6 +43,15 @@ class PathArg(str):
         return str.__new__(cls, path.replace(os.path.sep, '/'))
 
 
+def _argcomplete_bears_names(*args, **kwargs):
+    # Collecting bears is only imported when completing bear names.
+    try:
+        from coalib.collecting.Collectors import get_all_bears_names
+    except ImportError:
+        return []
+    return get_all_bears_names()
+
+
 def default_arg_parser(formatter_class=None):
     """
     This function creates an ArgParser to parse command line arguments.
@@ -150,7 +159,7 @@ To run coala without user interaction, run the `coala --non-interactive`,
         help='run on all files even if unchanged')
     config_group.add_argument(
         '--flush-cache', const=True, action='store_const',
-        help='rebuild the file cache')
+        help='rebuild the file cache and check the bear prerequisites again')
     config_group.add_argument(
         '--no-autoapply-warn', const=True, action='store_const',
         help='turn off warning about patches not being auto applicable')
@@ -263,6 +272,19 @@ To run coala without user interaction, run the `coala --non-interactive`,
         ' data files will have a name format'
         ' ``{section.name}_{bear.name}.prof``.')
 
+    devtool_group = arg_parser.add_argument_group('Developer tools')
+
+    devtool_group.add_argument(
+        '--timings', const=True, action='store_const',
+        help='record wall time, CPU time, result count and peak memory usage '
+             'of every bear on every file and print the slowest bears and '
+             'files of each section (added to the output with --json)')
+
+    devtool_group.add_argument(
+        '--trace', type=PathArg, metavar='FILE',
+        help='write the timings of all bear runs to the given file in the '
+             'Chrome trace event format, viewable with chrome://tracing')
+
     misc_group = arg_parser.add_argument_group('Miscellaneous')
 
     misc_group.add_argument(
@@ -304,12 +326,6 @@ To run coala without user interaction, run the `coala --non-interactive`,
             argcomplete = False
 
         if argcomplete:
-            try:
-                from coalib.collecting.Collectors import (
-                    _argcomplete_bears_names)
-            except ImportError:
-                pass
-            else:
-                bears.completer = _argcomplete_bears_names
+            bears.completer = _argcomplete_bears_names
 
     return arg_parser
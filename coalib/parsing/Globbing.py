@@ -1,9 +1,11 @@
 import os
 import platform
 import re
+from collections import OrderedDict
 from functools import lru_cache
 
 from coala_utils.decorators import yield_once
+from coalib.io.DirectorySnapshot import scandir
 from coalib.misc.Constants import GLOBBING_SPECIAL_CHARS
 
 
@@ -151,13 +153,24 @@ def _iter_alternatives(pattern):
                 yield glob_pattern
 
 
-def translate(pattern):
+def _translate(pattern, single_component=False):
     """
-    Translates a pattern into a regular expression.
+    Translates a pattern into the body of a regular expression.
 
-    :param pattern: Glob pattern with wildcards
-    :return:        Regular expression with the same meaning
+    :param pattern:          Glob pattern with wildcards
+    :param single_component: Whether the pattern describes a single path
+                             component. If so, no wildcard or set matches a
+                             filesystem separator.
+    :return:                 Regular expression with the same meaning
     """
+    # On Windows, '*' matches everything but the filesystem separators '/'
+    # and '\'. On all other (~Unix-) platforms, '*' matches everything but
+    # the filesystem separator, most likely '/'.
+    if platform.system() == 'Windows':  # pragma posix: no cover
+        separators = '/\\\\'
+    else:  # pragma nt: no cover
+        separators = re.escape(os.sep)
+
     index, length = 0, len(pattern)
     regex = ''
     while index < length:
@@ -167,16 +180,10 @@ def translate(pattern):
             # '**' matches everything
             if index < length and pattern[index] == '*':
                 regex += '.*'
-            # On Windows, '*' matches everything but the filesystem
-            # separators '/' and '\'.
-            elif platform.system() == 'Windows':  # pragma posix: no cover
-                regex += '[^/\\\\]*'
-            # On all other (~Unix-) platforms, '*' matches everything but the
-            # filesystem separator, most likely '/'.
-            else:  # pragma nt: no cover
-                regex += '[^' + re.escape(os.sep) + ']*'
+            else:
+                regex += '[^' + separators + ']*'
         elif char == '?':
-            regex += '.'
+            regex += '[^' + separators + ']' if single_component else '.'
         elif char == '[':
             closing_index = _end_of_set_index(pattern, index)
             if closing_index >= length:
@@ -186,12 +193,24 @@ def translate(pattern):
                 index = closing_index+1
                 if sequence[0] == '!':
                     sequence = '^' + sequence[1:]
+                    if single_component:
+                        sequence += separators
                 elif sequence[0] == '^':
                     sequence = '\\' + sequence
                 regex += '[' + sequence + ']'
         else:
             regex = regex + re.escape(char)
-    return '(?ms)' + regex + '\\Z'
+    return regex
+
+
+def translate(pattern):
+    """
+    Translates a pattern into a regular expression.
+
+    :param pattern: Glob pattern with wildcards
+    :return:        Regular expression with the same meaning
+    """
+    return '(?ms)' + _translate(pattern) + '\\Z'
 
 
 def fnmatch(name, globs):
@@ -221,18 +240,70 @@ def fnmatch(name, globs):
     if len(globs) == 0:
         return False
 
-    name = os.path.normcase(name)
-
-    return any(compiled_pattern.match(name)
-               for glob in globs
-               for compiled_pattern in _compile_pattern(glob))
+    return compile_glob_set(globs).match(name) is not None
+
+
+class GlobSet:
+    """
+    A list of globs compiled into a single regular expression, so a name
+    can be matched against all of them at once.
+
+    >>> glob_set = GlobSet(['*.py', '(a|b).c', '**.py'])
+    >>> glob_set.match('setup.py')
+    '*.py'
+    >>> glob_set.match(os.path.join('coalib', 'coala.py'))
+    '**.py'
+    >>> glob_set.match('b.c')
+    '(a|b).c'
+    >>> glob_set.match('c.c') is None
+    True
+    """
+
+    # Older Python versions limit the number of groups in a regex to 100.
+    _MAX_GLOBS_PER_REGEX = 90
+
+    def __init__(self, globs):
+        """
+        :param globs: Iterable of glob strings with wildcards. The syntax is
+                      the same as for ``fnmatch``.
+        """
+        self.globs = tuple(globs)
+        self._regexes = []
+        for start in range(0, len(self.globs), self._MAX_GLOBS_PER_REGEX):
+            globs_chunk = self.globs[start:start + self._MAX_GLOBS_PER_REGEX]
+            self._regexes.append((start, re.compile('(?ms)' + '|'.join(
+                '(' + '|'.join(
+                    _translate(os.path.normcase(os.path.expanduser(pat))) +
+                    '\\Z'
+                    for pat in _iter_alternatives(glob)) + ')'
+                for glob in globs_chunk))))
+
+    def match(self, name):
+        """
+        Matches the name against all globs.
+
+        :param name: File or directory name.
+        :return:     The first of the globs matching the name, or ``None`` if
+                     none matches.
+        """
+        name = os.path.normcase(name)
+        for start, regex in self._regexes:
+            match = regex.match(name)
+            if match:
+                return self.globs[start + match.lastindex - 1]
+        return None
 
 
 @lru_cache()
-def _compile_pattern(pattern):
-    return tuple(re.compile(translate(os.path.normcase(
-                     os.path.expanduser(pat))))
-                 for pat in _iter_alternatives(pattern))
+def compile_glob_set(globs):
+    """
+    Returns a ``GlobSet`` for the given globs. Glob sets are cached, so
+    matching many names against the same globs compiles them only once.
+
+    :param globs: Tuple of glob strings with wildcards.
+    :return:      The ``GlobSet`` for the globs.
+    """
+    return GlobSet(globs)
 
 
 def _absolute_flat_glob(pattern):
@@ -254,42 +325,88 @@ def _absolute_flat_glob(pattern):
     return
 
 
-def _iter_relative_dirs(dirname):
+def _iter_relative_dirs(dirname, prune=None):
     """
     Recursively iterates subdirectories of all levels from dirname
 
     :param dirname: Directory name
+    :param prune:   Function that takes the path of a directory and returns
+                    whether its contents are to be skipped. The directory
+                    itself is still yielded.
     :return:        Iterator that yields files and directory from the given dir
                     and all it's (recursive) subdirectories
     """
     if not dirname:
         dirname = os.curdir
     try:
-        files_or_dirs = os.listdir(dirname)
+        entries = scandir(dirname)
     except os.error:
         return
-    for file_or_dir in files_or_dirs:
-        yield file_or_dir
-        path = os.path.join(dirname, file_or_dir)
-        for sub_file_or_dir in _iter_relative_dirs(path):
-            yield os.path.join(file_or_dir, sub_file_or_dir)
+    for entry in entries:
+        yield entry.name
+        try:
+            is_dir = entry.is_dir()
+        except os.error:
+            continue
+        if not is_dir:
+            continue
+        path = os.path.join(dirname, entry.name)
+        if prune is not None and prune(path):
+            continue
+        for sub_file_or_dir in _iter_relative_dirs(path, prune):
+            yield os.path.join(entry.name, sub_file_or_dir)
+
+
+def _prune_function(ignored_globs):
+    """
+    Creates a function that tells whether a directory can be skipped while
+    walking the filesystem because everything below it is ignored.
+
+    Only globs ending with ``**`` can ignore a whole directory tree: if the
+    directory path followed by a separator matches such a glob, so does every
+    path below it.
+
+    >>> prune = _prune_function(['node_modules/**', '*.pyc'])
+    >>> prune('node_modules')
+    True
+    >>> prune('src')
+    False
+    >>> _prune_function(['*.pyc']) is None
+    True
+
+    :param ignored_globs: List of globs of ignored files and directories.
+    :return:              A function taking a directory path and returning
+                          whether it is to be pruned, or ``None`` if no
+                          directory can be pruned.
+    """
+    recursive_globs = tuple(glob for glob in ignored_globs or ()
+                            if glob.endswith('**'))
+    if not recursive_globs:
+        return None
+
+    def prune(path):
+        return fnmatch(path.rstrip(os.sep) + os.sep, recursive_globs)
+
+    return prune
 
 
-def relative_wildcard_glob(dirname, pattern):
+def relative_wildcard_glob(dirname, pattern, prune=None):
     """
     Non-recursive glob for one directory. Accepts wildcards.
 
     :param dirname: Directory name
     :param pattern: Glob pattern with wildcards
+    :param prune:   Function telling which directories are not to be walked
+                    into if the pattern is recursive.
     :return:        List of files in the dir of dirname that match the pattern
     """
     if not dirname:
         dirname = os.curdir
     try:
         if '**' in pattern:
-            names = list(_iter_relative_dirs(dirname))
+            names = _iter_relative_dirs(dirname, prune)
         else:
-            names = os.listdir(dirname)
+            names = [entry.name for entry in scandir(dirname)]
     except OSError:
         return []
     result = []
@@ -301,12 +418,14 @@ def relative_wildcard_glob(dirname, pattern):
     return result
 
 
-def relative_flat_glob(dirname, basename):
+def relative_flat_glob(dirname, basename, prune=None):
     """
     Non-recursive glob for one directory. Does not accept wildcards.
 
     :param dirname:  Directory name
     :param basename: Basename of a file in dir of dirname
+    :param prune:    Unused, allows to call all relative glob functions
+                     alike.
     :return:         List containing Basename if the file exists
     """
     if os.path.exists(os.path.join(dirname, basename)):
@@ -314,20 +433,22 @@ def relative_flat_glob(dirname, basename):
     return []
 
 
-def relative_recursive_glob(dirname, pattern):
+def relative_recursive_glob(dirname, pattern, prune=None):
     """
     Recursive Glob for one directory and all its (nested) subdirectories.
     Accepts only '**' as pattern.
 
     :param dirname: Directory name
     :param pattern: The recursive wildcard '**'
+    :param prune:   Function telling which directories are not to be walked
+                    into.
     :return:        Iterator that yields all the (nested) subdirectories of the
                     given dir
     """
     assert pattern == '**'
     if dirname:
         yield pattern[:0]
-    for relative_dir in _iter_relative_dirs(dirname):
+    for relative_dir in _iter_relative_dirs(dirname, prune):
         yield relative_dir
 
 
@@ -345,7 +466,7 @@ def has_wildcard(pattern):
     return match is not None
 
 
-def _iglob(pattern):
+def _iglob(pattern, ignored_globs=None, prune=None):
     dirname, basename = os.path.split(pattern)
     if not has_wildcard(pattern):
         for file in _absolute_flat_glob(pattern):
@@ -360,40 +481,47 @@ def _iglob(pattern):
         relative_glob_function = relative_flat_glob
 
     if not dirname:
-        for file in relative_glob_function(dirname, basename):
+        for file in relative_glob_function(dirname, basename, prune):
             yield file
         return
 
     # Prevent an infinite recursion if a drive or UNC path contains
     # wildcard characters (i.e. r'\\?\C:').
     if dirname != pattern and has_wildcard(dirname):
-        dirs = iglob(dirname)
+        dirs = iglob(dirname, ignored_globs)
     else:
         dirs = [dirname]
 
     for dirname in dirs:
-        for name in relative_glob_function(dirname, basename):
+        for name in relative_glob_function(dirname, basename, prune):
             yield os.path.join(dirname, name)
 
 
 @yield_once
-def iglob(pattern):
+def iglob(pattern, ignored_globs=None):
     """
     Iterates all filesystem paths that get matched by the glob pattern.
     Syntax is equal to that of fnmatch.
 
-    :param pattern: Glob pattern with wildcards
-    :return:        Iterator that yields all file names that match pattern
+    :param pattern:       Glob pattern with wildcards
+    :param ignored_globs: List of globs of ignored paths. Directories whose
+                          whole contents are ignored by them are not walked
+                          into. Note that paths matched by the ignored globs
+                          may still be yielded, filtering them is up to the
+                          caller.
+    :return:              Iterator that yields all file names that match
+                          pattern
     """
+    prune = _prune_function(ignored_globs)
     for pat in _iter_alternatives(pattern):
         pat = os.path.expanduser(pat)
         pat = os.path.normcase(pat)
 
         if pat.endswith(os.sep):
-            for name in _iglob(pat):
+            for name in _iglob(pat, ignored_globs, prune):
                 yield name
         else:
-            for name in _iglob(pat):
+            for name in _iglob(pat, ignored_globs, prune):
                 yield name.rstrip(os.sep)
 
 
@@ -406,3 +534,241 @@ def glob(pattern):
     :return:        List of all file names that match pattern
     """
     return list(iglob(pattern))
+
+
+def _translate_relative_glob(components):
+    """
+    Translates the path components of a glob relative to a directory into
+    a regular expression matching the same paths as ``iglob`` does.
+
+    In contrast to ``translate``, a ``**`` component matches zero or more
+    directories, so ``a/**/b`` matches ``a/b`` like ``iglob`` does. Outside
+    of components containing ``**``, wildcards never match a separator.
+
+    :param components: List of path components of the glob.
+    :return:           Regular expression matching relative paths.
+    """
+    separator = re.escape(os.sep)
+    regex = ''
+    needs_separator = False
+    for index, component in enumerate(components):
+        if component == '**':
+            if index == len(components) - 1:
+                regex += ('(?:' + separator + '.*)?' if needs_separator
+                          else '.*')
+            else:
+                regex += ((separator if needs_separator else '') +
+                          '(?:.*' + separator + ')?')
+                needs_separator = False
+            continue
+
+        regex += ((separator if needs_separator else '') +
+                  _translate(component, single_component='**' not in component))
+        needs_separator = True
+    return '(?ms)' + regex + '\\Z'
+
+
+def _split_glob_root(pattern):
+    """
+    Splits a glob without alternatives into the longest leading directory
+    without wildcards and the path components of the remaining glob.
+
+    >>> _split_glob_root(os.path.join('a', 'b', '*', '*.py'))[1]
+    ['*', '*.py']
+
+    :param pattern: Glob pattern with wildcards.
+    :return:        Tuple of the root directory and the list of remaining
+                    components.
+    """
+    components = pattern.split(os.sep)
+    index = 0
+    while not has_wildcard(components[index]):
+        index += 1
+    root = os.sep.join(components[:index])
+    if not root and index:
+        root = os.sep
+    return root, components[index:]
+
+
+def _contains_path(root, path):
+    """
+    Checks whether walking root reaches the given (wildcard free) path.
+
+    :param root: Directory that is walked.
+    :param path: Path to check.
+    :return:     The path relative to root or None if it is not reached.
+    """
+    if path == root:
+        return ''
+    prefix = root if not root or root.endswith(os.sep) else root + os.sep
+    if not root and os.path.isabs(path) or not path.startswith(prefix):
+        return None
+    relative_path = path[len(prefix):]
+    if any(component in ('', os.curdir, os.pardir)
+           for component in relative_path.split(os.sep)):
+        return None
+    return relative_path
+
+
+class _WalkedGlob:
+    """
+    A glob alternative that is matched while walking the filesystem.
+    """
+
+    def __init__(self, pattern, root, components):
+        self.pattern = pattern
+        self.root = root
+        self.match = re.compile(_translate_relative_glob(components)).match
+        # The root itself can only be matched by recursive wildcards, an
+        # empty name never matches any other wildcard.
+        self.matches_root = all(component == '**'
+                                for component in components)
+        self.max_depth = (None if any('**' in component
+                                      for component in components)
+                          else len(components))
+
+    def may_match_below(self, depth):
+        """
+        Returns whether paths deeper than the given depth below the root of
+        this glob may match.
+        """
+        return self.max_depth is None or self.max_depth > depth
+
+
+def _walk_globs(root, walked_globs, prune=None):
+    """
+    Walks the given directory once and matches every path against all
+    given globs.
+
+    :param root:         Directory to walk.
+    :param walked_globs: List of tuples of ``_WalkedGlob`` objects and their
+                         root relative to the walked directory.
+    :param prune:        Function telling which directories are not to be
+                         walked into.
+    :return:             Iterator that yields tuples of matching paths and
+                         the original glob pattern matching them.
+    """
+    # All paths passed around here are built while walking and therefore
+    # normalized, so a plain prefix check is enough.
+    def relative_to(directory, relative_path):
+        if not directory:
+            return relative_path
+        if relative_path == directory:
+            return ''
+        if relative_path.startswith(directory + os.sep):
+            return relative_path[len(directory) + len(os.sep):]
+        return None
+
+    def matches(relative_path):
+        for walked_glob, glob_root in walked_globs:
+            glob_relative_path = relative_to(glob_root, relative_path)
+            if glob_relative_path is None:
+                continue
+            if (walked_glob.matches_root if not glob_relative_path
+                    else walked_glob.match(
+                        os.path.normcase(glob_relative_path))):
+                yield walked_glob.pattern
+
+    def walk_into(relative_path):
+        for walked_glob, glob_root in walked_globs:
+            if relative_to(relative_path, glob_root):
+                return True
+            glob_relative_path = relative_to(glob_root, relative_path)
+            if (glob_relative_path is not None and
+                    walked_glob.may_match_below(
+                        glob_relative_path.count(os.sep) + 1
+                        if glob_relative_path else 0)):
+                return True
+        return False
+
+    def walk(relative_path):
+        path = os.path.join(root, relative_path) if relative_path else root
+        try:
+            entries = scandir(path if path else os.curdir)
+        except os.error:
+            return
+        for entry in entries:
+            entry_relative_path = os.path.join(relative_path, entry.name)
+            entry_path = os.path.join(root, entry_relative_path)
+            for pattern in matches(entry_relative_path):
+                yield entry_path, pattern
+
+            try:
+                is_dir = entry.is_dir()
+            except os.error:
+                continue
+            if (is_dir and walk_into(entry_relative_path) and
+                    (prune is None or not prune(entry_path))):
+                yield from walk(entry_relative_path)
+
+    if root:
+        if not os.path.exists(root):
+            return
+        for pattern in matches(''):
+            yield root, pattern
+    if walk_into(''):
+        yield from walk('')
+
+
+def imulti_glob(patterns, ignored_globs=None):
+    """
+    Iterates all filesystem paths that get matched by any of the given glob
+    patterns. Syntax is equal to that of fnmatch.
+
+    In contrast to calling ``iglob`` for each pattern, every directory is
+    walked at most once: paths are matched against all patterns together
+    while walking, and matches are yielded as they are found.
+
+    :param patterns:      List of glob patterns with wildcards.
+    :param ignored_globs: List of globs of ignored paths. Directories whose
+                          whole contents are ignored by them are not walked
+                          into.
+    :return:              Iterator that yields tuples of each matching path
+                          and the pattern that matched it. A path matched by
+                          several patterns is yielded once for each of them.
+    """
+    prune = _prune_function(ignored_globs)
+    walked_globs = []
+    flat_globs = []
+    # Patterns with alternatives may yield the same path more than once.
+    ambiguous_patterns = set()
+
+    for pattern in OrderedDict.fromkeys(patterns):
+        alternatives = list(_iter_alternatives(pattern))
+        if len(alternatives) > 1:
+            ambiguous_patterns.add(pattern)
+        for pat in alternatives:
+            pat = os.path.normcase(os.path.expanduser(pat))
+            if pat.endswith(os.sep) or not has_wildcard(pat):
+                flat_globs.append((pat, pattern))
+            else:
+                walked_globs.append(_WalkedGlob(pattern,
+                                                *_split_glob_root(pat)))
+
+    roots = OrderedDict()
+    for root in sorted({walked_glob.root for walked_glob in walked_globs},
+                       key=len):
+        if not any(_contains_path(walked_root, root) is not None
+                   for walked_root in roots):
+            roots[root] = []
+    for walked_glob in walked_globs:
+        for root, root_globs in roots.items():
+            glob_root = _contains_path(root, walked_glob.root)
+            if glob_root is not None:
+                root_globs.append((walked_glob, glob_root))
+                break
+
+    def iter_matches():
+        for root, root_globs in roots.items():
+            yield from _walk_globs(root, root_globs, prune)
+        for pat, pattern in flat_globs:
+            for name in iglob(pat, ignored_globs):
+                yield name, pattern
+
+    yielded = set()
+    for name, pattern in iter_matches():
+        if pattern in ambiguous_patterns:
+            if (name, pattern) in yielded:
+                continue
+            yielded.add((name, pattern))
+        yield name, pattern
@@ -5,6 +5,7 @@ from coalib.bears.BEAR_KIND import BEAR_KIND
 from coalib.bears.GlobalBear import GlobalBear
 from coalib.bears.LocalBear import LocalBear
 from coalib.misc import Constants
+from coalib.misc.Timings import finish_measurement, start_measurement
 from coalib.processes.communication.LogMessage import LOG_LEVEL, LogMessage
 from coalib.processes.CONTROL_ELEMENT import CONTROL_ELEMENT
 from coalib.results.Result import Result
@@ -77,7 +78,7 @@ def validate_results(message_queue, timeout, result_list, name, args, kwargs):
 
 
 def run_bear(message_queue, timeout, bear_instance, *args, debug=False,
-             **kwargs):
+             timings=None, **kwargs):
     """
     This method is responsible for executing the instance of a bear. It also
     reports or logs errors if any occur during the execution of that bear
@@ -91,6 +92,8 @@ def run_bear(message_queue, timeout, bear_instance, *args, debug=False,
                           timeout it returns queue Full exception.
     :param bear_instance: The instance of the bear to be executed.
     :param args:          The arguments that are to be passed to the bear.
+    :param timings:       A list to append the ``BearTiming`` of this bear
+                          run to.
     :param kwargs:        The keyword arguments that are to be passed to the
                           bear.
     :return:              Returns a valid list of objects of the type Result
@@ -100,13 +103,19 @@ def run_bear(message_queue, timeout, bear_instance, *args, debug=False,
         del kwargs['dependency_results']
 
     name = bear_instance.name
+    # Local bears get the filename as first argument.
+    filename = args[0] if args else None
 
+    measurement = None if timings is None else start_measurement()
     try:
         result_list = bear_instance.execute(*args, debug=debug, **kwargs)
     except (Exception, SystemExit) as exc:
         if debug and not isinstance(exc, SystemExit):
             raise
 
+        if timings is not None:
+            timings.append(finish_measurement(measurement, name, filename, 0))
+
         send_msg(message_queue,
                  timeout,
                  LOG_LEVEL.ERROR,
@@ -122,6 +131,11 @@ def run_bear(message_queue, timeout, bear_instance, *args, debug=False,
 
         return None
 
+    if timings is not None:
+        timings.append(finish_measurement(
+            measurement, name, filename,
+            len(result_list) if isinstance(result_list, list) else 0))
+
     return validate_results(message_queue,
                             timeout,
                             result_list,
@@ -167,7 +181,8 @@ def run_local_bear(message_queue,
                    file_dict,
                    bear_instance,
                    filename,
-                   debug=False):
+                   debug=False,
+                   timings=None):
     """
     Runs an instance of a local bear. Checks if bear_instance is of type
     LocalBear and then passes it to the run_bear to execute.
@@ -183,6 +198,8 @@ def run_local_bear(message_queue,
     :param file_dict:         Dictionary containing contents of file.
     :param bear_instance:     Instance of LocalBear the run.
     :param filename:          Name of the file to run it on.
+    :param timings:           A list to append the ``BearTiming`` of this bear
+                              run to.
     :return:                  Returns a list of results generated by the passed
                               bear_instance.
     """
@@ -200,7 +217,8 @@ def run_local_bear(message_queue,
     kwargs = {'dependency_results':
               get_local_dependency_results(local_result_list,
                                            bear_instance),
-              'debug': debug}
+              'debug': debug,
+              'timings': timings}
     return run_bear(message_queue,
                     timeout,
                     bear_instance,
@@ -213,7 +231,8 @@ def run_global_bear(message_queue,
                     timeout,
                     global_bear_instance,
                     dependency_results,
-                    debug=False):
+                    debug=False,
+                    timings=None):
     """
     Runs an instance of a global bear. Checks if bear_instance is of type
     GlobalBear and then passes it to the run_bear to execute.
@@ -229,6 +248,8 @@ def run_global_bear(message_queue,
     :param dependency_results:   The results of all the bears on which the
                                  instance of the passed bear to be run depends
                                  on.
+    :param timings:              A list to append the ``BearTiming`` of this
+                                 bear run to.
     :return:                     Returns a list of results generated by the
                                  passed bear_instance.
     """
@@ -245,7 +266,8 @@ def run_global_bear(message_queue,
         return None
 
     kwargs = {'dependency_results': dependency_results,
-              'debug': debug}
+              'debug': debug,
+              'timings': timings}
     return run_bear(message_queue,
                     timeout,
                     global_bear_instance,
@@ -259,7 +281,8 @@ def run_local_bears_on_file(message_queue,
                             local_result_dict,
                             control_queue,
                             filename,
-                            debug=False):
+                            debug=False,
+                            timings=None):
     """
     This method runs a list of local bears on one file.
 
@@ -280,6 +303,8 @@ def run_local_bears_on_file(message_queue,
                               name(for global results) or a file name to
                               indicate the result will be put to the queue.
     :param filename:          The name of file on which to run the bears.
+    :param timings:           A list to append the ``BearTiming`` objects of
+                              the bear runs to.
     """
     if filename not in file_dict:
         send_msg(message_queue,
@@ -303,7 +328,8 @@ def run_local_bears_on_file(message_queue,
                                 file_dict,
                                 bear_instance,
                                 filename,
-                                debug=debug)
+                                debug=debug,
+                                timings=timings)
         if result is not None:
             local_result_list.extend(result)
 
@@ -393,7 +419,8 @@ def run_local_bears(filename_queue,
                     local_bear_list,
                     local_result_dict,
                     control_queue,
-                    debug=False):
+                    debug=False,
+                    timings=None):
     """
     Run local bears on all the files given.
 
@@ -415,6 +442,8 @@ def run_local_bears(filename_queue,
                               what kind of event happened) and either a bear
                               name(for global results) or a file name to
                               indicate the result will be put to the queue.
+    :param timings:           A list to append the ``BearTiming`` objects of
+                              the bear runs to.
     """
     try:
         while True:
@@ -426,7 +455,8 @@ def run_local_bears(filename_queue,
                                     local_result_dict,
                                     control_queue,
                                     filename,
-                                    debug=debug)
+                                    debug=debug,
+                                    timings=timings)
             task_done(filename_queue)
     except queue.Empty:
         return
@@ -438,7 +468,8 @@ def run_global_bears(message_queue,
                      global_bear_list,
                      global_result_dict,
                      control_queue,
-                     debug=False):
+                     debug=False,
+                     timings=None):
     """
     Run all global bears.
 
@@ -459,6 +490,8 @@ def run_global_bears(message_queue,
                                what kind of event happened) and either a bear
                                name(for global results) or a file name to
                                indicate the result will be put to the queue.
+    :param timings:            A list to append the ``BearTiming`` objects of
+                               the bear runs to.
     """
     try:
         while True:
@@ -469,7 +502,7 @@ def run_global_bears(message_queue,
                                      global_result_dict))
             bearname = bear.__class__.__name__
             result = run_global_bear(message_queue, timeout, bear, dep_results,
-                                     debug=debug)
+                                     debug=debug, timings=timings)
             if result:
                 global_result_dict[bearname] = result
                 control_queue.put((CONTROL_ELEMENT.GLOBAL, bearname))
@@ -490,7 +523,8 @@ def run(file_name_queue,
         message_queue,
         control_queue,
         timeout=0,
-        debug=False):
+        debug=False,
+        timings=None):
     """
     This is the method that is actually runs by processes.
 
@@ -539,7 +573,15 @@ def run(file_name_queue,
     :param timeout:            The queue blocks at most timeout seconds for a
                                free slot to execute the put operation on. After
                                the timeout it returns queue Full exception.
+    :param timings:            A list (e.g. a ``Manager.list``) the
+                               ``BearTiming`` objects of all bear runs of this
+                               process are added to, before
+                               ``CONTROL_ELEMENT.GLOBAL_FINISHED`` is put to
+                               the control queue.
     """
+    # Collect the timings locally and pass them on at once, so the bear runs
+    # aren't slowed down by communicating with a manager process.
+    process_timings = None if timings is None else []
     try:
         run_local_bears(file_name_queue,
                         message_queue,
@@ -548,7 +590,8 @@ def run(file_name_queue,
                         local_bear_list,
                         local_result_dict,
                         control_queue,
-                        debug=debug)
+                        debug=debug,
+                        timings=process_timings)
         control_queue.put((CONTROL_ELEMENT.LOCAL_FINISHED, None))
 
         run_global_bears(message_queue,
@@ -557,7 +600,10 @@ def run(file_name_queue,
                          global_bear_list,
                          global_result_dict,
                          control_queue,
-                         debug=debug)
+                         debug=debug,
+                         timings=process_timings)
+        if timings is not None:
+            timings.extend(process_timings)
         control_queue.put((CONTROL_ELEMENT.GLOBAL_FINISHED, None))
     except (OSError, KeyboardInterrupt):
         if debug:
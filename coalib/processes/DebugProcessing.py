@@ -15,14 +15,16 @@ __all__ = ['Manager', 'Process', 'Queue']
 class Manager:
     """
     A debug replacement for ``multiprocessing.Manager``, just offering
-    ``builtins.dict`` as ``.dict`` member.
+    ``builtins.dict`` and ``builtins.list`` as ``.dict`` and ``.list``
+    members.
     """
 
     def __init__(self):
         """
-        Just add ``dict`` as instance member.
+        Just add ``dict`` and ``list`` as instance members.
         """
         self.dict = dict
+        self.list = list
 
 
 class Process(partial):
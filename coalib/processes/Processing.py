@@ -16,7 +16,8 @@ from coalib.processes.CONTROL_ELEMENT import CONTROL_ELEMENT
 from coalib.processes.LogPrinterThread import LogPrinterThread
 from coalib.results.Result import Result
 from coalib.results.result_actions.DoNothingAction import DoNothingAction
-from coalib.results.result_actions.ApplyPatchAction import ApplyPatchAction
+from coalib.results.result_actions.ApplyPatchAction import (
+    ApplyPatchAction, write_patched_file)
 from coalib.results.result_actions.IgnoreResultAction import IgnoreResultAction
 from coalib.results.result_actions.ShowAppliedPatchesAction \
     import ShowAppliedPatchesAction
@@ -28,7 +29,7 @@ from coalib.results.result_actions.ShowPatchAction import ShowPatchAction
 from coalib.results.RESULT_SEVERITY import RESULT_SEVERITY
 from coalib.results.SourceRange import SourceRange
 from coalib.settings.Setting import glob_list, typed_list
-from coalib.parsing.Globbing import fnmatch
+from coalib.parsing.Globbing import compile_glob_set, fnmatch
 
 
 ACTIONS = [DoNothingAction,
@@ -107,7 +108,8 @@ def autoapply_actions(results,
                       file_dict,
                       file_diff_dict,
                       section,
-                      log_printer=None):
+                      log_printer=None,
+                      pending_files=None):
     """
     Auto-applies actions like defined in the given section.
 
@@ -118,6 +120,11 @@ def autoapply_actions(results,
                            diff objects as values.
     :param section:        The section.
     :param log_printer:    A log printer instance to log messages on.
+    :param pending_files:  A dictionary to collect the files patched by
+                           ``ApplyPatchAction`` in instead of writing them
+                           after every result, see ``write_pending_files``.
+                           All patches of a file are merged in memory, so
+                           conflicts are detected before anything is written.
     :return:               A list of unprocessed results.
     """
 
@@ -131,19 +138,18 @@ def autoapply_actions(results,
         # There's nothing to auto-apply.
         return results
 
+    bear_globs = compile_glob_set(tuple(default_actions))
     not_processed_results = []
     for result in results:
         try:
             # Match full bear names deterministically, prioritized!
             action = default_actions[result.origin]
         except KeyError:
-            for bear_glob in default_actions:
-                if fnmatch(result.origin, bear_glob):
-                    action = default_actions[bear_glob]
-                    break
-            else:
+            bear_glob = bear_globs.match(result.origin)
+            if bear_glob is None:
                 not_processed_results.append(result)
                 continue
+            action = default_actions[bear_glob]
 
         applicable = action.is_applicable(result, file_dict, file_diff_dict)
         if applicable is not True:
@@ -153,10 +159,16 @@ def autoapply_actions(results,
             continue
 
         try:
-            action().apply_from_section(result,
-                                        file_dict,
-                                        file_diff_dict,
-                                        section)
+            if pending_files is not None and issubclass(action,
+                                                        ApplyPatchAction):
+                action_instance = action(pending_files)
+            else:
+                action_instance = action()
+
+            action_instance.apply_from_section(result,
+                                               file_dict,
+                                               file_diff_dict,
+                                               section)
             logging.info('Applied {!r} on {} from {!r}.'.format(
                 action.get_metadata().name,
                 result.location_repr(),
@@ -172,6 +184,32 @@ def autoapply_actions(results,
     return not_processed_results
 
 
+def write_pending_files(pending_files, file_diff_dict, filenames=None):
+    """
+    Writes the files collected by ``autoapply_actions``, each one only once.
+
+    :param pending_files:  The dictionary the patched files were collected
+                           in. Written files are removed from it.
+    :param file_diff_dict: A dictionary that contains filenames as keys and
+                           diff objects as values.
+    :param filenames:      The names of the files to write or ``None`` to
+                           write all collected files.
+    """
+    filenames = (sorted(pending_files) if filenames is None
+                 else sorted(set(filenames).intersection(pending_files)))
+    for filename in filenames:
+        pre_patch_filename = pending_files.pop(filename)
+        try:
+            write_patched_file(filename,
+                               file_diff_dict[filename],
+                               pre_patch_filename)
+        except OSError as ex:
+            log_exception(
+                'Failed to write the patched file {!r}: {}.'.format(
+                    filename, ex),
+                ex)
+
+
 def check_result_ignore(result, ignore_ranges):
     """
     Determines if the result has to be ignored.
@@ -200,6 +238,114 @@ def check_result_ignore(result, ignore_ranges):
     return False
 
 
+def get_issue_key(result):
+    """
+    Retrieves the key identifying the issue a result reports, regardless of
+    the bear reporting it.
+
+    >>> first = Result.from_values('ABear', 'Unused import.', 'a.py', 3)
+    >>> second = Result.from_values('BBear', 'Unused import.', 'a.py', 3)
+    >>> get_issue_key(first) == get_issue_key(second)
+    True
+
+    :param result: A result.
+    :return:       A tuple holding the message, severity and affected code of
+                   the result.
+    """
+    return (result.message,
+            result.severity,
+            tuple((source_range.file,
+                   source_range.start.line,
+                   source_range.start.column,
+                   source_range.end.line,
+                   source_range.end.column)
+                  for source_range in result.affected_code))
+
+
+def filter_section_results(results,
+                           section,
+                           ignore_ranges,
+                           issue_origins=None):
+    """
+    Filters the results of bears for the ones to present to the user.
+
+    :param results:       A list of results.
+    :param section:       The section, its ``min_severity`` setting defines
+                          the minimal severity of the results.
+    :param ignore_ranges: A list of SourceRanges. Results that affect code in
+                          any of those ranges will be ignored.
+    :param issue_origins: A dictionary mapping the keys of the issues reported
+                          so far (see ``get_issue_key``) to the bears that
+                          reported them first. If given, results reporting an
+                          issue another bear reported already are dropped and
+                          the dictionary is updated. Results with patches are
+                          always kept, as their patches may differ.
+    :return:              The list of results to present.
+    """
+    min_severity_str = str(section.get('min_severity', 'INFO')).upper()
+    min_severity = RESULT_SEVERITY.str_dict.get(min_severity_str, 'INFO')
+    results = [result for result in results
+               if type(result) is Result and
+               result.severity >= min_severity and
+               not check_result_ignore(result, ignore_ranges)]
+
+    if issue_origins is None:
+        return results
+
+    unique_results = []
+    for result in results:
+        origin = (result.origin if result.diffs else
+                  issue_origins.setdefault(get_issue_key(result),
+                                           result.origin))
+        if origin == result.origin:
+            unique_results.append(result)
+        else:
+            logging.debug('Dropped a result of {} reporting the same issue '
+                          'as {}: {}'.format(result.origin, origin,
+                                             result.message))
+    return unique_results
+
+
+def print_filtered_results(results,
+                           file_dict,
+                           retval,
+                           print_results,
+                           section,
+                           file_diff_dict,
+                           console_printer,
+                           apply_single=False,
+                           pending_files=None):
+    """
+    Auto-applies actions on results filtered by ``filter_section_results``
+    and gives the remaining ones to the print_results method to present to
+    the user. See ``print_result`` for the parameters.
+
+    :return: Returns False if any results were yielded. Else True.
+    """
+    patched_results = autoapply_actions(results,
+                                        file_dict,
+                                        file_diff_dict,
+                                        section,
+                                        pending_files=pending_files)
+
+    if pending_files:
+        # Actions on the remaining results work on the files on disk.
+        write_pending_files(
+            pending_files,
+            file_diff_dict,
+            get_file_list(patched_results).union(
+                *(result.diffs or () for result in patched_results)))
+
+    print_results(None,
+                  section,
+                  patched_results,
+                  file_dict,
+                  file_diff_dict,
+                  console_printer,
+                  apply_single)
+    return retval or len(results) > 0, patched_results
+
+
 def print_result(results,
                  file_dict,
                  retval,
@@ -209,7 +355,8 @@ def print_result(results,
                  file_diff_dict,
                  ignore_ranges,
                  console_printer,
-                 apply_single=False):
+                 apply_single=False,
+                 pending_files=None):
     """
     Takes the results produced by each bear and gives them to the print_results
     method to present to the user.
@@ -230,30 +377,22 @@ def print_result(results,
     :param apply_single:   The action that should be applied for all results,
                            If it's not selected, has a value of False.
     :param console_printer: Object to print messages on the console.
+    :param pending_files:  A dictionary to collect the files patched by
+                           auto-applied actions in, see
+                           ``autoapply_actions``.
     :return:               Returns False if any results were yielded. Else
                            True.
     """
-    min_severity_str = str(section.get('min_severity', 'INFO')).upper()
-    min_severity = RESULT_SEVERITY.str_dict.get(min_severity_str, 'INFO')
-    results = list(filter(lambda result:
-                          type(result) is Result and
-                          result.severity >= min_severity and
-                          not check_result_ignore(result, ignore_ranges),
-                          results))
-
-    patched_results = autoapply_actions(results,
-                                        file_dict,
-                                        file_diff_dict,
-                                        section)
-
-    print_results(None,
-                  section,
-                  patched_results,
-                  file_dict,
-                  file_diff_dict,
-                  console_printer,
-                  apply_single)
-    return retval or len(results) > 0, patched_results
+    return print_filtered_results(
+        filter_section_results(results, section, ignore_ranges),
+        file_dict,
+        retval,
+        print_results,
+        section,
+        file_diff_dict,
+        console_printer,
+        apply_single,
+        pending_files)
 
 
 def get_file_dict(filename_list, log_printer=None, allow_raw_files=False):
@@ -334,6 +473,11 @@ def instantiate_bears(section,
             if debug:
                 raise
 
+    # The settings are converted once here instead of for every file.
+    for bear in (instantiated_local_bear_list +
+                 instantiated_global_bear_list):
+        bear.bind_section_params()
+
     return instantiated_local_bear_list, instantiated_global_bear_list
 
 
@@ -346,7 +490,8 @@ def instantiate_processes(section,
                           console_printer,
                           debug=False,
                           use_raw_files=False,
-                          debug_bears=False):
+                          debug_bears=False,
+                          record_timings=False):
     """
     Instantiate the number of processes that will run bears which will be
     responsible for running bears in a multiprocessing environment.
@@ -363,6 +508,9 @@ def instantiate_processes(section,
                              for bears, not catching any exceptions on running
                              them.
     :param use_raw_files:    Allow the usage of raw files (non text files)
+    :param record_timings:   Whether to record the timings of the bear runs.
+                             They're collected in the ``timings`` list of the
+                             returned arguments.
     :return:                 A tuple containing a list of processes,
                              and the arguments passed to each process which are
                              the same for each object.
@@ -438,6 +586,8 @@ def instantiate_processes(section,
                         'control_queue': control_queue,
                         'timeout': 0.1,
                         'debug': debug}
+    if record_timings:
+        bear_runner_args['timings'] = manager.list()
 
     fill_queue(filename_queue, file_dict.keys())
     fill_queue(global_bear_queue, range(len(global_bear_list)))
@@ -548,6 +698,10 @@ def process_queues(processes,
     Iterate the control queue and send the results received to the print_result
     method so that they can be presented to the user.
 
+    If the ``deduplicate_results`` setting of the section is enabled, results
+    reporting the same issue as a result of another bear presented before are
+    dropped, see ``filter_section_results``.
+
     :param processes:          List of processes which can be used to run
                                Bears.
     :param control_queue:      Containing control elements that indicate
@@ -576,6 +730,9 @@ def process_queues(processes,
                                Results were delivered to the user. Else False.
     """
     file_diff_dict = {}
+    # The files patched by auto-applied actions are written once all results
+    # are processed.
+    pending_files = {}
     retval = False
     # Number of processes working on local/global bears. They are count down
     # when the last queue element of that process is processed which may be
@@ -586,6 +743,26 @@ def process_queues(processes,
     result_files = set()
     ignore_ranges = list(yield_ignore_ranges(file_dict))
 
+    issue_origins = ({} if bool(section.get('deduplicate_results', False))
+                     else None)
+
+    def process_results(result_dict, index):
+        nonlocal retval
+        result_files.update(get_file_list(result_dict[index]))
+        retval, result_dict[index] = print_filtered_results(
+            filter_section_results(result_dict[index],
+                                   section,
+                                   ignore_ranges,
+                                   issue_origins),
+            file_dict,
+            retval,
+            print_results,
+            section,
+            file_diff_dict,
+            console_printer,
+            apply_single,
+            pending_files)
+
     # One process is the logger thread (if not in debug mode)
     while local_processes > (1 if not (debug or debug_bears) else 0):
         try:
@@ -597,19 +774,7 @@ def process_queues(processes,
                 global_processes -= 1
             elif control_elem == CONTROL_ELEMENT.LOCAL:
                 assert local_processes != 0
-                result_files.update(get_file_list(local_result_dict[index]))
-                retval, res = print_result(local_result_dict[index],
-                                           file_dict,
-                                           retval,
-                                           print_results,
-                                           section,
-                                           None,
-                                           file_diff_dict,
-                                           ignore_ranges,
-                                           console_printer=console_printer,
-                                           apply_single=apply_single
-                                           )
-                local_result_dict[index] = res
+                process_results(local_result_dict, index)
             else:
                 assert control_elem == CONTROL_ELEMENT.GLOBAL
                 global_result_buffer.append(index)
@@ -621,18 +786,7 @@ def process_queues(processes,
 
     # Flush global result buffer
     for elem in global_result_buffer:
-        result_files.update(get_file_list(global_result_dict[elem]))
-        retval, res = print_result(global_result_dict[elem],
-                                   file_dict,
-                                   retval,
-                                   print_results,
-                                   section,
-                                   None,
-                                   file_diff_dict,
-                                   ignore_ranges,
-                                   console_printer=console_printer,
-                                   apply_single=apply_single)
-        global_result_dict[elem] = res
+        process_results(global_result_dict, elem)
 
     # One process is the logger thread
     while global_processes > 1:
@@ -640,18 +794,7 @@ def process_queues(processes,
             control_elem, index = control_queue.get(timeout=0.1)
 
             if control_elem == CONTROL_ELEMENT.GLOBAL:
-                result_files.update(get_file_list(global_result_dict[index]))
-                retval, res = print_result(global_result_dict[index],
-                                           file_dict,
-                                           retval,
-                                           print_results,
-                                           section,
-                                           None,
-                                           file_diff_dict,
-                                           ignore_ranges,
-                                           console_printer,
-                                           apply_single)
-                global_result_dict[index] = res
+                process_results(global_result_dict, index)
             else:
                 assert control_elem == CONTROL_ELEMENT.GLOBAL_FINISHED
                 global_processes -= 1
@@ -661,6 +804,8 @@ def process_queues(processes,
                 # nondeterministically covered.
                 break
 
+    write_pending_files(pending_files, file_diff_dict)
+
     if cache:
         cache.untrack_files(result_files)
     return retval
@@ -702,9 +847,10 @@ def execute_section(section,
                     log_printer,
                     console_printer,
                     debug=False,
-                    apply_single=False):
+                    apply_single=False,
+                    timings=None):
     # type: (object, object, object, object, object, object, object, object,
-    # object) -> object
+    # object, object) -> object
     """
     Executes the section with the given bears.
 
@@ -732,6 +878,8 @@ def execute_section(section,
                              not catching any exceptions.
     :param apply_single:     The action that should be applied for all results.
                              If it's not selected, has a value of False.
+    :param timings:          A ``misc.Timings.Timings`` object to add the
+                             timings of the bear runs to or ``None``.
     :return:                 Tuple containing a bool (True if results were
                              yielded, False otherwise), a Manager.dict
                              containing all local results(filenames are key)
@@ -781,7 +929,9 @@ def execute_section(section,
                                                 console_printer=console_printer,
                                                 debug=debug,
                                                 use_raw_files=use_raw_files,
-                                                debug_bears=debug_bears)
+                                                debug_bears=debug_bears,
+                                                record_timings=(
+                                                    timings is not None))
 
     logger_thread = LogPrinterThread(arg_dict['message_queue'])
     # Start and join the logger thread along with the processes to run bears
@@ -818,3 +968,6 @@ def execute_section(section,
 
             for runner in processes:
                 runner.join()
+
+        if timings is not None:
+            timings.add(section.name, list(arg_dict['timings']))
@@ -1,9 +1,16 @@
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+
+from coalib.misc.Slots import PickleSlots
 from coalib.results.TextPosition import TextPosition
 from coala_utils.decorators import enforce_signature
 
 
 class AbsolutePosition(TextPosition):
 
+    __slots__ = ('_text', '_position')
+
     @enforce_signature
     def __init__(self,
                  text: (tuple, list, None) = None,
@@ -53,11 +60,98 @@ def calc_line_col(text, position):
                           in the (line, column) form.
     :return:              A tuple of the form (line, column), where both line
                           and column start from 1.
+    :raises ValueError:   If the position is outside of the text.
+    """
+    return get_line_offsets(text).line_col(position)
+
+
+class LineOffsets(PickleSlots):
+    r"""
+    Converts between absolute positions and lines and columns of a text in
+    logarithmic time, using the positions the lines start at.
+
+    >>> offsets = LineOffsets(('ab\n', '\n', 'c'))
+    >>> offsets.line_col(4)
+    (3, 1)
+    >>> offsets.position(3, 1)
+    4
+    >>> len(offsets)
+    5
+    """
+
+    __slots__ = ('starts', '_length')
+
+    def __init__(self, text):
+        """
+        :param text: A tuple/list of lines.
+        """
+        ends = list(accumulate(map(len, text)))
+        self.starts = [0] + ends[:-1]
+        self._length = ends[-1] if ends else 0
+
+    def __len__(self):
+        return self._length
+
+    def line_col(self, position):
+        """
+        :param position:    Position (starting from 0) of a character.
+        :return:            A tuple of the form (line, column), where both
+                            line and column start from 1.
+        :raises ValueError: If the position is outside of the text.
+        """
+        if not 0 <= position < self._length:
+            raise ValueError('Position not found in text')
+
+        # Empty lines start where the next line starts, picking the last
+        # line starting at or before the position skips them.
+        line = bisect_right(self.starts, position)
+        return line, position - self.starts[line - 1] + 1
+
+    def position(self, line, column):
+        """
+        :param line:   A line, starting from 1.
+        :param column: A column, starting from 1.
+        :return:       The position (starting from 0) of the character.
+        """
+        return self.starts[line - 1] + column - 1
+
+
+# Maps the ids of recently used texts to the texts and their ``LineOffsets``.
+# The texts are kept alive, so their ids can't be reused while cached.
+_line_offsets_cache = OrderedDict()
+_LINE_OFFSETS_CACHE_SIZE = 16
+
+
+def get_line_offsets(text):
+    r"""
+    Retrieves the ``LineOffsets`` of a text, which bears can use to convert
+    many positions of the same file, e.g. of regex matches on the joined
+    file contents.
+
+    The offsets of tuples and strings are cached for the recently used ones,
+    so they're only computed once per file content. Lists may change, so
+    their offsets are computed on every call.
+
+    >>> file = ('first line\n', 'second line\n')
+    >>> get_line_offsets(file) is get_line_offsets(file)
+    True
+    >>> get_line_offsets(file).line_col(''.join(file).find('second'))
+    (2, 1)
+
+    :param text: A tuple/list of lines.
+    :return:     The ``LineOffsets`` of the text.
     """
-    for linenum, line in enumerate(text, start=1):
-        linelen = len(line)
-        if position < linelen:
-            return linenum, position + 1
-        position -= linelen
+    if not isinstance(text, (tuple, str)):
+        return LineOffsets(text)
+
+    key = id(text)
+    cached = _line_offsets_cache.get(key)
+    if cached is not None and cached[0] is text:
+        _line_offsets_cache.move_to_end(key)
+        return cached[1]
 
-    raise ValueError('Position not found in text')
+    offsets = LineOffsets(text)
+    _line_offsets_cache[key] = text, offsets
+    if len(_line_offsets_cache) > _LINE_OFFSETS_CACHE_SIZE:
+        _line_offsets_cache.popitem(last=False)
+    return offsets
@@ -1,3 +1,4 @@
+import bisect
 import copy
 import difflib
 import logging
@@ -5,69 +6,242 @@ import logging
 from unidiff import PatchSet
 
 from coalib.results.LineDiff import LineDiff, ConflictError
+from coalib.results.SourcePosition import SourcePosition
 from coalib.results.SourceRange import SourceRange
+from coalib.results.TextPosition import TextPosition
 from coalib.results.TextRange import TextRange
 from coala_utils.decorators import enforce_signature, generate_eq
 
 
+def _difflib_opcodes(a, b):
+    """
+    Compares two sequences with ``difflib.SequenceMatcher``.
+
+    :param a: The original sequence.
+    :param b: The sequence to compare with.
+    :return:  The opcodes transforming ``a`` into ``b``, see
+              ``difflib.SequenceMatcher.get_opcodes``.
+    """
+    return difflib.SequenceMatcher(None, a, b).get_opcodes()
+
+
+def _longest_increasing_subsequence(pairs):
+    """
+    Patience sorts the given pairs by their second item.
+
+    >>> _longest_increasing_subsequence([(0, 3), (1, 0), (2, 1), (3, 4)])
+    [(1, 0), (2, 1), (3, 4)]
+
+    :param pairs: A list of pairs, sorted by their first item and with
+                  distinct second items.
+    :return:      The longest sublist of pairs whose second items are
+                  increasing.
+    """
+    tails = []
+    tail_indices = []
+    predecessors = []
+    for index, (_, second) in enumerate(pairs):
+        position = bisect.bisect_left(tails, second)
+        if position == len(tails):
+            tails.append(second)
+            tail_indices.append(index)
+        else:
+            tails[position] = second
+            tail_indices[position] = index
+        predecessors.append(tail_indices[position - 1] if position else None)
+
+    subsequence = []
+    index = tail_indices[-1] if tail_indices else None
+    while index is not None:
+        subsequence.append(pairs[index])
+        index = predecessors[index]
+    return subsequence[::-1]
+
+
+def _patience_matching_blocks(a, b, a_low, a_high, b_low, b_high, blocks):
+    # Common prefixes and suffixes always match.
+    while a_low < a_high and b_low < b_high and a[a_low] == b[b_low]:
+        blocks.append((a_low, b_low, 1))
+        a_low += 1
+        b_low += 1
+
+    suffix = []
+    while a_low < a_high and b_low < b_high and a[a_high-1] == b[b_high-1]:
+        a_high -= 1
+        b_high -= 1
+        suffix.append((a_high, b_high, 1))
+
+    if a_low < a_high and b_low < b_high:
+        # Maps the items to their index or None if they aren't unique.
+        unique_a = {}
+        for index in range(a_low, a_high):
+            unique_a[a[index]] = None if a[index] in unique_a else index
+        unique_b = {}
+        for index in range(b_low, b_high):
+            unique_b[b[index]] = None if b[index] in unique_b else index
+
+        anchors = _longest_increasing_subsequence(
+            [(index, unique_b[a[index]])
+             for index in range(a_low, a_high)
+             if unique_a[a[index]] is not None and
+             unique_b.get(a[index]) is not None])
+
+        if anchors:
+            for a_index, b_index in anchors:
+                if a_low < a_index and b_low < b_index:
+                    _patience_matching_blocks(a, b, a_low, a_index, b_low,
+                                              b_index, blocks)
+                blocks.append((a_index, b_index, 1))
+                a_low, b_low = a_index + 1, b_index + 1
+            _patience_matching_blocks(a, b, a_low, a_high, b_low, b_high,
+                                      blocks)
+        else:
+            # Without unique items there's nothing to anchor on, so let
+            # difflib sort out the (usually short) rest.
+            matcher = difflib.SequenceMatcher(None, a[a_low:a_high],
+                                              b[b_low:b_high])
+            blocks.extend((a_low + a_index, b_low + b_index, size)
+                          for a_index, b_index, size
+                          in matcher.get_matching_blocks()
+                          if size)
+
+    blocks.extend(reversed(suffix))
+
+
+def _patience_opcodes(a, b):
+    """
+    Compares two sequences with the patience diff algorithm: Common prefixes
+    and suffixes are trimmed, items occurring exactly once in both sequences
+    are matched up as anchors and the parts in between are compared
+    recursively.
+
+    >>> _patience_opcodes('abcd', 'acbd')
+    [('delete', 1, 2, 1, 1), ('insert', 3, 3, 2, 3)]
+
+    :param a: The original sequence.
+    :param b: The sequence to compare with.
+    :return:  The opcodes transforming ``a`` into ``b``, see
+              ``difflib.SequenceMatcher.get_opcodes``. Equal blocks are left
+              out.
+    """
+    blocks = []
+    _patience_matching_blocks(a, b, 0, len(a), 0, len(b), blocks)
+    blocks.append((len(a), len(b), 0))
+
+    opcodes = []
+    a_index = b_index = 0
+    for a_block, b_block, size in blocks:
+        if a_index < a_block and b_index < b_block:
+            opcodes.append(('replace', a_index, a_block, b_index, b_block))
+        elif a_index < a_block:
+            opcodes.append(('delete', a_index, a_block, b_index, b_block))
+        elif b_index < b_block:
+            opcodes.append(('insert', a_index, a_block, b_index, b_block))
+        a_index, b_index = a_block + size, b_block + size
+    return opcodes
+
+
+# The algorithms ``Diff.from_string_arrays`` can compare files with.
+DIFF_ALGORITHMS = {'difflib': _difflib_opcodes,
+                   'patience': _patience_opcodes}
+
+
 @generate_eq('_file', 'modified', 'rename', 'delete')
 class Diff:
-    """
+    r"""
     A Diff result represents a difference for one file.
+
+    The original file is held as tuple, which is shared with all diffs
+    created from this one instead of being copied, e.g. by ``split_diff``
+    or on addition:
+
+    >>> diff = Diff(['a\n', 'b\n'])
+    >>> diff.delete_line(1)
+    >>> sum_diff = diff + Diff(diff._file)
+    >>> sum_diff._file is diff._file
+    True
     """
 
     def __init__(self, file_list, rename=False, delete=False):
         """
         Creates an empty diff for the given file.
 
-        :param file_list: The original (unmodified) file as a list of its
-                          lines.
+        :param file_list: The original (unmodified) file as a list or tuple
+                          of its lines. Tuples are used as is and not
+                          copied.
         :param rename:    False or str containing new name of file.
         :param delete:    True if file is set to be deleted.
         """
+        self._line_map = None
         self._changes = {}
-        self._file = list(file_list)
-        self._original = self._generate_linebreaks(self._file)
+        self._file = (file_list if isinstance(file_list, tuple)
+                      else tuple(file_list))
+        self._original = None
         self.rename = rename
         self.delete = delete
 
-    @classmethod
-    def from_string_arrays(cls, file_array_1, file_array_2, rename=False):
+    def __copy__(self):
+        """
+        Copies the diff. The original file and the ``LineDiff`` objects are
+        shared with the copy, the latter are copied once they get changed.
         """
+        result = type(self).__new__(type(self))
+        result.__dict__.update(self.__dict__)
+        result._changes = dict(self._changes)
+        return result
+
+    @classmethod
+    def from_string_arrays(cls, file_array_1, file_array_2, rename=False,
+                           algorithm='difflib'):
+        r"""
         Creates a Diff object from two arrays containing strings.
 
         If this Diff is applied to the original array, the second array will be
         created.
 
+        The arrays are compared with ``difflib`` by default. The patience
+        algorithm is a lot faster on long files and yields the same modified
+        file, though the changes may be split up differently:
+
+        >>> Diff.from_string_arrays(['a\n', 'b\n', 'c\n'],
+        ...                         ['a\n', 'c\n', 'b\n'],
+        ...                         algorithm='patience').modified
+        ['a\n', 'c\n', 'b\n']
+
         :param file_array_1: Original array
         :param file_array_2: Array to compare
         :param rename:       False or str containing new name of file.
+        :param algorithm:    The name of the algorithm to compare the arrays
+                             with, one of ``DIFF_ALGORITHMS``.
+        :raises ValueError:  If the algorithm is unknown.
         """
+        if algorithm not in DIFF_ALGORITHMS:
+            raise ValueError('Unknown diff algorithm {!r}, use one of {}.'
+                             .format(algorithm,
+                                     ', '.join(sorted(DIFF_ALGORITHMS))))
+
         result = cls(file_array_1, rename=rename)
 
-        matcher = difflib.SequenceMatcher(None, file_array_1, file_array_2)
-        # We use this because its faster (generator) and doesn't yield as much
-        # useless information as get_opcodes.
-        for change_group in matcher.get_grouped_opcodes(1):
-            for (tag,
-                 a_index_1,
-                 a_index_2,
-                 b_index_1,
-                 b_index_2) in change_group:
-                if tag == 'delete':
-                    for index in range(a_index_1+1, a_index_2+1):
-                        result.delete_line(index)
-                elif tag == 'insert':
-                    # We add after line, they add before, so dont add 1 here
-                    result.add_lines(a_index_1,
-                                     file_array_2[b_index_1:b_index_2])
-                elif tag == 'replace':
-                    result.modify_line(a_index_1+1,
-                                       file_array_2[b_index_1])
-                    result.add_lines(a_index_1+1,
-                                     file_array_2[b_index_1+1:b_index_2])
-                    for index in range(a_index_1+2, a_index_2+1):
-                        result.delete_line(index)
+        for (tag,
+             a_index_1,
+             a_index_2,
+             b_index_1,
+             b_index_2) in DIFF_ALGORITHMS[algorithm](file_array_1,
+                                                      file_array_2):
+            if tag == 'delete':
+                for index in range(a_index_1+1, a_index_2+1):
+                    result.delete_line(index)
+            elif tag == 'insert':
+                # We add after line, they add before, so dont add 1 here
+                result.add_lines(a_index_1,
+                                 file_array_2[b_index_1:b_index_2])
+            elif tag == 'replace':
+                result.modify_line(a_index_1+1,
+                                   file_array_2[b_index_1])
+                result.add_lines(a_index_1+1,
+                                 file_array_2[b_index_1+1:b_index_2])
+                for index in range(a_index_1+2, a_index_2+1):
+                    result.delete_line(index)
 
         return result
 
@@ -161,7 +335,10 @@ class Diff:
         if line_nr < min_line:
             raise IndexError('The given line number is not allowed.')
 
-        return self._changes.get(line_nr, LineDiff())
+        # LineDiff objects may be shared with other diffs, so they are copied
+        # before they can get changed.
+        linediff = self._changes.get(line_nr)
+        return LineDiff() if linediff is None else copy.copy(linediff)
 
     def stats(self):
         """
@@ -214,43 +391,62 @@ class Diff:
         :param delete: True if file is set to be deleted, False otherwise.
         """
         self._delete = delete
+        self._line_map = None
 
     @property
     def original(self):
         """
         Retrieves the original file.
         """
+        if self._original is None:
+            self._original = self._generate_linebreaks(self._file)
         return self._original
 
-    def _raw_modified(self):
+    def _iter_raw_modified(self):
         """
-        Calculates the modified file, after applying the Diff to the original.
+        Yields the lines of the modified file, after applying the Diff to the
+        original.
         """
-        result = []
-
         if self.delete:
-            return result
+            return
 
         current_line = 0
 
         # Note that line_nr counts from _1_ although 0 is possible when
         # inserting lines before everything
         for line_nr in sorted(self._changes):
-            result.extend(self._file[current_line:max(line_nr-1, 0)])
+            yield from self._file[current_line:max(line_nr-1, 0)]
             linediff = self._changes[line_nr]
             if not linediff.delete and not linediff.change and line_nr > 0:
-                result.append(self._file[line_nr-1])
+                yield self._file[line_nr-1]
             elif linediff.change:
-                result.append(linediff.change[1])
+                yield linediff.change[1]
 
             if linediff.add_after:
-                result.extend(linediff.add_after)
+                yield from linediff.add_after
 
             current_line = line_nr
 
-        result.extend(self._file[current_line:])
+        yield from self._file[current_line:]
 
-        return result
+    def _raw_modified(self):
+        """
+        Calculates the modified file, after applying the Diff to the original.
+        """
+        return list(self._iter_raw_modified())
+
+    def iter_modified(self):
+        r"""
+        Yields the lines of the modified file one by one, with linebreaks
+        like ``modified``. Use this to write the modified file without
+        holding a copy of it in memory, e.g. with ``file.writelines``.
+
+        >>> diff = Diff(['1\n', '2'])
+        >>> diff.add_line(2, '3')
+        >>> list(diff.iter_modified())
+        ['1\n', '2\n', '3']
+        """
+        return self._iter_linebreaks(self._iter_raw_modified())
 
     @property
     def modified(self):
@@ -263,6 +459,36 @@ class Diff:
         """
         return self._generate_linebreaks(self._raw_modified())
 
+    def iter_unified_diff(self, fromfile='', tofile=None):
+        r"""
+        Yields the lines of the unified diff of this patch one by one, see
+        ``unified_diff``. Use this to write the unified diff without joining
+        it into one string, e.g. with ``file.writelines``.
+
+        Only the output is streamed: ``difflib`` needs the whole modified file
+        to match it with the original, so the modified lines are still built
+        as a list first.
+
+        >>> diff = Diff(['1\n', '2\n'])
+        >>> diff.delete_line(2)
+        >>> list(diff.iter_unified_diff())[2:]
+        ['@@ -1,2 +1 @@\n', ' 1\n', '-2\n']
+
+        :param fromfile: The file name to give in the header for the original
+                         file.
+        :param tofile:   The file name to give in the header for the modified
+                         file, the new name of the file by default if it's
+                         renamed.
+        """
+        if tofile is None:
+            tofile = self.rename if isinstance(self.rename, str) else ''
+
+        return self._iter_linebreaks(difflib.unified_diff(
+            self._file,
+            self._raw_modified(),
+            fromfile=fromfile,
+            tofile=tofile))
+
     @property
     def unified_diff(self):
         """
@@ -276,13 +502,7 @@ class Diff:
         Note that the unified diff is not deterministic and thus not suitable
         for equality comparison.
         """
-
-        list_unified_diff = list(difflib.unified_diff(
-            self._file,
-            self._raw_modified(),
-            tofile=self.rename if isinstance(self.rename, str) else ''))
-
-        return ''.join(self._generate_linebreaks(list_unified_diff))
+        return ''.join(self.iter_unified_diff())
 
     def __json__(self):
         """
@@ -352,6 +572,7 @@ class Diff:
 
             last_line = line
             this_diff._changes[line] = self._changes[line]
+            this_diff._line_map = None
 
         # If the diff contains no line changes, the loop above will not be run
         # else, this_diff will never be empty and thus this has to be yielded
@@ -384,6 +605,163 @@ class Diff:
                                        start_line=max(1, start),
                                        end_line=max(1, end))
 
+    def _get_line_map(self):
+        """
+        Calculates the runs of consecutive lines that are kept by this diff,
+        i.e. that aren't deleted. The result is cached until the diff is
+        changed.
+
+        :return: A tuple of three sorted lists, holding the original and the
+                 modified line number of the first line of each run and the
+                 lengths of the runs.
+        """
+        if self._line_map is None:
+            original_starts = []
+            modified_starts = []
+            lengths = []
+
+            def add_run(original_start, modified_start, length):
+                if (lengths and
+                        original_starts[-1] + lengths[-1] == original_start and
+                        modified_starts[-1] + lengths[-1] == modified_start):
+                    lengths[-1] += length
+                else:
+                    original_starts.append(original_start)
+                    modified_starts.append(modified_start)
+                    lengths.append(length)
+
+            if not self.delete:
+                original_line = modified_line = 1
+                for line_nr in sorted(self._changes):
+                    linediff = self._changes[line_nr]
+                    if line_nr > 0:
+                        kept = line_nr - original_line + (
+                            0 if linediff.delete else 1)
+                        if kept > 0:
+                            add_run(original_line, modified_line, kept)
+                            modified_line += kept
+                        original_line = line_nr + 1
+
+                    if linediff.add_after:
+                        modified_line += len(linediff.add_after)
+
+                if original_line <= len(self._file):
+                    add_run(original_line, modified_line,
+                            len(self._file) - original_line + 1)
+
+            self._line_map = original_starts, modified_starts, lengths
+
+        return self._line_map
+
+    @staticmethod
+    def _translate_line(line_nr, starts, other_starts, lengths):
+        index = bisect.bisect_right(starts, line_nr) - 1
+        if index >= 0 and line_nr < starts[index] + lengths[index]:
+            return other_starts[index] + line_nr - starts[index]
+        return None
+
+    @staticmethod
+    def _translate_range(range, starts, other_starts, lengths, line_length,
+                         filename):
+        start = range.start.line, range.start.column
+        if start[0] is not None:
+            index = bisect.bisect_right(starts, start[0]) - 1
+            if index >= 0 and start[0] < starts[index] + lengths[index]:
+                start = other_starts[index] + start[0] - starts[index], start[1]
+            elif index + 1 < len(starts):
+                # Start at the first kept line after the removed ones.
+                start = other_starts[index + 1], None
+            else:
+                return None
+
+        end = range.end.line, range.end.column
+        if end[0] is not None:
+            index = bisect.bisect_right(starts, end[0]) - 1
+            if index >= 0 and end[0] < starts[index] + lengths[index]:
+                end = other_starts[index] + end[0] - starts[index], end[1]
+            elif index >= 0:
+                # End with the last kept line before the removed ones.
+                end_line = starts[index] + lengths[index] - 1
+                other_end_line = other_starts[index] + lengths[index] - 1
+                end_column = line_length(end_line, other_end_line)
+                if start[0] == other_end_line and start[1] is not None:
+                    # Don't end before the start, e.g. behind the newline.
+                    end_column = max(end_column, start[1])
+                end = other_end_line, end_column
+            else:
+                return None
+
+        if None not in (start[0], end[0]) and start[0] > end[0]:
+            # All lines of the range were removed.
+            return None
+
+        if filename is None:
+            return TextRange(TextPosition(*start), TextPosition(*end))
+        return SourceRange(SourcePosition(filename, *start),
+                           SourcePosition(filename, *end))
+
+    def to_modified_line(self, line_nr):
+        """
+        Translates a line number of the original file to the according line
+        number of the modified file.
+
+        >>> diff = Diff.from_string_arrays(['a', 'b', 'c', 'd'],
+        ...                                ['new', 'a', 'c', 'D'])
+        >>> [diff.to_modified_line(line_nr) for line_nr in range(1, 5)]
+        [2, None, 3, 4]
+
+        The translation bisects a map of the kept lines of the diff, which is
+        built once and rebuilt after the diff is changed:
+
+        >>> diff.delete_line(1)
+        >>> diff.to_modified_line(3)
+        2
+
+        :param line_nr: The line number in the original file, starting at 1.
+        :return:        The line number in the modified file or ``None`` if
+                        the line is deleted.
+        """
+        return self._translate_line(line_nr, *self._get_line_map())
+
+    def to_modified_range(self, range):
+        """
+        Translates a ``TextRange`` or ``SourceRange`` of the original file to
+        the modified file. The columns are kept, as the diff only knows about
+        whole lines. Deleted lines at the start or the end of the range are
+        left out, the range then starts at the beginning or ends at the end of
+        the next kept line:
+
+        >>> diff = Diff.from_string_arrays(['a', 'b', 'c', 'd'],
+        ...                                ['new', 'a', 'c', 'D'])
+        >>> range = diff.to_modified_range(TextRange.from_values(2, 1, 3, 2))
+        >>> range.start.line, range.start.column, range.end.line
+        (3, None, 3)
+
+        If all lines of the range are deleted, ``None`` is returned:
+
+        >>> diff.to_modified_range(TextRange.from_values(2)) is None
+        True
+
+        ``SourceRange`` objects are moved to the new file name if the diff
+        renames the file.
+
+        :param range: The ``TextRange`` in the original file.
+        :return:      The ``TextRange`` in the modified file or ``None``.
+        """
+        def line_length(line_nr, modified_line_nr):
+            linediff = self._changes.get(line_nr)
+            if linediff is not None and linediff.change:
+                return len(linediff.change[1])
+            return len(self._file[line_nr - 1])
+
+        filename = None
+        if isinstance(range, SourceRange):
+            filename = self.rename if self.rename is not False else range.file
+
+        return self._translate_range(range, *self._get_line_map(),
+                                     line_length=line_length,
+                                     filename=filename)
+
     def __add__(self, other):
         """
         Adds another diff to this one. Will throw an exception if this is not
@@ -396,7 +774,7 @@ class Diff:
                                                          other.rename):
             raise ConflictError('Diffs contain conflicting renamings.')
 
-        result = copy.deepcopy(self)
+        result = copy.copy(self)
         result.rename = self.rename or other.rename
         result.delete = self.delete or other.delete
 
@@ -440,6 +818,7 @@ class Diff:
         linediff = self._get_change(line_nr)
         linediff.delete = True
         self._changes[line_nr] = linediff
+        self._line_map = None
 
     def delete_lines(self, line_nr_start, line_nr_end):
         """
@@ -469,6 +848,7 @@ class Diff:
 
         linediff.add_after = lines
         self._changes[line_nr_before] = linediff
+        self._line_map = None
 
     def add_line(self, line_nr_before, line):
         """
@@ -625,6 +1005,24 @@ class Diff:
                 else line + '\n'
                 for line in lines]
 
+    @staticmethod
+    def _iter_linebreaks(lines):
+        """
+        Yields the lines, appending a newline character to each line that
+        doesn't end with one. Exception is the last line.
+
+        :param lines: An iterable of strings, representing lines.
+        """
+        lines = iter(lines)
+        previous = next(lines, None)
+        if previous is None:
+            return
+
+        for line in lines:
+            yield previous if previous.endswith('\n') else previous + '\n'
+            previous = line
+        yield previous
+
     @staticmethod
     def _generate_linebreaks(lines):
         """
@@ -635,7 +1033,7 @@ class Diff:
         :param lines: A list of strings, representing lines.
         """
 
-        if lines == []:
+        if not lines:
             return []
 
         return Diff._add_linebreaks(lines[:-1]) + [lines[-1]]
@@ -18,6 +18,8 @@ class HiddenResult(Result):
     to transfer any data from a dependent bear to others.
     """
 
+    __slots__ = ('contents',)
+
     @enforce_signature
     def __init__(self,
                  origin,
@@ -1,13 +1,40 @@
-import uuid
+import itertools
+import os
 from os.path import relpath
 
 from coala_utils.decorators import (
     enforce_signature, generate_ordering, generate_repr, get_public_members)
 from coalib.bearlib.aspects import aspectbase
+from coalib.misc.Slots import PickleSlots
 from coalib.results.RESULT_SEVERITY import RESULT_SEVERITY
 from coalib.results.SourceRange import SourceRange
 
 
+class _IdGenerator:
+    """
+    Generates integer ids that are unique across processes, without the
+    overhead of a UUID per id. Every process draws a random prefix and counts
+    up from there.
+    """
+
+    def __init__(self):
+        self.pid = None
+        self.prefix = None
+        self.counter = None
+
+    def __call__(self):
+        pid = os.getpid()
+        if pid != self.pid:
+            # Forked processes inherit the state, so they need a new prefix.
+            self.pid = pid
+            self.prefix = int.from_bytes(os.urandom(8), 'big') << 32
+            self.counter = itertools.count()
+        return self.prefix + next(self.counter)
+
+
+_generate_id = _IdGenerator()
+
+
 # Omit additional info, debug message and diffs for brevity
 @generate_repr(('id', hex),
                'origin',
@@ -28,7 +55,7 @@ from coalib.results.SourceRange import SourceRange
                    'diffs',
                    'debug_msg',
                    'applied_actions')
-class Result:
+class Result(PickleSlots):
     """
     A result is anything that has an origin and a message.
 
@@ -49,8 +76,25 @@ class Result:
     >>> r.message
     'spam and eggs'
 
+    Results are created in masses, so their attributes are stored in
+    ``__slots__``. Other attributes can still be set on them; the
+    ``__dict__`` holding those is only created when that happens.
     """
 
+    __slots__ = ('origin',
+                 'message_base',
+                 'message_arguments',
+                 'applied_actions',
+                 'debug_msg',
+                 'additional_info',
+                 'affected_code',
+                 'severity',
+                 'confidence',
+                 'diffs',
+                 'id',
+                 'aspect',
+                 '__dict__')
+
     @enforce_signature
     def __init__(self,
                  origin,
@@ -118,13 +162,14 @@ class Result:
         self.debug_msg = debug_msg
         self.additional_info = additional_info
         # Sorting is important for tuple comparison
-        self.affected_code = tuple(sorted(affected_code))
+        self.affected_code = (tuple(affected_code) if len(affected_code) < 2
+                              else tuple(sorted(affected_code)))
         self.severity = severity
         if confidence < 0 or confidence > 100:
             raise ValueError('Value of confidence should be between 0 and 100.')
         self.confidence = confidence
         self.diffs = diffs
-        self.id = uuid.uuid4().int
+        self.id = _generate_id()
         self.aspect = aspect
         if self.aspect and not self.additional_info:
             self.additional_info = '{} {}'.format(
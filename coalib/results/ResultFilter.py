@@ -1,4 +1,4 @@
-import copy
+import hashlib
 from difflib import SequenceMatcher
 
 from coalib.results.Diff import ConflictError, Diff
@@ -12,6 +12,16 @@ def filter_results(original_file_dict,
     """
     Filters results for such ones that are unique across file changes
 
+    Two results match if their origin, message, severity and debug message
+    are equal and removing their affected code from the original and the
+    modified files, respectively, leaves the same files behind, taking the
+    changes between the original and the modified files into account.
+
+    Instead of comparing every modified result with every original result,
+    each result is reduced to a fingerprint of these properties once, so the
+    results are matched in linear time. Only the files affected by results
+    are diffed, each of them once.
+
     :param original_file_dict: Dict of lists of file contents before  changes
     :param modified_file_dict: Dict of lists of file contents after changes
     :param original_results:   List of results of the old files
@@ -19,43 +29,323 @@ def filter_results(original_file_dict,
     :return:                   List of results from new files that are unique
                                from all those that existed in the old changes
     """
-
     renamed_files = ensure_files_present(original_file_dict,
                                          modified_file_dict)
-    # diffs_dict[file] is a diff between the original and modified file
-    diffs_dict = {}
-    for file in original_file_dict:
-        diffs_dict[file] = Diff.from_string_arrays(
-            original_file_dict[file],
-            modified_file_dict[renamed_files.get(file, file)])
+    changes = _FileChanges(original_file_dict,
+                           modified_file_dict,
+                           renamed_files)
+
+    original_fingerprints = set()
+    for original_result in original_results:
+        fingerprint = changes.original_fingerprint(
+            _basics(original_result),
+            _range_locations(original_result.affected_code))
+        if fingerprint is not None:
+            original_fingerprints.add(fingerprint)
+
+    return [modified_result
+            for modified_result in reversed(modified_results)
+            if changes.modified_fingerprint(
+                _basics(modified_result),
+                _range_locations(modified_result.affected_code))
+            not in original_fingerprints]
+
+
+def filter_result_tables(original_file_dict,
+                         modified_file_dict,
+                         original_table,
+                         modified_table):
+    """
+    Filters the rows of a ``ResultTable`` for such ones that are unique across
+    file changes, like ``filter_results`` does for results, without creating
+    a result per row.
+
+    :param original_file_dict: Dict of lists of file contents before changes.
+    :param modified_file_dict: Dict of lists of file contents after changes.
+    :param original_table:     The ``ResultTable`` of the old files.
+    :param modified_table:     The ``ResultTable`` of the new files.
+    :return:                   A ``ResultTable`` holding the rows of the
+                               modified table that are unique from all those
+                               of the original table, in their order.
+    """
+    renamed_files = ensure_files_present(original_file_dict,
+                                         modified_file_dict)
+    changes = _FileChanges(original_file_dict,
+                           modified_file_dict,
+                           renamed_files)
+
+    original_fingerprints = set(_table_fingerprints(
+        original_table, changes.original_fingerprint))
+    original_fingerprints.discard(None)
+
+    return modified_table.take(
+        fingerprint not in original_fingerprints
+        for fingerprint in _table_fingerprints(
+            modified_table, changes.modified_fingerprint))
+
+
+def _table_fingerprints(table, fingerprint):
+    """
+    Reads the rows of a ``ResultTable`` straight from its columns.
+
+    :param table:       A ``ResultTable``.
+    :param fingerprint: The method of ``_FileChanges`` computing the
+                        fingerprints.
+    :return:            An iterator over the fingerprints of the rows.
+    """
+    strings = table.strings
+    for (origin, message, severity, debug_msg,
+         file, *location) in zip(*(table.columns[name] for name in (
+             'origin', 'message', 'severity', 'debug_msg',
+             'file', 'start_line', 'start_column', 'end_line', 'end_column'))):
+        # Missing lines and columns are stored as 0.
+        locations = ({strings[file]: [tuple(value or None
+                                            for value in location)]}
+                     if file else {})
+        yield fingerprint(
+            (strings[origin], strings[message], severity, strings[debug_msg]),
+            locations)
+
+
+class _FileChanges:
+    """
+    Computes the fingerprints of results across file changes for
+    ``filter_results``.
+
+    The fingerprint of a result consists of its basic properties (see
+    ``basics_match``) and a digest of the lines of each modified file that
+    change when removing the affected code of the result, keyed by the
+    original file names. The affected code of an original result is removed
+    from the original file and the changed lines are translated to the
+    modified file, so no file is copied or diffed per result. Two results
+    match exactly if their fingerprints are equal.
+    """
 
-    orig_result_diff_dict_dict = remove_result_ranges_diffs(original_results,
-                                                            original_file_dict)
+    def __init__(self, original_file_dict, modified_file_dict, renamed_files):
+        """
+        :param original_file_dict: Dict of lists of file contents before
+                                   changes.
+        :param modified_file_dict: Dict of lists of file contents after
+                                   changes.
+        :param renamed_files:      A dictionary containing file renamings
+                                   across runs.
+        """
+        self.original_file_dict = original_file_dict
+        self.modified_file_dict = modified_file_dict
+        self.renamed_files = renamed_files
+        self.original_names = {new_name: file_name
+                               for file_name, new_name
+                               in renamed_files.items()}
+
+        # Keyed by the original file names and filled lazily.
+        self.diffs = {}
+
+    def diff(self, file_name):
+        """
+        :param file_name: The original name of a file.
+        :return:          The diff between the original and the modified
+                          file.
+        """
+        if file_name not in self.diffs:
+            self.diffs[file_name] = Diff.from_string_arrays(
+                self.original_file_dict[file_name],
+                self.modified_file(file_name))
+        return self.diffs[file_name]
+
+    def modified_file(self, file_name):
+        """
+        :param file_name: The original name of a file.
+        :return:          The contents of the modified file.
+        """
+        return self.modified_file_dict[
+            self.renamed_files.get(file_name, file_name)]
+
+    def original_fingerprint(self, basics, locations):
+        """
+        :param basics:    The basic properties of a result of the old files,
+                          see ``_basics``.
+        :param locations: The locations of the affected code of the result,
+                          see ``_range_locations``.
+        :return:          The fingerprint of the result or ``None`` if the
+                          changes of the files conflict with the removal of
+                          its affected code, so it can't match any result.
+        """
+        changed_files = []
+        for file_name, file_locations in locations.items():
+            original_file = self.original_file_dict[file_name]
+            modified_file = self.modified_file(file_name)
+            diff = self.diff(file_name)
+
+            edits = {}
+            for line_nr, content in _removal_edits(original_file,
+                                                   file_locations).items():
+                modified_line_nr = diff.to_modified_line(line_nr)
+                if modified_line_nr is None:
+                    if content is None:
+                        # Deleted by both, which doesn't conflict.
+                        continue
+                    return None
+
+                original_line = original_file[line_nr - 1]
+                modified_line = modified_file[modified_line_nr - 1]
+                if modified_line != original_line:
+                    if content is None:
+                        return None
+                    try:  # fails if the affected code got modified
+                        content = _merge_line_changes(original_line,
+                                                      modified_line,
+                                                      content)
+                    except ConflictError:
+                        return None
+                edits[modified_line_nr] = content
+
+            digest = _edits_digest(modified_file, edits)
+            if digest is not None:
+                changed_files.append((file_name, digest))
+
+        return basics + (frozenset(changed_files),)
+
+    def modified_fingerprint(self, basics, locations):
+        """
+        :param basics:    The basic properties of a result of the new files,
+                          see ``_basics``.
+        :param locations: The locations of the affected code of the result,
+                          see ``_range_locations``.
+        :return:          The fingerprint of the result.
+        """
+        changed_files = []
+        for file_name, file_locations in locations.items():
+            if file_name in self.renamed_files:
+                # The original name of a renamed file is just an empty
+                # placeholder in the modified files and never compared.
+                continue
+
+            file = self.modified_file_dict[file_name]
+            digest = _edits_digest(file, _removal_edits(file, file_locations))
+            if digest is not None:
+                changed_files.append(
+                    (self.original_names.get(file_name, file_name), digest))
+
+        return basics + (frozenset(changed_files),)
+
+
+def _range_locations(affected_code):
+    """
+    :param affected_code: An iterable of ``SourceRange`` objects.
+    :return:              A dict mapping the names of the affected files to
+                          lists of tuples holding the start line, start
+                          column, end line and end column of the ranges, as
+                          ``_removal_edits`` takes them.
+    """
+    locations = {}
+    for source_range in _join_ranges(affected_code):
+        start, end = source_range.start, source_range.end
+        locations.setdefault(source_range.file, []).append(
+            (start.line, start.column, end.line, end.column))
+    return locations
 
-    mod_result_diff_dict_dict = remove_result_ranges_diffs(modified_results,
-                                                           modified_file_dict)
 
-    unique_results = []
+def _removal_edits(file, locations):
+    """
+    Removes ranges from a file like ``remove_range`` does, without copying
+    the file.
+
+    >>> edits = _removal_edits(['a\\n', 'bc\\n', 'd\\n'],
+    ...                        [(2, 2, 2, 2), (1, None, 1, None)])
+    >>> sorted(edits.items())
+    [(1, None), (2, 'b\\n')]
+
+    :param file:      The list of lines of the file.
+    :param locations: Tuples holding the start line, start column, end line
+                      and end column of the ranges, sorted backwards and
+                      without overlaps. Values of ``None`` are expanded like
+                      ``TextRange.expand`` does.
+    :return:          A dict mapping the numbers of the changed lines to
+                      their new contents, or to ``None`` if they're deleted.
+    """
+    edits = {}
+    if not file:
+        return edits
+
+    def line(line_nr):
+        return edits.get(line_nr, file[line_nr - 1]) or ''
+
+    for start_line, start_column, end_line, end_column in locations:
+        start_line = start_line or 1
+        start_column = start_column or 1
+        end_line = end_line or len(file)
+        end_column = end_column or len(line(end_line))
+
+        if start_line == end_line:
+            content = line(start_line)
+            edits[start_line] = (content[:start_column - 1] +
+                                 content[end_column:]) or None
+        else:
+            edits[start_line] = line(start_line)[:start_column - 1] or None
+            edits[end_line] = line(end_line)[end_column:] or None
+            edits.update(dict.fromkeys(range(start_line + 1, end_line)))
 
-    for m_r in reversed(modified_results):
-        unique = True
+    return edits
 
-        for o_r in original_results:
 
-            if basics_match(o_r, m_r):
-                if source_ranges_match(original_file_dict,
-                                       diffs_dict,
-                                       orig_result_diff_dict_dict[o_r],
-                                       mod_result_diff_dict_dict[m_r],
-                                       renamed_files):
+def _merge_line_changes(original_line, modified_line, replacement):
+    """
+    Merges two changes of a line like ``Diff.modify_line`` does.
 
-                    # at least one original result matches completely
-                    unique = False
-                    break
-        if unique:
-            unique_results.append(m_r)
+    >>> _merge_line_changes('a b c', 'A b c', 'a b')
+    'A b'
 
-    return unique_results
+    :param original_line:  The original line.
+    :param modified_line:  The line after the first change.
+    :param replacement:    The line after the second change.
+    :return:               The line after both changes or ``None`` if it's
+                           empty.
+    :raises ConflictError: If the changes conflict.
+    """
+    diff = Diff([original_line])
+    diff.modify_line(1, modified_line)
+    diff.modify_line(1, replacement)
+    return ''.join(diff.modified) or None
+
+
+def _edits_digest(file, edits):
+    """
+    :param file:  The list of lines of a modified file.
+    :param edits: The changed lines of the file, see ``_removal_edits``.
+    :return:      A digest of the edits that change the file, with the
+                  linebreaks normalized like the ``modified`` property of a
+                  ``Diff`` does, or ``None`` if the file doesn't change.
+    """
+    last_line = len(file)
+    while last_line in edits and edits[last_line] is None:
+        last_line -= 1
+
+    digest = None
+    for line_nr in sorted(edits):
+        content = edits[line_nr]
+        if content is not None:
+            if line_nr != last_line and not content.endswith('\n'):
+                content += '\n'
+            original = file[line_nr - 1]
+            if line_nr != len(file) and not original.endswith('\n'):
+                original += '\n'
+            if content == original:
+                continue
+
+        if digest is None:
+            digest = hashlib.sha1()
+        digest.update(repr((line_nr, content)).encode())
+
+    return None if digest is None else digest.digest()
+
+
+def _basics(result):
+    """
+    :param result: A result.
+    :return:       A tuple of the properties compared by ``basics_match``.
+    """
+    return tuple(getattr(result, member)
+                 for member in ['origin', 'message', 'severity', 'debug_msg'])
 
 
 def basics_match(original_result,
@@ -160,6 +450,69 @@ def remove_range(file_contents, source_range):
     return newfile
 
 
+def _remove_result_ranges(result, file_dict):
+    """
+    Removes the affected code of a result from the files.
+
+    :param result:    A result.
+    :param file_dict: Dict of file contents.
+    :return:          A dict mapping the names of the files the result affects
+                      to their contents with the affected code removed.
+    """
+    return _remove_ranges(result.affected_code, file_dict)
+
+
+def _remove_ranges(affected_code, file_dict):
+    """
+    Removes source ranges from the files.
+
+    :param affected_code: An iterable of ``SourceRange`` objects.
+    :param file_dict:     Dict of file contents.
+    :return:              A dict mapping the names of the files the ranges
+                          affect to their contents with the ranges removed.
+    """
+    removed_file_dict = {}
+    for source_range in _join_ranges(affected_code):
+        file_name = source_range.file
+        removed_file_dict[file_name] = remove_range(
+            removed_file_dict.get(file_name, file_dict[file_name]),
+            source_range)
+
+    return removed_file_dict
+
+
+def _join_ranges(affected_code):
+    """
+    :param affected_code: An iterable of ``SourceRange`` objects.
+    :return:              A list of the ranges sorted backwards, with
+                          overlapping ranges joined.
+    """
+    # gather all source ranges from this result
+    source_ranges = []
+
+    # SourceRanges must be sorted backwards and overlaps must be eliminated
+    # this way, the deletion based on sourceRanges is not offset by
+    # previous deletions in the same line that invalidate the indices.
+    previous = None
+
+    for source_range in sorted(affected_code, reverse=True):
+        # previous exists and overlaps
+        if previous is not None and source_range.overlaps(previous):
+            combined_sr = SourceRange.join(previous, source_range)
+            previous = combined_sr
+        elif previous is None:
+            previous = source_range
+        # previous exists but it doesn't overlap
+        else:
+            source_ranges.append(previous)
+            previous = source_range
+    # don't forget last entry if there were any:
+    if previous:
+        source_ranges.append(previous)
+
+    return source_ranges
+
+
 def remove_result_ranges_diffs(result_list, file_dict):
     """
     Calculates the diffs to all files in file_dict that describe the removal of
@@ -173,42 +526,16 @@ def remove_result_ranges_diffs(result_list, file_dict):
     """
     result_diff_dict_dict = {}
     for original_result in result_list:
-        mod_file_dict = copy.deepcopy(file_dict)
-
-        # gather all source ranges from this result
-        source_ranges = []
-
-        # SourceRanges must be sorted backwards and overlaps must be eliminated
-        # this way, the deletion based on sourceRanges is not offset by
-        # previous deletions in the same line that invalidate the indices.
-        previous = None
-
-        for source_range in sorted(original_result.affected_code, reverse=True):
-            # previous exists and overlaps
-            if previous is not None and source_range.overlaps(previous):
-                combined_sr = SourceRange.join(previous, source_range)
-                previous = combined_sr
-            elif previous is None:
-                previous = source_range
-            # previous exists but it doesn't overlap
-            else:
-                source_ranges.append(previous)
-                previous = source_range
-        # don't forget last entry if there were any:
-        if previous:
-            source_ranges.append(previous)
-
-        for source_range in source_ranges:
-            file_name = source_range.file
-            new_file = remove_range(mod_file_dict[file_name],
-                                    source_range)
-            mod_file_dict[file_name] = new_file
+        removed_file_dict = _remove_result_ranges(original_result, file_dict)
 
         diff_dict = {}
         for file_name in file_dict:
-            diff_dict[file_name] = Diff.from_string_arrays(
-                file_dict[file_name],
-                mod_file_dict[file_name])
+            if file_name in removed_file_dict:
+                diff_dict[file_name] = Diff.from_string_arrays(
+                    file_dict[file_name],
+                    removed_file_dict[file_name])
+            else:
+                diff_dict[file_name] = Diff(file_dict[file_name])
 
         result_diff_dict_dict[original_result] = diff_dict
 
@@ -0,0 +1,297 @@
+import itertools
+from array import array
+from collections import Counter, OrderedDict
+from os.path import relpath
+
+from coalib.parsing.Globbing import fnmatch
+from coalib.results.Result import Result
+from coalib.results.SourceRange import SourceRange
+
+
+class StringTable:
+    """
+    Interns strings to integer ids. The id ``0`` stands for ``None``.
+
+    >>> strings = StringTable()
+    >>> strings.intern('PEP8Bear'), strings.intern('a.py')
+    (1, 2)
+    >>> strings.intern('PEP8Bear'), strings.intern(None)
+    (1, 0)
+    >>> strings[2]
+    'a.py'
+    """
+
+    def __init__(self):
+        self.strings = [None]
+        self._ids = {None: 0}
+
+    def intern(self, string):
+        """
+        :param string: A string or ``None``.
+        :return:       The id of the string, which is added to the table if
+                       it's not in there yet.
+        """
+        string_id = self._ids.get(string)
+        if string_id is None:
+            string_id = self._ids[string] = len(self.strings)
+            self.strings.append(string)
+        return string_id
+
+    def __getitem__(self, string_id):
+        return self.strings[string_id]
+
+    def __len__(self):
+        return len(self.strings)
+
+
+class ResultTable:
+    """
+    Stores results column by column, for post-processing large amounts of
+    results without keeping a ``Result`` object per result around.
+
+    Every result is one row. The strings are interned into a ``StringTable``
+    and the columns are arrays of integers, so a row takes a few dozen bytes.
+    Like ``Result.to_string_dict``, only the first ``SourceRange`` of the
+    affected code of a result is stored.
+
+    >>> table = ResultTable.from_results([
+    ...     Result.from_values('PEP8Bear', 'Line too long.', 'a.py', 3, 80),
+    ...     Result.from_values('PEP8Bear', 'Line too long.', 'b.py', 5),
+    ...     Result('LicenseBear', 'No license.', severity=2)])
+    >>> len(table)
+    3
+    >>> table.count_by('origin')
+    OrderedDict([('PEP8Bear', 2), ('LicenseBear', 1)])
+    >>> table.row(0)['start_column']
+    80
+
+    Rows can be selected by severity, file or origin:
+
+    >>> len(table.select(min_severity=2))
+    1
+    >>> file, = table.select(file_glob='**b.py').count_by('file')
+    >>> file.endswith('b.py')
+    True
+    """
+
+    # Maps the names of the columns to the typecodes of their arrays. The
+    # string columns hold ids of the string table, missing lines and columns
+    # are stored as 0.
+    COLUMNS = OrderedDict((('origin', 'I'),
+                           ('file', 'I'),
+                           ('start_line', 'I'),
+                           ('start_column', 'I'),
+                           ('end_line', 'I'),
+                           ('end_column', 'I'),
+                           ('severity', 'B'),
+                           ('confidence', 'B'),
+                           ('message', 'I'),
+                           ('debug_msg', 'I')))
+    STRING_COLUMNS = ('origin', 'file', 'message', 'debug_msg')
+
+    def __init__(self, strings=None):
+        """
+        Creates an empty table.
+
+        :param strings: The ``StringTable`` to intern the strings in. Tables
+                        selected from this one share it.
+        """
+        self.strings = StringTable() if strings is None else strings
+        self.columns = OrderedDict((name, array(typecode))
+                                   for name, typecode in self.COLUMNS.items())
+
+    @classmethod
+    def from_results(cls, results):
+        """
+        :param results: An iterable of results.
+        :return:        A ``ResultTable`` holding the results.
+        """
+        table = cls()
+        table.extend(results)
+        return table
+
+    def append(self, result):
+        """
+        Adds a result as row.
+
+        :param result: The result to add.
+        """
+        intern = self.strings.intern
+        columns = self.columns
+        if result.affected_code:
+            source_range = result.affected_code[0]
+            start, end = source_range.start, source_range.end
+            location = (intern(source_range.file),
+                        start.line or 0,
+                        start.column or 0,
+                        end.line or 0,
+                        end.column or 0)
+        else:
+            location = (0, 0, 0, 0, 0)
+
+        for name, value in zip(('file', 'start_line', 'start_column',
+                                'end_line', 'end_column'),
+                               location):
+            columns[name].append(value)
+        columns['origin'].append(intern(result.origin))
+        columns['severity'].append(result.severity)
+        columns['confidence'].append(result.confidence)
+        columns['message'].append(intern(result.message))
+        columns['debug_msg'].append(intern(result.debug_msg))
+
+    def extend(self, results):
+        """
+        Adds results as rows.
+
+        :param results: An iterable of results.
+        """
+        for result in results:
+            self.append(result)
+
+    def __len__(self):
+        return len(self.columns['origin'])
+
+    def column(self, name):
+        """
+        Exports a column without copying it. The table can't grow as long as
+        the returned view is alive.
+
+        :param name: The name of the column, one of ``COLUMNS``.
+        :return:     A ``memoryview`` of the column. The values of the string
+                     columns are ids of ``strings``.
+        """
+        return memoryview(self.columns[name])
+
+    def _value(self, name, value):
+        if name in self.STRING_COLUMNS:
+            return self.strings[value]
+        return value if value or name in ('severity', 'confidence') else None
+
+    def row(self, index):
+        """
+        :param index: The index of the row.
+        :return:      An ``OrderedDict`` mapping the column names to the
+                      values of the row, with the strings resolved and
+                      ``None`` for missing lines and columns.
+        """
+        return OrderedDict((name, self._value(name, column[index]))
+                           for name, column in self.columns.items())
+
+    def rows(self):
+        """
+        :return: An iterator over all rows, see ``row``.
+        """
+        return (self.row(index) for index in range(len(self)))
+
+    def affected_code(self, index):
+        """
+        :param index: The index of the row.
+        :return:      A tuple holding the ``SourceRange`` of the row, if it
+                      has one.
+        """
+        columns = self.columns
+        file = columns['file'][index]
+        if not file:
+            return ()
+        return (SourceRange.from_values(
+            self.strings[file],
+            *(columns[name][index] or None
+              for name in ('start_line', 'start_column',
+                           'end_line', 'end_column'))),)
+
+    def to_results(self):
+        """
+        :return: A list of new ``Result`` objects, one per row.
+        """
+        return [Result(row['origin'],
+                       row['message'],
+                       affected_code=self.affected_code(index),
+                       severity=row['severity'],
+                       debug_msg=row['debug_msg'],
+                       confidence=row['confidence'])
+                for index, row in enumerate(self.rows())]
+
+    def take(self, mask):
+        """
+        Selects rows.
+
+        :param mask: An iterable holding a truth value for every row.
+        :return:     A new ``ResultTable`` holding the rows whose truth value
+                     is true. It shares the string table with this one.
+        """
+        mask = bytes(map(bool, mask))
+        table = type(self)(self.strings)
+        for name, column in self.columns.items():
+            table.columns[name] = array(column.typecode,
+                                        itertools.compress(column, mask))
+        return table
+
+    def _string_mask(self, name, predicate):
+        # Evaluate the predicate only once per distinct string.
+        column = self.columns[name]
+        matching = {string_id for string_id in set(column)
+                    if predicate(self.strings[string_id])}
+        return map(matching.__contains__, column)
+
+    def select(self, min_severity=None, file_glob=None, origin=None):
+        """
+        Selects the rows matching all given criteria.
+
+        :param min_severity: The minimal severity of the rows.
+        :param file_glob:    A glob or a list of globs the file of the rows
+                             has to match, see
+                             ``coalib.parsing.Globbing.fnmatch``. The files
+                             are absolute paths.
+        :param origin:       A glob or a list of globs the origin of the rows
+                             has to match.
+        :return:             A new ``ResultTable`` holding the selected rows,
+                             see ``take``.
+        """
+        masks = []
+        if min_severity is not None:
+            masks.append(severity >= min_severity
+                         for severity in self.columns['severity'])
+        if file_glob is not None:
+            masks.append(self._string_mask(
+                'file',
+                lambda file: file is not None and fnmatch(file, file_glob)))
+        if origin is not None:
+            masks.append(self._string_mask(
+                'origin', lambda name: fnmatch(name, origin)))
+
+        if not masks:
+            return self.take(itertools.repeat(True, len(self)))
+        return self.take(masks[0] if len(masks) == 1
+                         else map(all, zip(*masks)))
+
+    def count_by(self, name):
+        """
+        Counts the rows per value of a column.
+
+        :param name: The name of the column.
+        :return:     An ``OrderedDict`` mapping the values to the number of
+                     rows having them, the most common first.
+        """
+        return OrderedDict((self._value(name, value), count)
+                           for value, count
+                           in Counter(self.columns[name]).most_common())
+
+    def __json__(self, use_relpath=False):
+        """
+        :param use_relpath: Whether to give the files relative to the current
+                            working directory.
+        :return:            A dictionary holding the ``strings`` and the
+                            ``columns`` as lists, so the table is serialized
+                            without creating a result per row.
+        """
+        strings = self.strings.strings
+        if use_relpath:
+            strings = list(strings)
+            for string_id in set(self.columns['file']) - {0}:
+                strings[string_id] = relpath(strings[string_id])
+
+        return OrderedDict((
+            ('strings', strings),
+            ('columns', OrderedDict((name, column.tolist())
+                                    for name, column
+                                    in self.columns.items()))))
@@ -1,3 +1,4 @@
+import sys
 from os.path import relpath, abspath
 
 from coala_utils.decorators import (
@@ -9,6 +10,8 @@ from coalib.results.TextPosition import TextPosition
 @generate_ordering('file', 'line', 'column')
 class SourcePosition(TextPosition):
 
+    __slots__ = ('_file',)
+
     @enforce_signature
     def __init__(self, file: str, line=None, column=None):
         """
@@ -25,7 +28,8 @@ class SourcePosition(TextPosition):
         """
         TextPosition.__init__(self, line, column)
 
-        self._file = abspath(file)
+        # Many positions point into the same files, so they share the names.
+        self._file = sys.intern(abspath(file))
 
     @property
     def file(self):
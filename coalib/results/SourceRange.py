@@ -8,6 +8,8 @@ from coalib.results.AbsolutePosition import AbsolutePosition
 
 class SourceRange(TextRange):
 
+    __slots__ = ()
+
     @enforce_signature
     def __init__(self,
                  start: SourcePosition,
@@ -85,6 +87,24 @@ class SourceRange(TextRange):
 
         return diff.rename if diff.rename is not False else self.file
 
+    @enforce_signature
+    def modified_range(self, file_diff_dict: dict):
+        """
+        Retrieves the range of the code this source range refers to after
+        applying the diffs in the given file_diff_dict, taking moved lines and
+        file renamings into account, see ``Diff.to_modified_range``.
+
+        :param file_diff_dict: A dictionary with filenames as key and their
+                               associated Diff objects as values.
+        :return:               The ``SourceRange`` in the patched file or
+                               ``None`` if all of its lines got deleted.
+        """
+        diff = file_diff_dict.get(self.file)
+        if diff is None:
+            return self
+
+        return diff.to_modified_range(self)
+
     def expand(self, file_contents):
         """
         Passes a new SourceRange that covers the same area of a file as this
@@ -1,5 +1,6 @@
 from coala_utils.decorators import (
     enforce_signature, generate_ordering, generate_repr)
+from coalib.misc.Slots import PickleSlots
 
 
 class ZeroOffsetError(ValueError):
@@ -8,7 +9,9 @@ class ZeroOffsetError(ValueError):
 
 @generate_repr('line', 'column')
 @generate_ordering('line', 'column')
-class TextPosition:
+class TextPosition(PickleSlots):
+
+    __slots__ = ('_line', '_column')
 
     @enforce_signature
     def __init__(self, line: (int, None) = None, column: (int, None) = None):
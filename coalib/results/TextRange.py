@@ -2,12 +2,15 @@ import copy
 
 from coala_utils.decorators import (
     enforce_signature, generate_ordering, generate_repr)
+from coalib.misc.Slots import PickleSlots
 from coalib.results.TextPosition import TextPosition
 
 
 @generate_repr('start', 'end')
 @generate_ordering('start', 'end')
-class TextRange:
+class TextRange(PickleSlots):
+
+    __slots__ = ('_start', '_end')
 
     @enforce_signature
     def __init__(self, start: TextPosition, end: (TextPosition, None) = None):
@@ -28,7 +31,8 @@ class TextRange:
         """
 
         self._start = start
-        self._end = copy.deepcopy(start) if end is None else end
+        # Positions only hold immutable values, no need to copy deeply.
+        self._end = copy.copy(start) if end is None else end
 
         if self._end < start:
             raise ValueError("End position can't be less than start position.")
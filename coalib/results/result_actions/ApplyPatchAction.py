@@ -1,5 +1,7 @@
+import os
 import shutil
-from os.path import isfile
+import tempfile
+from os.path import basename, dirname, isfile, realpath
 from os import remove
 
 from coala_utils.FileUtils import detect_encoding
@@ -8,12 +10,76 @@ from coalib.results.result_actions.ShowPatchAction import ShowPatchAction
 from coalib.results.result_actions.ResultAction import ResultAction
 
 
+def _write_atomically(filename, lines, encoding, mode_filename):
+    # Patch the target of symlinks like writing to them would.
+    filename = realpath(filename)
+    descriptor, temporary_filename = tempfile.mkstemp(
+        prefix='.' + basename(filename) + '.',
+        suffix='.tmp',
+        dir=dirname(filename))
+    try:
+        with open(descriptor, mode='w', encoding=encoding) as file:
+            file.writelines(lines)
+
+        if isfile(filename):
+            shutil.copymode(filename, temporary_filename)
+        elif isfile(mode_filename):
+            shutil.copymode(mode_filename, temporary_filename)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temporary_filename, 0o666 & ~umask)
+
+        os.replace(temporary_filename, filename)
+    except BaseException:
+        remove(temporary_filename)
+        raise
+
+
+def write_patched_file(filename, diff, pre_patch_filename):
+    """
+    Writes a patched file to disk, respecting renames and deletions. The file
+    is written to a temporary file next to it first, which then replaces it,
+    so it's never left half written.
+
+    :param filename:           The name of the file in the original file
+                               dictionary.
+    :param diff:               The diff holding all changes of the file.
+    :param pre_patch_filename: The name of the file on disk before the
+                               changes of the diff that aren't written yet.
+    """
+    if not diff.delete:
+        new_filename = (diff.rename
+                        if diff.rename is not False
+                        else filename)
+        _write_atomically(new_filename,
+                          diff.iter_modified(),
+                          encoding=detect_encoding(pre_patch_filename),
+                          mode_filename=pre_patch_filename)
+
+    if diff.delete or diff.rename:
+        if diff.rename != pre_patch_filename and isfile(
+                pre_patch_filename):
+            remove(pre_patch_filename)
+
+
 class ApplyPatchAction(ResultAction):
 
     SUCCESS_MESSAGE = 'Patch applied successfully.'
 
     is_applicable = staticmethod(ShowPatchAction.is_applicable)
 
+    def __init__(self, pending_files=None):
+        """
+        :param pending_files: A dictionary to collect the patched files in
+                              instead of writing them right away. It maps the
+                              file names to the names the files had on disk
+                              before they were patched. Use
+                              ``write_patched_file`` to write them, once all
+                              patches are applied.
+        """
+        self.pending_files = pending_files
+
     def apply(self,
               result,
               original_file_dict,
@@ -41,19 +107,13 @@ class ApplyPatchAction(ResultAction):
                     shutil.copy2(pre_patch_filename,
                                  pre_patch_filename + '.orig')
 
-            diff = file_diff_dict[filename]
-
-            if not diff.delete:
-                new_filename = (diff.rename
-                                if diff.rename is not False
-                                else filename)
-                with open(new_filename, mode='w',
-                          encoding=detect_encoding(pre_patch_filename)) as file:
-                    file.writelines(diff.modified)
-
-            if diff.delete or diff.rename:
-                if diff.rename != pre_patch_filename and isfile(
-                        pre_patch_filename):
-                    remove(pre_patch_filename)
+            if self.pending_files is None:
+                write_patched_file(filename,
+                                   file_diff_dict[filename],
+                                   pre_patch_filename)
+            else:
+                # The file stays on disk as it was before the first pending
+                # patch.
+                self.pending_files.setdefault(filename, pre_patch_filename)
 
         return file_diff_dict
@@ -1,4 +1,3 @@
-from pygments.lexers import guess_lexer_for_filename
 from pyprint.ConsolePrinter import ConsolePrinter
 
 from coalib.results.result_actions.ResultAction import ResultAction
@@ -52,6 +51,7 @@ def find_language(filename):
     :return:         The language used.
     """
 
+    from pygments.lexers import guess_lexer_for_filename
     return guess_lexer_for_filename(filename, 'Error, no file '
                                     'found').name
 
@@ -74,7 +74,7 @@ class IgnoreResultAction(ResultAction):
         new_filename = ignore_diff.rename if ignore_diff.rename else filename
         with open(new_filename, mode='w',
                   encoding=detect_encoding(new_filename)) as file:
-            file.writelines(ignore_diff.modified)
+            file.writelines(ignore_diff.iter_modified())
 
         return file_diff_dict
 
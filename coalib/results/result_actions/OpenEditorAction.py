@@ -184,14 +184,16 @@ class OpenEditorAction(ResultAction):
             }
 
         # Use dict to remove duplicates
-        filenames = {
-            src.file: {
+        filenames = {}
+        for src in result.affected_code:
+            # Open the files where the code is after the applied patches.
+            modified_range = src.modified_range(file_diff_dict)
+            start = (src if modified_range is None else modified_range).start
+            filenames[src.file] = {
                 'filename': src.renamed_file(file_diff_dict),
-                'line': src.start.line or 1,
-                'column': src.start.column or 1
+                'line': start.line or 1,
+                'column': start.column or 1
             }
-            for src in result.affected_code
-        }
 
         call_args = self.build_editor_call_args(editor, editor_info, filenames)
 
@@ -1,4 +1,5 @@
 import difflib
+from itertools import chain
 from os.path import relpath, join
 
 from pyprint.ConsolePrinter import ConsolePrinter
@@ -109,19 +110,21 @@ class ShowPatchAction(ResultAction):
         for filename, this_diff in sorted(result.diffs.items()):
             to_filename = this_diff.rename if this_diff.rename else filename
             to_filename = '/dev/null' if this_diff.delete else to_filename
-            original_file = original_file_dict[filename]
-            try:
+            if filename in file_diff_dict:
                 current_file = file_diff_dict[filename].modified
                 new_file = (file_diff_dict[filename] + this_diff).modified
-            except KeyError:
-                current_file = original_file
-                new_file = this_diff.modified
-
-            if tuple(current_file) != tuple(new_file):
-                print_beautified_diff(difflib.unified_diff(current_file,
-                                                           new_file,
-                                                           fromfile=filename,
-                                                           tofile=to_filename),
+                difflines = difflib.unified_diff(current_file,
+                                                 new_file,
+                                                 fromfile=filename,
+                                                 tofile=to_filename)
+            else:
+                # Stream the diff instead of building the patched file.
+                difflines = this_diff.iter_unified_diff(fromfile=filename,
+                                                        tofile=to_filename)
+
+            first_line = next(difflines, None)
+            if first_line is not None:
+                print_beautified_diff(chain((first_line,), difflines),
                                       printer)
             elif filename != to_filename:
                 print_from_name(printer, join('a', relpath(filename)))
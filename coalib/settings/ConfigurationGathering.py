@@ -1,11 +1,15 @@
+import hashlib
 import os
+import pickle
 import sys
 import logging
+from collections import OrderedDict
 
 from coalib.collecting.Collectors import (
     collect_all_bears_from_sections, filter_section_bears_by_languages)
 from coalib.bearlib.languages.Language import Language, UnknownLanguageError
 from coalib.misc import Constants
+from coalib.misc.CachingUtilities import pickle_dump, pickle_load
 from coalib.output.ConfWriter import ConfWriter
 from coalib.output.printers.LOG_LEVEL import LOG_LEVEL
 from coalib.parsing.CliParsing import parse_cli, check_conflicts
@@ -105,6 +109,95 @@ def merge_section_dicts(lower, higher):
     return lower
 
 
+CONFIG_CACHE_IDENTIFIER = 'parsed_config_files'
+# The maximal number of config files whose sections are stored.
+CONFIG_CACHE_SIZE = 64
+
+# Maps the paths of config files to the coala and Python versions they were
+# parsed with, the digest of their contents and their pickled sections, loaded
+# lazily from the user data directory. The most recently parsed files come
+# last.
+_parsed_config_files = None
+
+
+class _WarningDetector(logging.Handler):
+    """
+    Remembers whether anything was logged while it is attached.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.triggered = False
+
+    def emit(self, record):
+        self.triggered = True
+
+    def __enter__(self):
+        logging.getLogger().addHandler(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        logging.getLogger().removeHandler(self)
+
+
+def parse_config_file(filename):
+    """
+    Parses a config file with the ``ConfParser``. The parsed sections are
+    stored in the user data directory together with a digest of the file
+    content, so parsing is skipped in later runs as long as neither the file
+    nor the coala and Python versions are changed.
+
+    Files which cause warnings while being parsed are not stored, so the
+    warnings are shown on every run.
+
+    :param filename:           The config file or a directory containing a
+                               ``.coafile``.
+    :raises FileNotFoundError: If the file doesn't exist.
+    :return:                   A dictionary with (lowercase) section names as
+                               keys and their ``Section`` objects as values.
+    """
+    global _parsed_config_files
+    if os.path.isdir(filename):
+        filename = os.path.join(filename, Constants.default_coafile)
+
+    with open(filename, 'rb') as file:
+        digest = hashlib.sha1(file.read()).hexdigest()
+
+    if _parsed_config_files is None:
+        _parsed_config_files = OrderedDict(
+            pickle_load(None, CONFIG_CACHE_IDENTIFIER, {}))
+
+    version = Constants.VERSION, sys.version_info[:3]
+    cached = _parsed_config_files.get(filename)
+    if cached is not None and cached[:2] == (version, digest):
+        try:
+            # Unpickling creates new sections every time, so the cached ones
+            # are never modified by merging them.
+            return pickle.loads(cached[2])
+        except (pickle.UnpicklingError, AttributeError, ImportError,
+                EOFError, TypeError):
+            pass
+
+    with _WarningDetector() as detector:
+        sections = ConfParser().parse(filename)
+
+    if not detector.triggered:
+        # Forget files that were deleted, e.g. temporary ones, and the least
+        # recently parsed files if there are too many.
+        for cached_filename in list(_parsed_config_files):
+            if not os.path.isfile(cached_filename):
+                del _parsed_config_files[cached_filename]
+        _parsed_config_files.pop(filename, None)
+        while len(_parsed_config_files) >= CONFIG_CACHE_SIZE:
+            _parsed_config_files.popitem(last=False)
+
+        _parsed_config_files[filename] = (version, digest,
+                                          pickle.dumps(sections))
+        pickle_dump(None, CONFIG_CACHE_IDENTIFIER, _parsed_config_files)
+
+    return sections
+
+
 def load_config_file(filename, log_printer=None, silent=False):
     """
     Loads sections from a config file. Prints an appropriate warning if
@@ -124,7 +217,7 @@ def load_config_file(filename, log_printer=None, silent=False):
     filename = os.path.abspath(filename)
 
     try:
-        return ConfParser().parse(filename)
+        return parse_config_file(filename)
     except FileNotFoundError:
         if not silent:
             if os.path.basename(filename) == Constants.default_coafile:
@@ -399,12 +492,17 @@ def get_config_directory(section):
 def get_all_bears(log_printer=None,
                   arg_parser=None,
                   silent=True,
-                  bear_globs=('**',)):
+                  bear_globs=('**',),
+                  lazy=False):
     """
     :param log_printer: The log_printer to handle logging.
     :param arg_parser:  An ``ArgParser`` object.
     :param silent:      Whether or not to display warnings.
     :param bear_globs:  List of glob patterns.
+    :param lazy:        Whether to return ``BearManifestEntry`` objects
+                        instead of bear classes. Use
+                        ``coalib.collecting.Collectors.load_section_bears``
+                        to import the bear classes afterwards.
     :return:            Tuple containing dictionaries of unsorted local
                         and global bears.
     """
@@ -412,7 +510,7 @@ def get_all_bears(log_printer=None,
                                      arg_parser=arg_parser,
                                      silent=silent)
     local_bears, global_bears = collect_all_bears_from_sections(
-        sections, bear_globs=bear_globs)
+        sections, bear_globs=bear_globs, lazy=lazy)
     return local_bears, global_bears
 
 
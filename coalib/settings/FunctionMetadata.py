@@ -1,6 +1,7 @@
 from collections import OrderedDict
 from copy import copy
 from inspect import getfullargspec, ismethod
+from weakref import WeakKeyDictionary
 
 from coala_utils.decorators import enforce_signature
 from coalib.settings.DocstringMetadata import DocstringMetadata
@@ -10,6 +11,10 @@ class FunctionMetadata:
     str_nodesc = 'No description given.'
     str_optional = "Optional, defaults to '{}'."
 
+    # Maps functions to the metadata extracted from them by ``from_function``,
+    # see ``invalidate_cache``.
+    _cache = WeakKeyDictionary()
+
     @enforce_signature
     def __init__(self,
                  name: str,
@@ -122,13 +127,11 @@ class FunctionMetadata:
         """
         params = {}
 
-        for param in self.non_optional_params:
-            _, annotation = self.non_optional_params[param]
+        for param, (_, annotation) in self.non_optional_params.items():
             params[param] = self._get_param(param, section, annotation)
 
-        for param in self.optional_params:
+        for param, (_, annotation, _) in self.optional_params.items():
             if param in section:
-                _, annotation, _ = self.optional_params[param]
                 params[param] = self._get_param(param, section, annotation)
 
         return params
@@ -155,6 +158,11 @@ class FunctionMetadata:
         an actual INSTANCE of a class; passing the method of the class isn't
         enough. Alternatively you can add "self" to the omit set.
 
+        The signature and docstring of a function are only inspected once,
+        the extracted metadata is cached until ``invalidate_cache`` is called
+        for the function. A new ``FunctionMetadata`` object is returned on
+        every call, so it can be modified freely.
+
         :param func: The function. If __metadata__ of the unbound function is
                      present it will be copied and used, otherwise it will be
                      generated.
@@ -167,6 +175,65 @@ class FunctionMetadata:
             metadata.omit = omit
             return metadata
 
+        # Bound methods are created on every attribute access, the metadata
+        # is therefore cached for the underlying function.
+        function = func.__func__ if ismethod(func) else func
+        key = (cls, ismethod(func))
+        try:
+            cached = cls._cache.setdefault(function, {})
+        except TypeError:  # Not weakly referenceable, e.g. a builtin.
+            cached = {}
+
+        if key not in cached:
+            cached[key] = cls._extract_metadata(func)
+
+        name, desc, retval_desc, non_optional_params, optional_params = (
+            cached[key])
+        return cls(name=name,
+                   desc=desc,
+                   retval_desc=retval_desc,
+                   non_optional_params=OrderedDict(non_optional_params),
+                   optional_params=OrderedDict(optional_params),
+                   omit=omit)
+
+    @classmethod
+    def invalidate_cache(cls, func=None):
+        """
+        Drops the metadata cached by ``from_function``. This is needed if the
+        signature or the docstring of a function are changed after metadata
+        was created from it.
+
+        >>> def f(a):
+        ...     pass
+        >>> list(FunctionMetadata.from_function(f).non_optional_params)
+        ['a']
+        >>> f.__doc__ = ':param a: The a.'
+        >>> FunctionMetadata.invalidate_cache(f)
+        >>> FunctionMetadata.from_function(f).non_optional_params['a'][0]
+        'The a.'
+
+        :param func: The function (or bound method) whose metadata is to be
+                     dropped. The whole cache is cleared if not given.
+        """
+        if func is None:
+            cls._cache.clear()
+        else:
+            try:
+                cls._cache.pop(func.__func__ if ismethod(func) else func, None)
+            except TypeError:
+                pass
+
+    @classmethod
+    def _extract_metadata(cls, func):
+        """
+        Inspects the signature and docstring of a function.
+
+        :param func: The function.
+        :return:     A tuple of the name, description, return value
+                     description, non optional and optional parameters of
+                     the function. The parameters are given as tuples of
+                     ``(name, metadata)`` pairs.
+        """
         doc = func.__doc__ or ''
         doc_comment = DocstringMetadata.from_docstring(doc)
 
@@ -194,12 +261,11 @@ class FunctionMetadata:
                     argspec.annotations.get(arg, None),
                     defaults[i-num_non_defaults])
 
-        return cls(name=func.__name__,
-                   desc=doc_comment.desc,
-                   retval_desc=doc_comment.retval_desc,
-                   non_optional_params=non_optional_params,
-                   optional_params=optional_params,
-                   omit=omit)
+        return (func.__name__,
+                doc_comment.desc,
+                doc_comment.retval_desc,
+                tuple(non_optional_params.items()),
+                tuple(optional_params.items()))
 
     def filter_parameters(self, dct):
         """
@@ -138,7 +138,8 @@ class Section:
     def bear_dirs(self):
         bear_dirs = path_list(self.get('bear_dirs', ''))
         for bear_dir in bear_dirs:
-            sys.path.append(bear_dir)
+            if bear_dir not in sys.path:
+                sys.path.append(bear_dir)
         bear_dir_globs = [
             os.path.join(glob_escape(bear_dir), '**')
             for bear_dir in bear_dirs]
@@ -5,7 +5,7 @@ import logging
 from coalib.bears.BEAR_KIND import BEAR_KIND
 from coalib.collecting import Dependencies
 from coalib.collecting.Collectors import (
-    collect_bears, collect_bears_by_aspects)
+    bear_collection_cache, collect_bears, collect_bears_by_aspects)
 from coalib.settings.Setting import Setting
 
 
@@ -60,6 +60,7 @@ def fill_section(section, acquire_settings, log_printer, bears):
     return section
 
 
+@bear_collection_cache()
 def fill_settings(sections,
                   targets,
                   acquire_settings,
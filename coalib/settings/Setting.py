@@ -1,5 +1,7 @@
+import copy
 import os
 from collections import Iterable, OrderedDict
+from functools import wraps
 
 from coala_utils.decorators import (
     enforce_signature,
@@ -59,6 +61,57 @@ def language(name):
         raise ValueError(e)
 
 
+def _is_stable(function):
+    """
+    Checks whether a conversion function is the same object whenever the code
+    creating a converter with it runs, so it can be part of a ``cache_key``.
+    That's the case for types and functions defined at module level, but not
+    for lambdas or functions defined inside other functions.
+
+    >>> _is_stable(int), _is_stable(_is_stable)
+    (True, True)
+    >>> _is_stable(lambda value: value)
+    False
+
+    :param function: The conversion function.
+    :return:         True if the function is stable.
+    """
+    if isinstance(function, type):
+        return True
+    qualname = getattr(function, '__qualname__', '<')
+    return (getattr(function, '__closure__', None) is None and
+            '<' not in qualname)
+
+
+def _cache_conversion(convert):
+    """
+    Makes the ``__call__`` method of a converter class reuse earlier
+    conversions of the same ``Setting``, see ``Setting._convert``.
+
+    The conversions are keyed by the ``cache_key`` of the converter class,
+    which holds the kind of converter and its arguments. So converters
+    created anew for every conversion, like ``typed_list(str)``, reuse the
+    conversions of equal converters. Converters with unhashable arguments or
+    a ``cache_key`` of ``None``, e.g. because their conversion functions
+    aren't stable (see ``_is_stable``), aren't cached.
+
+    :param convert: The ``__call__`` method to decorate.
+    :return:        The decorated method.
+    """
+    @wraps(convert)
+    def cached_convert(converter, setting):
+        if isinstance(setting, Setting) and converter.cache_key is not None:
+            try:
+                hash(converter.cache_key)
+            except TypeError:
+                return convert(converter, setting)
+            return setting._convert(converter.cache_key,
+                                    lambda: convert(converter, setting))
+        return convert(converter, setting)
+
+    return cached_convert
+
+
 def typed_list(conversion_func):
     """
     Creates a class that converts a setting into a list of elements each
@@ -71,6 +124,10 @@ def typed_list(conversion_func):
 
     class Converter:
 
+        cache_key = (('typed_list', conversion_func)
+                     if _is_stable(conversion_func) else None)
+
+        @_cache_conversion
         def __call__(self, setting):
             return [conversion_func(StringConverter(elem))
                     for elem in setting]
@@ -105,6 +162,11 @@ def typed_dict(key_type, value_type, default):
 
     class Converter:
 
+        cache_key = (('typed_dict', key_type, value_type, default)
+                     if _is_stable(key_type) and _is_stable(value_type)
+                     else None)
+
+        @_cache_conversion
         def __call__(self, setting):
             return {key_type(StringConverter(key)):
                     value_type(StringConverter(value))
@@ -131,6 +193,11 @@ def typed_ordered_dict(key_type, value_type, default):
 
     class Converter:
 
+        cache_key = (('typed_ordered_dict', key_type, value_type, default)
+                     if _is_stable(key_type) and _is_stable(value_type)
+                     else None)
+
+        @_cache_conversion
         def __call__(self, setting):
             return OrderedDict((key_type(StringConverter(key)),
                                 value_type(StringConverter(value))
@@ -144,6 +211,30 @@ def typed_ordered_dict(key_type, value_type, default):
     return Converter()
 
 
+def _path(obj, origin, glob_escape_origin):
+    """
+    Determines the path of a setting or string, see ``Setting.__path__``.
+    """
+    strrep = str(obj).strip()
+    if os.path.isabs(strrep):
+        return strrep
+
+    if hasattr(obj, 'origin') and obj.origin != '':
+        origin = obj.origin
+
+    if origin is None:
+        raise ValueError('Cannot determine path without origin.')
+
+    # We need to get full path before escaping since the full path
+    # may introduce unintended glob characters
+    origin = os.path.abspath(os.path.dirname(origin))
+
+    if glob_escape_origin:
+        origin = glob_escape(origin)
+
+    return os.path.normpath(os.path.join(origin, strrep))
+
+
 @generate_repr('key', 'value', 'origin', 'from_cli', 'to_append')
 class Setting(StringConverter):
     """
@@ -186,6 +277,7 @@ class Setting(StringConverter):
                                            the defaults of a section.
         """
         self.to_append = to_append
+        self._conversions = {}
 
         StringConverter.__init__(
             self,
@@ -216,24 +308,11 @@ class Setting(StringConverter):
         :raises ValueError:        If no origin is specified in the setting
                                    nor the given origin parameter.
         """
-        strrep = str(self).strip()
-        if os.path.isabs(strrep):
-            return strrep
-
-        if hasattr(self, 'origin') and self.origin != '':
-            origin = self.origin
-
-        if origin is None:
-            raise ValueError('Cannot determine path without origin.')
-
-        # We need to get full path before escaping since the full path
-        # may introduce unintended glob characters
-        origin = os.path.abspath(os.path.dirname(origin))
-
-        if glob_escape_origin:
-            origin = glob_escape(origin)
-
-        return os.path.normpath(os.path.join(origin, strrep))
+        if isinstance(self, Setting):
+            return self._convert(
+                ('path', origin, glob_escape_origin, os.getcwd()),
+                lambda: _path(self, origin, glob_escape_origin))
+        return _path(self, origin, glob_escape_origin)
 
     def __glob__(self, origin=None):
         """
@@ -258,7 +337,9 @@ class Setting(StringConverter):
 
         :return: A list of absolute paths.
         """
-        return [Setting.__path__(elem, self.origin) for elem in self]
+        return self._convert(
+            ('path_list', os.getcwd()),
+            lambda: [_path(elem, self.origin, False) for elem in self])
 
     def __glob_list__(self):
         """
@@ -268,7 +349,9 @@ class Setting(StringConverter):
         :return: A list of absolute paths in which the special characters in
                  the parent directories of the setting are escaped.
         """
-        return [Setting.__glob__(elem, self.origin) for elem in self]
+        return self._convert(
+            ('glob_list', os.getcwd()),
+            lambda: [_path(elem, self.origin, True) for elem in self])
 
     def __iter__(self, remove_backslashes=True):
         if self.to_append:
@@ -296,3 +379,59 @@ class Setting(StringConverter):
                              'incomplete. Please access the value of the '
                              'setting in a section to get the complete value.')
         return self._value
+
+    @value.setter
+    def value(self, value):
+        StringConverter.value.fset(self, value)
+        self._conversions = {}
+
+    def _convert(self, key, conversion):
+        """
+        Converts the value of this setting, reusing the result of an earlier
+        conversion with the same key and origin. The cache is dropped when a
+        new value is assigned.
+
+        >>> setting = Setting('key', '1, 2')
+        >>> setting._convert('example', lambda: list(setting))
+        ['1', '2']
+        >>> setting._convert('example', lambda: [])
+        ['1', '2']
+        >>> setting.value = '3'
+        >>> setting._convert('example', lambda: list(setting))
+        ['3']
+
+        :param key:        A hashable key identifying the conversion, e.g. the
+                           converter.
+        :param conversion: A function performing the conversion.
+        :return:           A shallow copy of the converted value, so callers
+                           can't modify the cached one.
+        """
+        if self.to_append:
+            return conversion()
+
+        key = (key, self.origin)
+        try:
+            result = self._conversions[key]
+        except KeyError:
+            result = self._conversions[key] = conversion()
+        return copy.copy(result)
+
+    def __deepcopy__(self, memo):
+        # Sections hand out deep copies of their settings on every access.
+        # The converted values of a setting are only ever replaced, never
+        # modified, so copies can share them. Conversions of a copy are only
+        # cached in the copy.
+        result = object.__new__(type(self))
+        result.__dict__.update(self.__dict__)
+        result._conversions = self._conversions.copy()
+        return result
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Converters are often local classes which can't be pickled.
+        del state['_conversions']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._conversions = {}
@@ -410,7 +410,8 @@ if __name__ == '__main__':
                             'makman@alice.de'),
           url='http://coala.io/',
           platforms='any',
-          packages=find_packages(exclude=('build.*', 'tests', 'tests.*')),
+          packages=find_packages(exclude=('benchmarks', 'benchmarks.*',
+                                          'build.*', 'tests', 'tests.*')),
           install_requires=required,
           extras_require=EXTRAS_REQUIRE,
           tests_require=test_required,
@@ -1,6 +1,7 @@
 from contextlib import contextmanager
 import os
 import sys
+import tempfile
 import unittest.mock
 
 from coala_utils.ContextManagers import retrieve_stdout, retrieve_stderr
@@ -130,3 +131,21 @@ def bear_test_module():
     with unittest.mock.patch('pkg_resources.iter_entry_points',
                              return_value=[EntryPoint()]) as mocked:
         yield
+
+
+def isolate_user_data_dir(test_case):
+    """
+    Redirects the caches coala stores in the user data directory to a
+    temporary directory for the duration of a test.
+
+    :param test_case: The ``unittest.TestCase`` running the test, usually
+                      called in its ``setUp`` method.
+    :return:          The path to the temporary directory.
+    """
+    directory = tempfile.TemporaryDirectory()
+    test_case.addCleanup(directory.cleanup)
+    patcher = unittest.mock.patch('coalib.misc.Constants.USER_DATA_DIR',
+                                  directory.name)
+    patcher.start()
+    test_case.addCleanup(patcher.stop)
+    return directory.name
@@ -4,14 +4,16 @@ import os
 import re
 import sys
 import unittest
-from unittest.mock import ANY, Mock
+from unittest.mock import ANY, Mock, patch
 
 from coalib.bearlib.abstractions.Linter import linter
+from coalib.misc.PrerequisiteCache import PrerequisiteCache
 from coalib.results.Diff import Diff
 from coalib.results.Result import Result
 from coalib.results.RESULT_SEVERITY import RESULT_SEVERITY
 from coalib.results.SourceRange import SourceRange
 from coalib.settings.Section import Section
+from tests.TestUtilities import isolate_user_data_dir
 
 WINDOWS = platform.system() == 'Windows'
 
@@ -58,6 +60,7 @@ class LinterComponentTest(unittest.TestCase):
             pass
 
     def setUp(self):
+        isolate_user_data_dir(self)
         self.section = Section('TEST_SECTION')
 
     def test_decorator_invalid_parameters(self):
@@ -273,6 +276,18 @@ class LinterComponentTest(unittest.TestCase):
                (self.ManualProcessingTestLinter))
         self.assertEqual(uut.check_prerequisites(), 'NOPE')
 
+    def test_check_prerequisites_cached(self):
+        uut = (linter(sys.executable,
+                      prerequisite_check_command=(sys.executable, '--version'))
+               (self.ManualProcessingTestLinter))
+        with patch('coalib.bearlib.abstractions.Linter.'
+                   'get_prerequisite_cache',
+                   return_value=PrerequisiteCache(persistent=False)), \
+                patch('coalib.bearlib.abstractions.Linter.check_call') as call:
+            self.assertTrue(uut.check_prerequisites())
+            self.assertTrue(uut.check_prerequisites())
+            self.assertEqual(call.call_count, 1)
+
     def test_output_stream(self):
         process_output_mock = Mock()
 
@@ -1007,6 +1022,7 @@ class LinterComponentTest(unittest.TestCase):
 class LocalLinterReallifeTest(unittest.TestCase):
 
     def setUp(self):
+        isolate_user_data_dir(self)
         self.section = Section('REALLIFE_TEST_SECTION')
 
         self.test_program_path = get_testfile_name('test_linter.py')
@@ -1282,6 +1298,7 @@ class LocalLinterReallifeTest(unittest.TestCase):
 class GlobalLinterReallifeTest(unittest.TestCase):
 
     def setUp(self):
+        isolate_user_data_dir(self)
         self.section = Section('REALLIFE_TEST_SECTION')
 
         self.test_program_path = get_testfile_name('test_linter.py')
@@ -29,12 +29,13 @@ from coalib.results.TextPosition import ZeroOffsetError
 from coalib.output.printers.LOG_LEVEL import LOG_LEVEL
 from coalib.output.printers.LogPrinter import LogPrinter
 from coalib.processes.communication.LogMessage import LogMessage
+from coalib.settings.FunctionMetadata import FunctionMetadata
 from coalib.settings.Section import Section
 from coalib.settings.Setting import Setting, language
 from pyprint.ConsolePrinter import ConsolePrinter
 from coala_utils.ContextManagers import prepare_file
 
-from tests.TestUtilities import bear_test_module
+from tests.TestUtilities import bear_test_module, isolate_user_data_dir
 
 
 class BadTestBear(Bear):
@@ -101,6 +102,13 @@ class TypedTestBear(Bear):
         return []
 
 
+class ModifyingTestBear(LocalBear):
+
+    def run(self, filename, file, values: list):
+        values.append(filename)
+        yield tuple(values)
+
+
 class ZeroOffsetLocalBear(LocalBear):
 
     def __init__(self, section, queue, error_message):
@@ -205,6 +213,7 @@ class BearWithLanguage(Bear):
 class BearTestBase(unittest.TestCase):
 
     def setUp(self):
+        isolate_user_data_dir(self)
         self.queue = multiprocessing.Queue()
         self.settings = Section('test_settings')
         self.uut = TestBear(self.settings, self.queue)
@@ -389,6 +398,51 @@ class BearTest(BearTestBase):
         self.assertTrue(self.queue.empty())
         self.assertFalse(self.uut.was_executed)
 
+    def test_inconvertible_reported_once(self):
+        self.uut = TypedTestBear(self.settings, self.queue)
+        self.settings.append(Setting('something', 'nonsense'))
+        self.assertIsNone(self.uut.bind_section_params())
+        self.check_message(LOG_LEVEL.WARNING)
+        for _ in range(3):
+            self.uut.execute()
+            self.check_message(LOG_LEVEL.DEBUG)
+        self.assertTrue(self.queue.empty())
+        self.assertFalse(self.uut.was_executed)
+
+    def test_bind_section_params(self):
+        self.settings.append(Setting('x', '85'))
+        self.settings.append(Setting('y', 'kbc3'))
+        uut = TestOneBear(self.settings, self.queue)
+        with patch.object(FunctionMetadata, 'create_params_from_section',
+                          autospec=True,
+                          side_effect=FunctionMetadata
+                          .create_params_from_section) as create_params:
+            params = uut.bind_section_params()
+            self.assertEqual(params, {'x': 85, 'y': 'kbc3'})
+            for _ in range(3):
+                self.assertEqual(list(uut.run_bear_from_section((), {})),
+                                 [1, 2])
+            self.assertIs(uut.bind_section_params(), params)
+            self.assertEqual(create_params.call_count, 1)
+
+            self.settings.append(Setting('z', '42'))
+            self.assertEqual(uut.bind_section_params(),
+                             {'x': 85, 'y': 'kbc3', 'z': 42})
+            self.settings['x'].value = '1'
+            self.assertEqual(uut.bind_section_params()['x'], 85)
+            self.settings.contents['x'].value = '1'
+            self.assertEqual(uut.bind_section_params()['x'], 1)
+            self.assertEqual(create_params.call_count, 3)
+
+    def test_bound_params_copied(self):
+        self.settings.append(Setting('values', 'a, b'))
+        uut = ModifyingTestBear(self.settings, self.queue)
+        for filename in ('f1', 'f2'):
+            self.assertEqual(
+                list(uut.run_bear_from_section((filename, ()), {})),
+                [('a', 'b', filename)])
+        self.assertEqual(uut.bind_section_params(), {'values': ['a', 'b']})
+
     def check_message(self, log_level, message=None, regex=False):
         msg = self.queue.get()
         self.assertIsInstance(msg, LogMessage)
@@ -0,0 +1,36 @@
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks.__main__ import main
+from benchmarks.suite import BENCHMARKS
+
+
+class benchmarksTest(unittest.TestCase):
+
+    def test_run(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'results.json')
+            self.assertEqual(main(['--files', '2', '--lines', '10',
+                                   '--results', '2', '--repeat', '1',
+                                   '--output', output]), 0)
+            with open(output) as file:
+                results = json.load(file)
+
+            self.assertEqual(list(results['benchmarks']), list(BENCHMARKS))
+            self.assertEqual(results['project']['files'], 2)
+            for timing in results['benchmarks'].values():
+                self.assertEqual(timing['runs'], 1)
+                self.assertGreaterEqual(timing['median'], 0)
+            self.assertGreater(results['memory']['bytes_per_result'], 0)
+
+            compared = os.path.join(directory, 'compared.json')
+            main(['--files', '2', '--lines', '10', '--repeat', '1',
+                  '--benchmarks', 'collect_files', 'get_file_dict',
+                  '--output', compared, '--compare', output])
+            with open(compared) as file:
+                benchmarks = json.load(file)['benchmarks']
+            self.assertEqual(list(benchmarks),
+                             ['collect_files', 'get_file_dict'])
+            self.assertIn('change', benchmarks['collect_files'])
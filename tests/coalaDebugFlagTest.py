@@ -7,7 +7,8 @@ from unittest.mock import MagicMock, patch
 from coalib import coala
 from coala_utils.ContextManagers import prepare_file
 
-from tests.TestUtilities import execute_coala, bear_test_module
+from tests.TestUtilities import (
+    execute_coala, bear_test_module, isolate_user_data_dir)
 
 
 # patch gets strangely lost when only defined in method or with context where
@@ -16,6 +17,7 @@ from tests.TestUtilities import execute_coala, bear_test_module
 class coalaDebugFlagTest(unittest.TestCase):
 
     def setUp(self):
+        isolate_user_data_dir(self)
         self.old_argv = sys.argv
 
     def pipReqIsInstalledMock(self):
@@ -4,13 +4,15 @@ import unittest
 
 from coalib import coala, coala_format
 from coala_utils.ContextManagers import prepare_file
-from tests.TestUtilities import bear_test_module, execute_coala
+from tests.TestUtilities import (
+    bear_test_module, execute_coala, isolate_user_data_dir)
 
 
 class coalaFormatTest(unittest.TestCase):
 
     def setUp(self):
         self.old_argv = sys.argv
+        isolate_user_data_dir(self)
 
     def tearDown(self):
         sys.argv = self.old_argv
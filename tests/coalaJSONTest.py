@@ -10,6 +10,7 @@ from coala_utils.ContextManagers import prepare_file
 from tests.TestUtilities import (
     bear_test_module,
     execute_coala,
+    isolate_user_data_dir,
     TEST_BEAR_NAMES,
     TEST_BEARS_COUNT,
     JAVA_BEARS_COUNT,
@@ -20,6 +21,7 @@ class coalaJSONTest(unittest.TestCase):
 
     def setUp(self):
         self.old_argv = sys.argv
+        isolate_user_data_dir(self)
 
     def tearDown(self):
         sys.argv = self.old_argv
@@ -57,6 +59,28 @@ class coalaJSONTest(unittest.TestCase):
                                 'results found')
             self.assertFalse(stderr)
 
+    def test_timings(self):
+        with bear_test_module(), \
+                prepare_file(['#fixme'], None) as (lines, filename), \
+                prepare_file([], None) as (_, trace_filename):
+            retval, stdout, stderr = execute_coala(coala.main, 'coala',
+                                                   '--json', '-c', os.devnull,
+                                                   '-b', 'LineCountTestBear',
+                                                   '-f', filename,
+                                                   '--timings',
+                                                   '--trace', trace_filename)
+            output = json.loads(stdout)
+            timings = output['timings']['cli']
+            self.assertEqual(list(timings['bears']), ['LineCountTestBear'])
+            self.assertEqual(list(timings['files']), [filename])
+            self.assertEqual(timings['runs'][0]['results'], 1)
+            self.assertFalse(stderr)
+
+            with open(trace_filename) as trace:
+                events = json.load(trace)['traceEvents']
+            self.assertEqual([event['args']['file'] for event in events],
+                             [filename])
+
     def test_fail_acquire_settings(self):
         with bear_test_module():
             retval, stdout, stderr = execute_coala(coala.main, 'coala',
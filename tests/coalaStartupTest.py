@@ -0,0 +1,52 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+
+# Imports ``coalib.coala``, runs ``coala`` with the given arguments and prints
+# the modules imported meanwhile as JSON. The startup time is measured by the
+# ``startup`` benchmark.
+STARTUP_SCRIPT = """
+import json, sys
+modules = set(sys.modules)
+sys.argv = ['coala'] + sys.argv[1:]
+from coalib.coala import main
+try:
+    main()
+except SystemExit:
+    pass
+print(json.dumps({'modules': sorted(set(sys.modules) - modules)}))
+"""
+
+# Dependencies which take long to import and aren't needed to start coala.
+DEFERRED_MODULES = ('dependency_management', 'pkg_resources', 'pygments',
+                    'requests', 'coalib.bearlib.languages',
+                    'coalib.collecting.Collectors')
+
+MAX_IMPORTED_MODULES = 150
+
+
+class coalaStartupTest(unittest.TestCase):
+
+    def get_startup(self, *args):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.check_output(
+            [sys.executable, '-c', STARTUP_SCRIPT] + list(args),
+            cwd=root,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True)
+        return json.loads(output.splitlines()[-1])
+
+    def assert_lightweight(self, *args):
+        startup = self.get_startup(*args)
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, startup['modules'])
+        self.assertLess(len(startup['modules']), MAX_IMPORTED_MODULES)
+
+    def test_version(self):
+        self.assert_lightweight('--version')
+
+    def test_help(self):
+        self.assert_lightweight('--help')
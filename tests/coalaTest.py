@@ -16,6 +16,7 @@ from coala_utils.ContextManagers import (
 from tests.TestUtilities import (
     bear_test_module,
     execute_coala,
+    isolate_user_data_dir,
     TEST_BEARS_COUNT,
     JAVA_BEARS_COUNT,
 )
@@ -28,6 +29,7 @@ class coalaTest(unittest.TestCase):
 
     def setUp(self):
         self.old_argv = sys.argv
+        isolate_user_data_dir(self)
 
     def tearDown(self):
         sys.argv = self.old_argv
@@ -51,6 +53,19 @@ class coalaTest(unittest.TestCase):
             self.assertNotEqual(retval, 0,
                                 'coala must return nonzero when errors occured')
 
+    def test_coala_timings(self):
+        with bear_test_module(), \
+                prepare_file(['#fixme'], None) as (lines, filename):
+            retval, stdout, stderr = execute_coala(
+                             coala.main,
+                             'coala', '-c', os.devnull,
+                             '--non-interactive', '--no-color',
+                             '-f', filename,
+                             '-b', 'LineCountTestBear',
+                             '--timings')
+            self.assertIn('Timings of section cli:', stdout)
+            self.assertRegex(stdout, r'LineCountTestBear\s+1\s')
+
     def test_coala2(self):
         with bear_test_module(), \
                 prepare_file(['#fixme'], None) as (lines, filename):
@@ -1,9 +1,13 @@
 import logging
 import os
 import pkg_resources
+import shutil
+import sys
+import tempfile
 import unittest
 
 from functools import partial
+from unittest.mock import patch
 from pyprint.ConsolePrinter import ConsolePrinter
 
 from testfixtures import LogCapture
@@ -15,13 +19,17 @@ from coalib.collecting.Collectors import (
     collect_all_bears_from_sections, collect_bears, collect_dirs, collect_files,
     collect_registered_bears_dirs, filter_section_bears_by_languages,
     get_all_bears, get_all_bears_names, collect_bears_by_aspects,
-    get_all_languages,
+    get_all_languages, match_dir_or_file_pattern, _DirOrFilePatternMatcher,
+    BearManifest, BearManifestEntry, load_section_bears,
+    bear_collection_cache, _import_bears, _installed_distributions,
     )
 from coalib.output.printers.LogPrinter import LogPrinter
 from coalib.output.printers.ListLogPrinter import ListLogPrinter
+from coalib.parsing.Globbing import iglob
 from coalib.settings.Section import Section
+from coalib.settings.Setting import Setting
 from tests.TestUtilities import (
-    bear_test_module, TEST_BEAR_NAMES, LANGUAGE_NAMES,
+    bear_test_module, isolate_user_data_dir, TEST_BEAR_NAMES, LANGUAGE_NAMES,
     LANGUAGE_COUNT,
 )
 
@@ -133,6 +141,61 @@ class CollectFilesTest(unittest.TestCase):
                                            'py_files',
                                            'file2.py'))])
 
+    def test_ignore_globs_expanded_once(self):
+        def dir_base(*args):
+            return os.path.normcase(os.path.join(self.collectors_test_dir,
+                                                 'others', *args))
+
+        with patch('coalib.collecting.Collectors.iglob',
+                   wraps=iglob) as mocked_iglob:
+            self.assertEqual(
+                collect_files([dir_base('**')],
+                              ignored_file_paths=[dir_base('py_files'),
+                                                  dir_base('*.txt'),
+                                                  dir_base('c_files', '**')]),
+                [])
+        # The files glob is walked directly, only the non-recursive ignore
+        # globs are expanded, once each.
+        self.assertEqual(mocked_iglob.call_count, 2)
+
+
+class DirOrFilePatternMatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        current_dir = os.path.split(__file__)[0]
+        self.others_dir = os.path.normcase(os.path.join(
+            current_dir, 'collectors_test_dir', 'others'))
+
+    def test_dir_pattern(self):
+        matcher = _DirOrFilePatternMatcher(
+            [os.path.join(self.others_dir, 'py_*')])
+        self.assertTrue(matcher(os.path.join(self.others_dir, 'py_files')))
+        self.assertTrue(matcher(os.path.join(self.others_dir,
+                                             'py_files', 'file1.py')))
+        # Directories only match whole path components.
+        self.assertFalse(matcher(os.path.join(self.others_dir,
+                                              'py_files2', 'file1.py')))
+        self.assertFalse(matcher(self.others_dir))
+
+    def test_file_pattern(self):
+        matcher = _DirOrFilePatternMatcher(
+            [os.path.join(self.others_dir, '*', 'file1.c')])
+        self.assertTrue(matcher(os.path.join(self.others_dir,
+                                             'c_files', 'file1.c')))
+        self.assertFalse(matcher(os.path.join(self.others_dir,
+                                              'c_files', 'file1.cpp')))
+
+    def test_recursive_pattern(self):
+        matcher = _DirOrFilePatternMatcher(
+            [os.path.join(self.others_dir, 'not_existing', '**')])
+        self.assertTrue(matcher(os.path.join(self.others_dir,
+                                             'not_existing', 'a', 'b.py')))
+        self.assertFalse(matcher(os.path.join(self.others_dir, 'a.py')))
+
+    def test_no_patterns(self):
+        self.assertFalse(_DirOrFilePatternMatcher()(self.others_dir))
+        self.assertFalse(match_dir_or_file_pattern(self.others_dir, []))
+
 
 class CollectDirsTest(unittest.TestCase):
 
@@ -245,6 +308,7 @@ class CollectBearsTest(unittest.TestCase):
                                                 'collectors_test_dir')
 
         self.log_printer = ListLogPrinter()
+        isolate_user_data_dir(self)
 
     def test_bear_empty(self):
         self.assertRaises(TypeError, collect_bears)
@@ -323,6 +387,41 @@ class CollectBearsTest(unittest.TestCase):
         self.assertEqual(len(local_bears['test_section']), 2)
         self.assertEqual(len(global_bears['test_section']), 2)
 
+    def test_bear_collection_cache(self):
+        bears_dir = os.path.join(self.collectors_test_dir, 'bears')
+        with patch('coalib.collecting.Collectors._import_bears',
+                   side_effect=_import_bears) as importer:
+            with bear_collection_cache():
+                for _ in range(3):
+                    self.assertEqual(
+                        len(collect_bears(bears_dir, ['bear1'], ['kind'])[0]),
+                        1)
+                with bear_collection_cache():
+                    collect_bears(bears_dir, ['bear1'], ['kind'])
+                self.assertEqual(importer.call_count, 1)
+            collect_bears(bears_dir, ['bear1'], ['kind'])
+            self.assertEqual(importer.call_count, 2)
+
+    def test_all_bears_from_sections_collected_once(self):
+        bear_dir = os.path.join(self.collectors_test_dir, 'bears_local_global')
+        sections = {}
+        for name in ('section1', 'section2', 'section3'):
+            sections[name] = Section(name)
+            sections[name].append(Setting('bear_dirs', bear_dir))
+
+        with patch('coalib.collecting.Collectors._import_bears',
+                   side_effect=_import_bears) as importer, \
+                patch('pkg_resources.iter_entry_points',
+                      return_value=[]) as iter_entry_points:
+            local_bears, global_bears = collect_all_bears_from_sections(
+                sections, self.log_printer)
+
+        self.assertEqual(importer.call_count, 2)
+        self.assertEqual(iter_entry_points.call_count, 1)
+        for name in sections:
+            self.assertEqual(len(local_bears[name]), 2)
+            self.assertEqual(len(global_bears[name]), 2)
+
     def test_aspect_bear(self):
         with bear_test_module():
             aspects = AspectList([
@@ -358,6 +457,137 @@ class CollectBearsTest(unittest.TestCase):
                          "[<class 'AspectTestBear.AspectTestBear'>]")
 
 
+class BearManifestTest(unittest.TestCase):
+
+    def setUp(self):
+        current_dir = os.path.split(__file__)[0]
+        self.bears_dir = os.path.join(current_dir, 'collectors_test_dir',
+                                      'bears')
+        self.stored = {}
+
+        def pickle_load(log_printer, identifier, fallback=None):
+            return self.stored.get(identifier, fallback)
+
+        def pickle_dump(log_printer, identifier, data):
+            self.stored[identifier] = data
+
+        for name, function in (('pickle_load', pickle_load),
+                               ('pickle_dump', pickle_dump)):
+            patcher = patch('coalib.collecting.Collectors.' + name,
+                            side_effect=function)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        patcher = patch('coalib.collecting.Collectors._bear_manifest',
+                        None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_entries(self):
+        uut = BearManifest()
+        entries = uut.entries(os.path.join(self.bears_dir, 'bear1.py'))
+        self.assertEqual([entry.name for entry in entries], ['TestBear'])
+        entry = entries[0]
+        self.assertIsInstance(entry, BearManifestEntry)
+        self.assertEqual(entry.kind(), 'kind')
+        self.assertEqual(entry.LANGUAGES, set())
+        self.assertEqual(entry.can_detect, set())
+        self.assertEqual(entry.load().__name__, 'TestBear')
+
+    def test_entries_cached(self):
+        uut = BearManifest()
+        path = os.path.join(self.bears_dir, 'bear1.py')
+        entries = uut.entries(path)
+        uut.write()
+
+        with patch('coalib.collecting.Collectors._import_bears') as importer:
+            self.assertIs(uut.entries(path), entries)
+            self.assertEqual(
+                [entry.name for entry in BearManifest().entries(path)],
+                ['TestBear'])
+            self.assertFalse(importer.called)
+
+    def test_entries_invalidated(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'ChangingBear.py')
+            shutil.copy(os.path.join(self.bears_dir, 'bear1.py'), path)
+            uut = BearManifest()
+            self.assertEqual([entry.name for entry in uut.entries(path)],
+                             ['TestBear'])
+
+            with open(path, 'a') as file:
+                file.write('\n\nclass OtherTestBear(TestBear):\n'
+                           '    pass\n')
+            # Modules are indexed again in later runs of coala.
+            del sys.modules['ChangingBear']
+            self.assertEqual(
+                sorted(entry.name for entry in uut.entries(path)),
+                ['OtherTestBear', 'TestBear'])
+
+    def test_version_changed(self):
+        uut = BearManifest()
+        uut.entries(os.path.join(self.bears_dir, 'bear1.py'))
+        uut.write()
+        with patch('coalib.collecting.Collectors.VERSION', '0.0.0'):
+            self.assertEqual(BearManifest()._modules, {})
+
+    def test_distributions_changed(self):
+        uut = BearManifest()
+        uut.entries(os.path.join(self.bears_dir, 'bear1.py'))
+        uut.write()
+        self.assertNotEqual(BearManifest()._modules, {})
+
+        # Installing or upgrading a distribution, e.g. a dependency of a bear,
+        # invalidates the manifest.
+        site_packages = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, site_packages)
+        os.mkdir(os.path.join(site_packages, 'dependency-1.0.dist-info'))
+        with patch.object(sys, 'path', sys.path + [site_packages]):
+            self.assertEqual(BearManifest()._modules, {})
+
+    def test_installed_distributions(self):
+        site_packages = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, site_packages)
+        for name in ('a-1.0.dist-info', 'b-2.0.egg-info', 'c'):
+            os.mkdir(os.path.join(site_packages, name))
+        with patch.object(sys, 'path', [site_packages,
+                                        '/nonexistent/d-3.0-py3.6.egg']):
+            self.assertEqual(_installed_distributions(),
+                             {'a-1.0.dist-info', 'b-2.0.egg-info',
+                              'd-3.0-py3.6.egg'})
+
+    def test_lazy_collection(self):
+        bears, = collect_bears(self.bears_dir, ['bear1', 'name'], ['kind'],
+                               lazy=True)
+        self.assertTrue(all(isinstance(bear, BearManifestEntry)
+                            for bear in bears))
+        self.assertEqual([bear.name for bear in bears], ['TestBear'] * 2)
+        self.assertIn('bear_manifest', self.stored)
+
+        loaded = load_section_bears({'section': bears})
+        self.assertEqual(
+            [bear.__name__ for bear in loaded['section']], ['TestBear'] * 2)
+
+    def test_load_removed_bear(self):
+        entry = BearManifest().entries(
+            os.path.join(self.bears_dir, 'bear1.py'))[0]
+        entry.name = 'RemovedBear'
+        with self.assertRaisesRegex(ImportError, 'RemovedBear'):
+            entry.load()
+        with LogCapture() as capture:
+            self.assertEqual(load_section_bears({'section': [entry]}),
+                             {'section': []})
+        self.assertIn('Unable to collect bears from', str(capture))
+
+    def test_aspect_bear_prefiltered(self):
+        with bear_test_module():
+            entries = get_all_bears(lazy=True)
+            aspect = get_aspect('unusedglobalvariable')('py')
+            self.assertEqual([entry.name for entry in entries
+                              if entry.may_analyze(aspect)],
+                             ['AspectTestBear'])
+
+
 class CollectorsTests(unittest.TestCase):
 
     def setUp(self):
@@ -365,6 +595,7 @@ class CollectorsTests(unittest.TestCase):
         self.collectors_test_dir = os.path.join(current_dir,
                                                 'collectors_test_dir')
         self.log_printer = LogPrinter(ConsolePrinter())
+        isolate_user_data_dir(self)
 
     def test_filter_section_bears_by_languages(self):
         test_section = Section('test_section')
@@ -16,6 +16,7 @@ from coalib.core.Bear import Bear
 from coalib.results.Result import Result
 from coalib.settings.Section import Section
 from coalib.settings.Setting import Setting
+from tests.TestUtilities import isolate_user_data_dir
 
 
 class Bear1(Bear):
@@ -76,6 +77,7 @@ class BearTest(unittest.TestCase):
 
     def setUp(self):
         super().setUp()
+        isolate_user_data_dir(self)
         self.teapot_url = 'https://www.google.com/teapot'
 
     def tearDown(self):
@@ -7,6 +7,7 @@ import unittest.mock
 from coalib.settings.Section import Section
 from coalib.core.Bear import Bear
 from coalib.core.Core import initialize_dependencies, run
+from coalib.misc.Timings import Timings
 
 from coala_utils.decorators import generate_eq
 
@@ -467,6 +468,20 @@ class CoreTest(CoreTestBase):
 
         self.assertEqual(bear.dependency_results, {})
 
+    def test_run_timings(self):
+        bear = CustomTasksBear(self.section1, self.filedict1,
+                               tasks=[('f1', 1), (2,)])
+        timings = Timings()
+
+        results = self.execute_run({bear}, timings=timings)
+
+        self.assertEqual(sorted(results, key=str), [1, 2, 'f1'])
+        self.assertEqual(list(timings.sections), ['test-section1'])
+        self.assertEqual(
+            sorted((timing.bear, timing.file or '', timing.results)
+                   for timing in timings.sections['test-section1']),
+            [('CustomTasksBear', '', 1), ('CustomTasksBear', 'f1', 2)])
+
     def test_run_complex(self):
         # Run a complete dependency chain.
         bear_e = BearE_NeedsAD(self.section1, self.filedict1)
@@ -908,6 +923,23 @@ class CoreCacheTest(CoreTestBase):
             self.assertIn(CustomTasksBear, cache)
             self.assertEqual(len(next(iter(cache.values()))), 2)
 
+    def test_cache_timings(self):
+        bear = CustomTasksBear(Section('test-section'), {}, tasks=[(1, 2)])
+        cache = {}
+
+        timings = Timings()
+        results = self.execute_run({bear}, cache, timings=timings)
+        self.assertEqual(results, [1, 2])
+        self.assertEqual(len(timings.sections['test-section']), 1)
+        # Only the results are cached.
+        self.assertEqual(list(next(iter(cache.values())).values()), [[1, 2]])
+
+        # Cache hits don't run the bear, so nothing is recorded.
+        timings = Timings()
+        results = self.execute_run({bear}, cache, timings=timings)
+        self.assertEqual(results, [1, 2])
+        self.assertEqual(timings.sections, {})
+
     def test_existing_cache_with_unrelated_data(self):
         section = Section('test-section')
         filedict = {}
@@ -4,7 +4,7 @@ from coalib.core.Core import run
 
 
 class CoreTestBase(unittest.TestCase):
-    def execute_run(self, bears, cache=None, executor=None):
+    def execute_run(self, bears, cache=None, executor=None, timings=None):
         """
         Executes a coala run and returns the results.
 
@@ -22,6 +22,8 @@ class CoreTestBase(unittest.TestCase):
             will be used.
         :param executor:
             The executor to run bears on.
+        :param timings:
+            A ``Timings`` object to record the timings of the tasks in.
         :return:
             A list of results.
         """
@@ -36,6 +38,6 @@ class CoreTestBase(unittest.TestCase):
         def capture_results(result):
             results.append(result)
 
-        run(bears, capture_results, cache, executor)
+        run(bears, capture_results, cache, executor, timings)
 
         return results
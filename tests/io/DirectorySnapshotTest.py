@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from coalib.collecting.Collectors import collect_dirs, collect_files
+from coalib.io import DirectorySnapshot as DirectorySnapshotModule
+from coalib.io.DirectorySnapshot import (
+    DirectorySnapshot, directory_snapshot, isdir, isfile, scandir)
+
+
+class DirectorySnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.path = self.test_dir.name
+        os.mkdir(os.path.join(self.path, 'dir'))
+        with open(os.path.join(self.path, 'file.py'), 'w'):
+            pass
+        self.uut = DirectorySnapshot()
+
+        self.scanned_dirs = []
+        original_scandir = os.scandir
+
+        def scandir(path):
+            self.scanned_dirs.append(path)
+            return original_scandir(path)
+
+        patcher = patch('os.scandir', side_effect=scandir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.test_dir.cleanup()
+
+    def test_scandir_cached(self):
+        names = sorted(entry.name for entry in self.uut.scandir(self.path))
+        self.assertEqual(names, ['dir', 'file.py'])
+        self.uut.scandir(self.path)
+        self.uut.scandir(os.path.join(self.path, 'dir', os.pardir))
+        self.assertEqual(len(self.scanned_dirs), 1)
+
+    def test_scandir_invalidated(self):
+        self.uut.scandir(self.path)
+        with open(os.path.join(self.path, 'new.py'), 'w'):
+            pass
+        # Make sure the modification time differs even on filesystems with
+        # a coarse timestamp resolution.
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        names = sorted(entry.name for entry in self.uut.scandir(self.path))
+        self.assertEqual(names, ['dir', 'file.py', 'new.py'])
+        self.assertEqual(len(self.scanned_dirs), 2)
+
+    def test_scandir_invalid(self):
+        with self.assertRaises(OSError):
+            self.uut.scandir(os.path.join(self.path, 'invalid'))
+
+    def test_types(self):
+        self.uut.scandir(self.path)
+        file_path = os.path.join(self.path, 'file.py')
+        dir_path = os.path.join(self.path, 'dir')
+        self.assertTrue(self.uut.isfile(file_path))
+        self.assertFalse(self.uut.isdir(file_path))
+        self.assertTrue(self.uut.isdir(dir_path))
+        self.assertFalse(self.uut.isfile(dir_path))
+        self.assertFalse(self.uut.isfile(os.path.join(self.path, 'invalid')))
+        # Not listed directories are not listed just for type checks.
+        self.assertTrue(self.uut.isdir(self.path))
+        self.assertFalse(self.uut.isdir(os.path.join(self.path, 'a', 'b')))
+        self.assertTrue(self.uut.isdir(os.sep))
+        self.assertEqual(len(self.scanned_dirs), 1)
+
+    def test_directory_snapshot(self):
+        self.assertIsNone(DirectorySnapshotModule._active_snapshot)
+        with directory_snapshot() as snapshot:
+            self.assertIs(DirectorySnapshotModule._active_snapshot, snapshot)
+            with directory_snapshot(self.uut):
+                self.assertIs(DirectorySnapshotModule._active_snapshot,
+                              self.uut)
+                scandir(self.path)
+                self.assertTrue(isfile(os.path.join(self.path, 'file.py')))
+                self.assertTrue(isdir(os.path.join(self.path, 'dir')))
+            self.assertIs(DirectorySnapshotModule._active_snapshot, snapshot)
+        self.assertIsNone(DirectorySnapshotModule._active_snapshot)
+        self.assertEqual(len(self.scanned_dirs), 1)
+
+    def test_no_snapshot(self):
+        scandir(self.path)
+        scandir(self.path)
+        self.assertTrue(isfile(os.path.join(self.path, 'file.py')))
+        self.assertTrue(isdir(os.path.join(self.path, 'dir')))
+        self.assertEqual(len(self.scanned_dirs), 2)
+
+    def test_collecting_shares_listings(self):
+        files_glob = os.path.join(self.path, '**')
+        with directory_snapshot():
+            for _ in range(3):
+                self.assertEqual(collect_files([files_glob]),
+                                 [os.path.join(self.path, 'file.py')])
+                self.assertEqual(sorted(collect_dirs([files_glob])),
+                                 [self.path, os.path.join(self.path, 'dir')])
+        self.assertEqual(sorted(self.scanned_dirs),
+                         sorted([os.path.abspath(self.path),
+                                 os.path.join(os.path.abspath(self.path),
+                                              'dir')]))
@@ -10,12 +10,14 @@ from coalib.output.printers.LogPrinter import LogPrinter
 from coalib import coala
 from coala_utils.ContextManagers import prepare_file
 from coala_utils.ContextManagers import simulate_console_inputs
-from tests.TestUtilities import execute_coala, bear_test_module
+from tests.TestUtilities import (
+    execute_coala, bear_test_module, isolate_user_data_dir)
 
 
 class CachingTest(unittest.TestCase):
 
     def setUp(self):
+        isolate_user_data_dir(self)
         current_dir = os.path.split(__file__)[0]
         self.caching_test_dir = os.path.join(
             current_dir,
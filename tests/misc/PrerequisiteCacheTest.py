@@ -0,0 +1,140 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from coalib.misc import PrerequisiteCache as PrerequisiteCacheModule
+from coalib.misc.PrerequisiteCache import (
+    PrerequisiteCache, executable_state, get_prerequisite_cache,
+    is_requirement_installed)
+
+
+class PrerequisiteCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.stored = {}
+
+        def pickle_load(log_printer, identifier, fallback=None):
+            return self.stored.get(identifier, fallback)
+
+        def pickle_dump(log_printer, identifier, data):
+            self.stored[identifier] = data.copy()
+
+        for name, function in (('pickle_load', pickle_load),
+                               ('pickle_dump', pickle_dump)):
+            patcher = patch('coalib.misc.PrerequisiteCache.' + name,
+                            side_effect=function)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        patcher = patch.object(PrerequisiteCacheModule,
+                               '_prerequisite_cache', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_check_cached(self):
+        uut = PrerequisiteCache()
+        check = Mock(return_value='Not installed.')
+        self.assertEqual(uut.check(('a',), check), 'Not installed.')
+        self.assertEqual(uut.check(('a',), check), 'Not installed.')
+        self.assertEqual(check.call_count, 1)
+
+        self.assertIs(uut.check(('b',), lambda: True), True)
+        self.assertEqual(check.call_count, 1)
+
+    def test_persistence(self):
+        uut = PrerequisiteCache()
+        uut.check(('installed',), lambda: True)
+        uut.check(('missing',), lambda: False)
+
+        check = Mock(return_value=False)
+        uut = PrerequisiteCache()
+        self.assertIs(uut.check(('installed',), check), True)
+        self.assertIs(uut.check(('missing',), check), False)
+        self.assertEqual(check.call_count, 1)
+
+        uut = PrerequisiteCache(persistent=False)
+        self.assertIs(uut.check(('installed',), check), False)
+        uut.check(('other',), lambda: True)
+        self.assertEqual(len(self.stored[PrerequisiteCache.IDENTIFIER]), 1)
+
+    def test_not_persisted(self):
+        uut = PrerequisiteCache()
+        uut.check(('key',), lambda: True, persist=False)
+        self.assertNotIn(PrerequisiteCache.IDENTIFIER, self.stored)
+
+        uut.check(('key',), lambda: True)
+        check = Mock(return_value=False)
+        uut = PrerequisiteCache()
+        self.assertIs(uut.check(('key',), check, persist=False), False)
+        self.assertEqual(check.call_count, 1)
+
+    def test_ttl(self):
+        with patch('time.time', return_value=1000):
+            PrerequisiteCache(ttl=10).check(('key',), lambda: True)
+
+        check = Mock(return_value=False)
+        with patch('time.time', return_value=1009):
+            self.assertIs(PrerequisiteCache(ttl=10).check(('key',), check),
+                          True)
+        with patch('time.time', return_value=1010):
+            self.assertIs(PrerequisiteCache(ttl=10).check(('key',), check),
+                          False)
+        self.assertEqual(check.call_count, 1)
+
+    def test_flush(self):
+        uut = PrerequisiteCache()
+        uut.check(('key',), lambda: True)
+        uut.flush()
+        self.assertIs(uut.check(('key',), lambda: False), False)
+        self.assertIs(PrerequisiteCache().check(('key',), lambda: False),
+                      False)
+
+    def test_executable_state(self):
+        self.assertEqual(executable_state('invalid_nonexisting_programv412'),
+                         ('invalid_nonexisting_programv412',))
+
+        with tempfile.TemporaryDirectory() as directory:
+            executable = os.path.join(directory, 'program')
+            with open(executable, 'w') as file:
+                file.write('#!/bin/sh\n')
+            os.chmod(executable, 0o755)
+
+            state = executable_state(executable)
+            self.assertEqual(state[0], executable)
+            stat = os.stat(executable)
+            os.utime(executable,
+                     ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertNotEqual(executable_state(executable), state)
+
+    def test_is_requirement_installed(self):
+        class Requirement:
+
+            def __init__(self, package):
+                self.package = package
+                self.is_installed = Mock(return_value=True)
+
+            def __str__(self):
+                return self.package
+
+        requirement = Requirement('package')
+        self.assertTrue(is_requirement_installed(requirement))
+        self.assertTrue(is_requirement_installed(Requirement('package')))
+        self.assertEqual(requirement.is_installed.call_count, 1)
+
+        requirement = Requirement('other')
+        requirement.is_installed.return_value = False
+        self.assertFalse(is_requirement_installed(requirement))
+
+        self.assertIs(get_prerequisite_cache(), get_prerequisite_cache())
+        self.assertNotIn(PrerequisiteCache.IDENTIFIER, self.stored)
+
+    def test_executable_requirement(self):
+        requirement = Mock(executable=sys.executable)
+        requirement.is_installed.return_value = True
+        self.assertTrue(is_requirement_installed(requirement))
+        self.assertEqual(len(self.stored[PrerequisiteCache.IDENTIFIER]), 1)
+        requirement.executable = 'invalid_nonexisting_programv412'
+        requirement.is_installed.return_value = False
+        self.assertFalse(is_requirement_installed(requirement))
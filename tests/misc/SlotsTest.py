@@ -0,0 +1,32 @@
+import pickle
+import unittest
+
+from coalib.misc.Slots import PickleSlots, slot_names
+
+
+class Point(PickleSlots):
+
+    __slots__ = ('x', 'y')
+
+
+class ColoredPoint(Point):
+
+    __slots__ = ('color',)
+
+
+class SlotsTest(unittest.TestCase):
+
+    def test_slot_names(self):
+        self.assertEqual(list(slot_names(ColoredPoint)),
+                         ['color', 'x', 'y'])
+        self.assertEqual(list(slot_names(int)), [])
+
+    def test_pickle(self):
+        uut = ColoredPoint()
+        uut.x = 1
+        uut.color = 'red'
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(uut, protocol))
+            self.assertIsInstance(unpickled, ColoredPoint)
+            self.assertEqual((unpickled.x, unpickled.color), (1, 'red'))
+            self.assertFalse(hasattr(unpickled, 'y'))
@@ -0,0 +1,91 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from coalib.misc.Timings import (
+    BearTiming, Timings, finish_measurement, get_peak_rss, start_measurement)
+
+
+class TimingsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.uut = Timings()
+        self.uut.add('python', [
+            BearTiming('SomeBear', 'a.py', 10, 2.0, 1.5, 3, 1024, 1),
+            BearTiming('OtherBear', None, 10, 4.0, 0.5, 0, 4096, 2)])
+        self.uut.add('python', [
+            BearTiming('SomeBear', 'b.py', 12, 1.0, 0.5, 1, None, 1)])
+        self.uut.add('c', [])
+
+    def test_measurement(self):
+        with patch('time.perf_counter', side_effect=[1.0, 3.5]), \
+                patch('time.process_time', side_effect=[1.0, 2.0]):
+            state = start_measurement()
+            timing = finish_measurement(state, 'SomeBear', None, 0)
+
+        self.assertEqual(timing.wall_time, 2.5)
+        self.assertEqual(timing.cpu_time, 1.0)
+        self.assertEqual(timing.pid, os.getpid())
+        self.assertEqual(timing.peak_rss, get_peak_rss())
+
+    def test_get_peak_rss(self):
+        self.assertGreater(get_peak_rss(), 0)
+
+    def test_summarize(self):
+        self.assertEqual(list(self.uut.sections), ['python', 'c'])
+
+        bears = self.uut.summarize('python', 'bear')
+        self.assertEqual(list(bears), ['OtherBear', 'SomeBear'])
+        self.assertEqual(dict(bears['SomeBear']),
+                         {'runs': 2,
+                          'wall_time': 3.0,
+                          'cpu_time': 2.0,
+                          'results': 4,
+                          'peak_rss': 1024})
+
+        files = self.uut.summarize('python', 'file')
+        self.assertEqual(list(files), ['a.py', 'b.py'])
+        self.assertEqual(files['b.py']['peak_rss'], None)
+
+        self.assertEqual(self.uut.summarize('c', 'bear'), {})
+        self.assertEqual(self.uut.summarize('unknown', 'bear'), {})
+
+    def test_json(self):
+        data = json.loads(json.dumps(self.uut.__json__()))
+        self.assertEqual(list(data), ['python', 'c'])
+        self.assertEqual(data['python']['bears']['OtherBear']['runs'], 1)
+        self.assertEqual(data['python']['runs'][1]['file'], None)
+        self.assertEqual(data['c'], {'bears': {}, 'files': {}, 'runs': []})
+
+    def test_chrome_trace(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'trace.json')
+            self.uut.write_chrome_trace(filename)
+            with open(filename) as file:
+                trace = json.load(file)
+
+        events = trace['traceEvents']
+        self.assertEqual(len(events), 3)
+        self.assertEqual(events[0]['name'], 'SomeBear')
+        self.assertEqual(events[0]['cat'], 'python')
+        self.assertEqual(events[0]['ph'], 'X')
+        self.assertEqual(events[0]['ts'], 10e6)
+        self.assertEqual(events[0]['dur'], 2e6)
+        self.assertEqual(events[0]['args']['file'], 'a.py')
+
+    def test_format_summary(self):
+        lines = self.uut.format_summary(limit=1).splitlines()
+
+        self.assertEqual(lines[0], 'Timings of section python:')
+        self.assertIn('OtherBear', lines[2])
+        self.assertRegex(lines[2], r'\s1\s+4\.000\s+0\.500\s+0\s+0\.0$')
+        self.assertIn('File', lines[3])
+        self.assertRegex(lines[4], r'a\.py\s+1\s+2\.000')
+        self.assertEqual(lines[5], 'Timings of section c:')
+        self.assertEqual(len(lines), 8)
+
+        self.uut.add('c', [BearTiming('CBear', 'a.c', 0, 1, 1, 0, None, 1)])
+        lines = self.uut.format_summary().splitlines()
+        self.assertRegex(lines[-1], r'a\.c\s+1\s+1\.000\s+1\.000\s+0\s+-$')
@@ -7,6 +7,7 @@ from coalib.settings.Section import Section
 from coalib.settings.ConfigurationGathering import load_configuration
 from coalib.output.printers.LogPrinter import LogPrinter
 from coala_utils.string_processing import escape
+from tests.TestUtilities import isolate_user_data_dir
 
 
 class ConfWriterTest(unittest.TestCase):
@@ -43,6 +44,7 @@ class ConfWriterTest(unittest.TestCase):
                            'd = 4,5,6,7\n')
 
     def setUp(self):
+        isolate_user_data_dir(self)
         self.file = os.path.join(tempfile.gettempdir(), 'ConfParserTestFile')
         with open(self.file, 'w', encoding='utf-8') as file:
             file.write(self.example_file)
@@ -44,7 +44,8 @@ from pygments.lexers import TextLexer
 from pygments.style import Style
 from pygments.token import Token
 
-from tests.TestUtilities import bear_test_module, execute_coala
+from tests.TestUtilities import (
+    bear_test_module, execute_coala, isolate_user_data_dir)
 
 
 STR_GET_VAL_FOR_SETTING = ('Please enter a value for the setting \"{}\" ({}) '
@@ -1049,6 +1050,7 @@ class ShowBearsTest(unittest.TestCase):
 class PrintFormattedResultsTest(unittest.TestCase):
 
     def setUp(self):
+        isolate_user_data_dir(self)
         self.logger = ListLogPrinter()
         self.section = Section('t')
 
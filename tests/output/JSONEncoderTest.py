@@ -4,6 +4,7 @@ import unittest
 from datetime import datetime
 
 from coalib.output.JSONEncoder import create_json_encoder
+from coalib.results.TextRange import TextRange
 
 
 class TestClass1(object):
@@ -44,6 +45,18 @@ class PropertiedClass(object):
         return self._a
 
 
+class SlottedClass(object):
+
+    __slots__ = ('_a',)
+
+    def __init__(self):
+        self._a = 5
+
+    @property
+    def prop(self):
+        return self._a
+
+
 class JSONAbleClass(object):
 
     @staticmethod
@@ -100,6 +113,18 @@ class JSONEncoderTest(unittest.TestCase):
     def test_propertied_class(self):
         uut = PropertiedClass()
         self.assertEqual('{"prop": 5}', json.dumps(uut, **self.kw))
+        self.assertEqual(
+            '{"end": {"column": 4, "line": 3}, '
+            '"start": {"column": 2, "line": 1}}',
+            json.dumps(TextRange.from_values(1, 2, 3, 4), **self.kw))
+
+    def test_slotted_class(self):
+        uut = SlottedClass()
+        self.assertEqual('{"prop": 5}', json.dumps(uut, **self.kw))
+        self.assertEqual(
+            '{"end": {"column": 4, "line": 3}, '
+            '"start": {"column": 2, "line": 1}}',
+            json.dumps(TextRange.from_values(1, 2, 3, 4), **self.kw))
 
     def test_jsonable_class(self):
         uut = JSONAbleClass()
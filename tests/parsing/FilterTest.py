@@ -5,6 +5,7 @@ from coalib.parsing.filters import available_filters
 from tests.TestUtilities import (
     bear_test_module,
     execute_coala,
+    isolate_user_data_dir,
     TEST_BEARS_COUNT,
     C_BEARS_COUNT,
 )
@@ -15,6 +16,9 @@ C_BEARS_COUNT_OUTPUT = C_BEARS_COUNT + 1
 
 class FilterTest(unittest.TestCase):
 
+    def setUp(self):
+        isolate_user_data_dir(self)
+
     def test_filter_by_language_c(self):
         with bear_test_module():
             retval, stdout, stderr = execute_coala(
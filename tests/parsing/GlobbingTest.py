@@ -18,9 +18,12 @@ import os
 import re
 import unittest
 
+from unittest.mock import patch
+
 from coalib.parsing.Globbing import (
-    _iter_alternatives, _iter_choices, _position_is_bracketed, fnmatch, glob,
-    glob_escape)
+    _iter_alternatives, _iter_choices, _position_is_bracketed,
+    compile_glob_set, fnmatch, glob, glob_escape, GlobSet, iglob, imulti_glob,
+    translate)
 
 
 class TestFiles:
@@ -215,6 +218,45 @@ class FnmatchTest(unittest.TestCase):
         self.assertFalse(fnmatch('something', []))
 
 
+class GlobSetTest(unittest.TestCase):
+
+    def test_first_match(self):
+        uut = GlobSet(['*.py', '**.py', '(a|b).c', 'a.*'])
+        self.assertEqual(uut.match('a.py'), '*.py')
+        self.assertEqual(uut.match(os.path.join('a', 'b.py')), '**.py')
+        self.assertEqual(uut.match('a.c'), '(a|b).c')
+        self.assertEqual(uut.match('a.h'), 'a.*')
+        self.assertIsNone(uut.match('b.h'))
+
+    def test_empty(self):
+        self.assertIsNone(GlobSet([]).match('a'))
+        self.assertIsNone(GlobSet(['']).match('a'))
+
+    def test_many_globs(self):
+        globs = ['file{}.py'.format(i) for i in range(250)]
+        uut = GlobSet(globs)
+        for glob_string in globs:
+            self.assertEqual(uut.match(glob_string), glob_string)
+        self.assertIsNone(uut.match('file250.py'))
+
+    def test_same_as_translated_globs(self):
+        globs = ['*[!c]', '[!abc]?', '?[a-c]*', 'a*c', '**.c', '(a|b)(c|d)']
+        uut = GlobSet(globs)
+        for name in ['abc', 'ab', 'a.c', 'bd', os.path.join('ab', 'd.c'),
+                     'dd', 'ac', '']:
+            expected = [glob_string for glob_string in globs
+                        if any(re.match(translate(alternative), name)
+                               for alternative in _iter_alternatives(
+                                   glob_string))]
+            self.assertEqual(uut.match(name),
+                             expected[0] if expected else None, name)
+
+    def test_cached(self):
+        globs = ('*.py', '*.c')
+        self.assertIs(compile_glob_set(globs), compile_glob_set(globs))
+        self.assertEqual(compile_glob_set(globs).globs, globs)
+
+
 class GlobTest(unittest.TestCase):
 
     def setUp(self):
@@ -324,6 +366,37 @@ class GlobTest(unittest.TestCase):
                      TestFiles.file2]
         self._test_glob(pattern, file_list)
 
+    def test_collect_recursive_pruned(self):
+        pattern = os.path.join(TestFiles.glob_test_dir, '**')
+        ignored = [os.path.join(TestFiles.glob_test_dir, 'Sub*1', '**'),
+                   os.path.join(TestFiles.glob_test_dir, '*.x')]
+        scanned_dirs = []
+        original_scandir = os.scandir
+
+        def scandir(path):
+            scanned_dirs.append(os.path.normcase(path))
+            return original_scandir(path)
+
+        with patch('os.scandir', side_effect=scandir):
+            results = sorted(os.path.normcase(g)
+                             for g in iglob(pattern, ignored))
+
+        self.assertNotIn(os.path.normcase(TestFiles.dir1), scanned_dirs)
+        self.assertIn(os.path.normcase(TestFiles.dir2), scanned_dirs)
+        # The pruned directory itself is still yielded, as are matches of
+        # non-recursive ignore globs.
+        self.assertEqual(
+            [i for i in results
+             if re.search(r'(__pycache__|\.pyc)', i) is None],
+            sorted(os.path.normcase(f) for f in [TestFiles.glob_test_dir,
+                                                 TestFiles.dir1,
+                                                 TestFiles.dir2,
+                                                 TestFiles.file1,
+                                                 TestFiles.file2,
+                                                 TestFiles.file3,
+                                                 TestFiles.file_paren,
+                                                 TestFiles.file_brack]))
+
     def test_collect_invalid(self):
         pattern = 'NOPE'
         file_list = []
@@ -361,3 +434,96 @@ class GlobTest(unittest.TestCase):
         file_list = sorted([os.path.normcase(f) for f in file_list])
         self.assertEqual(results, file_list)
         os.curdir = old_curdir
+
+
+class MultiGlobTest(unittest.TestCase):
+
+    patterns = [
+        os.path.join(TestFiles.glob_test_dir, 'Sub*', 'File1?.py'),
+        os.path.join(TestFiles.glob_test_dir, '*'),
+        os.path.join(TestFiles.glob_test_dir, '**'),
+        os.path.join(TestFiles.glob_test_dir, '**', '*'),
+        os.path.join(TestFiles.glob_test_dir, '**', 'File1?.py'),
+        os.path.join(TestFiles.glob_test_dir, '**', '**', 'File1.x'),
+        os.path.join(TestFiles.glob_test_dir, '**.(py|[xy])'),
+        os.path.join(TestFiles.glob_test_dir, 'SubDir?', 'File11.py'),
+        os.path.join(TestFiles.glob_test_dir, 'SubDir[!1]', '*'),
+        os.path.join(TestFiles.glob_test_dir, 'Sub*1', '**'),
+        os.path.join(TestFiles.glob_test_dir, '(SubDir1|SubDir2)', '*.py'),
+        os.path.join(TestFiles.glob_test_dir,
+                     '(SubDir1' + os.sep + '**|*.x)'),
+        os.path.join(TestFiles.glob_test_dir, 'Sub?ir1?File11.py'),
+        os.path.join(TestFiles.glob_test_dir, 'Sub*' + os.sep),
+        os.path.join(TestFiles.glob_test_dir, 'SubDir[12]',
+                     'File[(]with)parentheses.txt'),
+        os.path.join(TestFiles.glob_test_dir, 'SubDir[12]',
+                     'File[[]with[]]brackets.txt'),
+        TestFiles.file12,
+        os.path.join(TestFiles.glob_test_dir, 'NOPE', '*'),
+        os.path.join(TestFiles.glob_test_root, 'NOPE*', '**'),
+    ]
+
+    def test_same_as_iglob(self):
+        results = {}
+        for name, pattern in imulti_glob(self.patterns):
+            results.setdefault(pattern, []).append(name)
+
+        for pattern in self.patterns:
+            expected = [name for name in iglob(pattern)
+                        if os.path.exists(name)]
+            self.assertEqual(sorted(results.get(pattern, [])),
+                             sorted(expected), pattern)
+
+    def test_relative_patterns(self):
+        old_cwd = os.getcwd()
+        os.chdir(TestFiles.glob_test_dir)
+        try:
+            patterns = ['**.py', os.path.join('SubDir1', '*')]
+            self.assertEqual(
+                sorted(imulti_glob(patterns)),
+                sorted([(os.path.join('SubDir1', 'File11.py'), patterns[0]),
+                        (os.path.join('SubDir1', 'File12.py'), patterns[0]),
+                        (os.path.join('SubDir1', 'File11.py'), patterns[1]),
+                        (os.path.join('SubDir1', 'File12.py'), patterns[1])]))
+        finally:
+            os.chdir(old_cwd)
+
+    def test_single_walk(self):
+        scanned_dirs = []
+        original_scandir = os.scandir
+
+        def scandir(path):
+            scanned_dirs.append(os.path.normcase(path))
+            return original_scandir(path)
+
+        patterns = [os.path.join(TestFiles.glob_test_dir, '**.py'),
+                    os.path.join(TestFiles.glob_test_dir, '**.x'),
+                    os.path.join(TestFiles.glob_test_dir, '*', '*.txt'),
+                    os.path.join(TestFiles.dir1, '*')]
+        with patch('os.scandir', side_effect=scandir):
+            list(imulti_glob(patterns))
+
+        self.assertEqual(len(scanned_dirs), len(set(scanned_dirs)))
+        self.assertIn(os.path.normcase(TestFiles.dir1), scanned_dirs)
+
+    def test_flat_pattern_depth(self):
+        scanned_dirs = []
+        original_scandir = os.scandir
+
+        def scandir(path):
+            scanned_dirs.append(os.path.normcase(path))
+            return original_scandir(path)
+
+        with patch('os.scandir', side_effect=scandir):
+            list(imulti_glob([os.path.join(TestFiles.glob_test_dir, '*')]))
+
+        self.assertEqual(scanned_dirs,
+                         [os.path.normcase(TestFiles.glob_test_dir)])
+
+    def test_pruned(self):
+        pattern = os.path.join(TestFiles.glob_test_dir, '**.py')
+        self.assertEqual(
+            list(imulti_glob([pattern],
+                             [os.path.join(TestFiles.glob_test_dir,
+                                           'SubDir1', '**')])),
+            [])
@@ -1,6 +1,7 @@
 import multiprocessing
 import queue
 import unittest
+from unittest.mock import patch
 
 from coalib.bears.GlobalBear import GlobalBear
 from coalib.bears.LocalBear import LocalBear
@@ -395,3 +396,40 @@ d
                          len(local_result_expected))
         self.assertRaises(queue.Empty, self.message_queue.get, timeout=0)
         self.assertRaises(queue.Empty, self.control_queue.get, timeout=0)
+
+    def test_run_timings(self):
+        timings = []
+        run(self.file_name_queue,
+            self.local_bear_list,
+            self.global_bear_list,
+            self.global_bear_queue,
+            self.file_dict,
+            self.local_result_dict,
+            self.global_result_dict,
+            self.message_queue,
+            self.control_queue,
+            timings=timings)
+
+        self.assertEqual(
+            sorted((timing.bear, timing.file or '', timing.results)
+                   for timing in timings),
+            [('GlobalTestBear', '', 2),
+             ('LocalTestBear', 'arbitrary', 1),
+             # Runs raising an exception are recorded as well.
+             ('LocalTestBear', 'file1', 0)])
+        for timing in timings:
+            self.assertGreaterEqual(timing.wall_time, 0)
+            self.assertGreaterEqual(timing.cpu_time, 0)
+
+    def test_run_no_timings(self):
+        with patch('coalib.processes.BearRunning.start_measurement') as start:
+            run(self.file_name_queue,
+                self.local_bear_list,
+                self.global_bear_list,
+                self.global_bear_queue,
+                self.file_dict,
+                self.local_result_dict,
+                self.global_result_dict,
+                self.message_queue,
+                self.control_queue)
+        self.assertFalse(start.called)
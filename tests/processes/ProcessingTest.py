@@ -12,14 +12,18 @@ from pyprint.ConsolePrinter import ConsolePrinter
 
 from testfixtures import LogCapture, StringComparison
 
+from coala_utils.ContextManagers import make_temp
+
 from coalib.bears.Bear import Bear
+from coalib.misc.Timings import Timings
 from coalib.output.printers.LogPrinter import LogPrinter
 from coalib.output.printers.ListLogPrinter import ListLogPrinter
 from coalib.processes.CONTROL_ELEMENT import CONTROL_ELEMENT
 from coalib.processes.Processing import (
     ACTIONS, autoapply_actions, check_result_ignore, create_process_group,
-    execute_section, get_default_actions, get_file_dict, print_result,
-    process_queues, simplify_section_result, yield_ignore_ranges,
+    execute_section, filter_section_results, get_default_actions,
+    get_file_dict, get_issue_key, print_result, process_queues,
+    simplify_section_result, write_pending_files, yield_ignore_ranges,
     instantiate_bears)
 from coalib.results.HiddenResult import HiddenResult
 from coalib.results.Result import RESULT_SEVERITY, Result
@@ -32,6 +36,8 @@ from coalib.settings.ConfigurationGathering import gather_configuration
 from coalib.settings.Section import Section
 from coalib.settings.Setting import Setting
 from coalib.misc.Caching import FileCache
+from coalib.results.Diff import Diff
+from tests.TestUtilities import isolate_user_data_dir
 
 
 process_group_test_code = """
@@ -70,6 +76,7 @@ class ProcessingTestLogPrinter(LogPrinter):
 class ProcessingTest(unittest.TestCase):
 
     def setUp(self):
+        isolate_user_data_dir(self)
         config_path = os.path.abspath(os.path.join(
             os.path.dirname(__file__),
             'section_executor_test_files',
@@ -162,6 +169,28 @@ class ProcessingTest(unittest.TestCase):
         # No global bear
         self.assertEqual(len(results[2]), 0)
 
+    def test_run_timings(self):
+        self.sections['cli'].append(Setting('jobs', '1'))
+        for debug in (False, True):
+            timings = Timings()
+            # The bear lists are replaced with the bear instances.
+            execute_section(self.sections['cli'],
+                            list(self.global_bears['cli']),
+                            list(self.local_bears['cli']),
+                            lambda *args: None,
+                            None,
+                            self.log_printer,
+                            console_printer=self.console_printer,
+                            debug=debug,
+                            timings=timings)
+
+            self.assertEqual(list(timings.sections), ['cli'])
+            self.assertEqual(
+                sorted((timing.bear, timing.file is None, timing.results)
+                       for timing in timings.sections['cli']),
+                [('ProcessingGlobalTestBear', True, 1),
+                 ('ProcessingLocalTestBear', False, 1)])
+
     def test_mixed_run(self):
         self.sections['mixed'].append(Setting('jobs', '1'))
         log_printer = ListLogPrinter()
@@ -294,6 +323,58 @@ class ProcessingTest(unittest.TestCase):
         self.assertEqual(self.queue.get(timeout=0), ([first_global]))
         self.assertEqual(self.queue.get(timeout=0), ([first_global]))
 
+    def test_process_queues_duplicates(self):
+        ctrlq = queue.Queue()
+        ctrlq.put((CONTROL_ELEMENT.LOCAL, 1))
+        ctrlq.put((CONTROL_ELEMENT.LOCAL, 2))
+        ctrlq.put((CONTROL_ELEMENT.LOCAL_FINISHED, None))
+        ctrlq.put((CONTROL_ELEMENT.GLOBAL_FINISHED, None))
+
+        first = Result.from_values('ABear', 'Unused import.', 'f', 1)
+        duplicate = Result.from_values('BBear', 'Unused import.', 'f', 1)
+        other = Result.from_values('BBear', 'Unused import.', 'f', 2)
+        section = Section('')
+        section.append(Setting('deduplicate_results', 'True'))
+        local_result_dict = {1: [first], 2: [duplicate, other]}
+        retval = process_queues(
+            [DummyProcess(control_queue=ctrlq) for i in range(2)],
+            ctrlq,
+            local_result_dict,
+            {},
+            {'f': ['first line\n', 'second line\n']},
+            lambda *args: self.queue.put(args[2]),
+            section,
+            None,
+            self.log_printer,
+            self.console_printer)
+
+        self.assertTrue(retval)
+        self.assertEqual(self.queue.get(timeout=0), [first])
+        self.assertEqual(self.queue.get(timeout=0), [other])
+        self.assertEqual(local_result_dict, {1: [first], 2: [other]})
+
+        ctrlq.put((CONTROL_ELEMENT.LOCAL, 1))
+        ctrlq.put((CONTROL_ELEMENT.LOCAL, 2))
+        ctrlq.put((CONTROL_ELEMENT.LOCAL_FINISHED, None))
+        ctrlq.put((CONTROL_ELEMENT.GLOBAL_FINISHED, None))
+        # Results are only deduplicated on request.
+        section = Section('')
+        local_result_dict = {1: [first], 2: [duplicate, other]}
+        process_queues(
+            [DummyProcess(control_queue=ctrlq) for i in range(2)],
+            ctrlq,
+            local_result_dict,
+            {},
+            {'f': ['first line\n', 'second line\n']},
+            lambda *args: self.queue.put(args[2]),
+            section,
+            None,
+            self.log_printer,
+            self.console_printer)
+
+        self.assertEqual(self.queue.get(timeout=0), [first])
+        self.assertEqual(self.queue.get(timeout=0), [duplicate, other])
+
     def test_dead_processes(self):
         ctrlq = queue.Queue()
         # Not enough FINISH elements in the queue, processes start already dead
@@ -637,6 +718,21 @@ class ProcessingTest(unittest.TestCase):
                               self.queue, console_printer=self.console_printer,
                               debug=True)
 
+    def test_instantiate_bears_binds_params(self):
+        class TestParamsBear(Bear):
+
+            def __init__(self, file_dict, section, queue, timeout=0.1):
+                Bear.__init__(self, section, queue, timeout)
+
+            def run(self, value: int = 1):
+                return []
+
+        self.sections['cli'].append(Setting('value', '5'))
+        _, global_bears = instantiate_bears(
+            self.sections['cli'], [], [TestParamsBear], {}, self.queue,
+            console_printer=self.console_printer)
+        self.assertEqual(global_bears[0]._bound_params[1], {'value': 5})
+
 
 class ProcessingTest_GetDefaultActions(unittest.TestCase):
 
@@ -792,6 +888,53 @@ class ProcessingTest_AutoapplyActions(unittest.TestCase):
         )
         ACTIONS.pop()
 
+    def test_pending_files(self):
+        self.section.append(Setting('default_actions',
+                                    '*Bear: ApplyPatchAction'))
+        self.section.append(Setting('no_orig', True))
+        with make_temp() as filename:
+            with open(filename, 'w') as file:
+                file.write('1\n2\n3\n')
+            file_dict = {filename: ('1\n', '2\n', '3\n')}
+            file_diff_dict = {}
+            pending_files = {}
+
+            first_diff = Diff(file_dict[filename])
+            first_diff.delete_line(1)
+            second_diff = Diff(file_dict[filename])
+            second_diff.modify_line(3, '3_changed\n')
+            results = [Result('YBear', 'msg', diffs={filename: first_diff}),
+                       Result('ZBear', 'msg', diffs={filename: second_diff})]
+
+            ret = autoapply_actions(results,
+                                    file_dict,
+                                    file_diff_dict,
+                                    self.section,
+                                    pending_files=pending_files)
+            self.assertEqual(ret, [])
+            self.assertEqual(pending_files, {filename: filename})
+            with open(filename) as file:
+                self.assertEqual(file.read(), '1\n2\n3\n')
+
+            write_pending_files(pending_files, file_diff_dict, [])
+            self.assertEqual(pending_files, {filename: filename})
+
+            write_pending_files(pending_files, file_diff_dict)
+            self.assertEqual(pending_files, {})
+            with open(filename) as file:
+                self.assertEqual(file.read(), '2\n3_changed\n')
+
+    def test_write_pending_files_failure(self):
+        filename = os.path.join('nonexistent_directory', 'file')
+        pending_files = {filename: filename}
+        with LogCapture() as capture:
+            write_pending_files(pending_files, {filename: Diff(['1\n'])})
+        self.assertEqual(pending_files, {})
+        self.assertEqual(capture.records[0].getMessage(),
+                         StringComparison(
+                             r"Failed to write the patched file "
+                             r"'nonexistent_directory.file': .*"))
+
 
 class ProcessingTest_PrintResult(unittest.TestCase):
 
@@ -816,3 +959,76 @@ class ProcessingTest_PrintResult(unittest.TestCase):
                                       self.section, self.log_printer, {}, [],
                                       console_printer=self.console_printer)
         self.assertEqual(newres, [])
+
+    def test_pending_files(self):
+        self.section.append(Setting('default_actions',
+                                    'somebear: ApplyPatchAction'))
+        self.section.append(Setting('no_orig', True))
+        with make_temp() as patched_file, make_temp() as other_file:
+            file_dict = {patched_file: ('1\n',), other_file: ('1\n',)}
+            file_diff_dict = {}
+            pending_files = {}
+
+            diff = Diff(file_dict[patched_file])
+            diff.modify_line(1, '1_changed\n')
+            results = [Result('somebear', 'message',
+                              diffs={patched_file: diff}),
+                       Result.from_values('otherbear', 'message',
+                                          other_file)]
+            print_result(results, file_dict, 0, lambda *args: None,
+                         self.section, None, file_diff_dict, [],
+                         console_printer=self.console_printer,
+                         pending_files=pending_files)
+            # The remaining result doesn't affect the patched file.
+            self.assertEqual(pending_files, {patched_file: patched_file})
+
+            results = [Result.from_values('otherbear', 'message',
+                                          patched_file)]
+            print_result(results, file_dict, 0, lambda *args: None,
+                         self.section, None, file_diff_dict, [],
+                         console_printer=self.console_printer,
+                         pending_files=pending_files)
+            # The file has to be written before the user gets to act on it.
+            self.assertEqual(pending_files, {})
+            with open(patched_file) as file:
+                self.assertEqual(file.read(), '1_changed\n')
+
+    def test_filter_section_results(self):
+        self.section.append(Setting('min_severity', 'normal'))
+        first = Result.from_values('ABear', 'message', 'f', 1)
+        duplicate = Result.from_values('BBear', 'message', 'f', 1)
+        patch = Result.from_values('CBear', 'message', 'f', 1,
+                                   diffs={'f': Diff(['1\n'])})
+        results = [first, duplicate, patch,
+                   Result('ABear', 'info', severity=RESULT_SEVERITY.INFO),
+                   HiddenResult('ABear', [])]
+
+        self.assertEqual(filter_section_results(results, self.section, []),
+                         [first, duplicate, patch])
+
+        issue_origins = {}
+        with self.assertLogs(level='DEBUG') as log:
+            self.assertEqual(filter_section_results(results, self.section, [],
+                                                    issue_origins),
+                             [first, patch])
+        self.assertEqual(log.output,
+                         ['DEBUG:root:Dropped a result of BBear reporting the '
+                          'same issue as ABear: message'])
+        self.assertEqual(issue_origins, {get_issue_key(first): 'ABear'})
+
+        # Bears may report the same issue again themselves.
+        self.assertEqual(filter_section_results([duplicate, first],
+                                                self.section, [],
+                                                issue_origins),
+                         [first])
+
+    def test_get_issue_key(self):
+        result = Result.from_values('ABear', 'message', 'f', 1, 2, 3, 4)
+        self.assertEqual(get_issue_key(result),
+                         ('message', RESULT_SEVERITY.NORMAL,
+                          ((os.path.abspath('f'), 1, 2, 3, 4),)))
+        self.assertNotEqual(
+            get_issue_key(result),
+            get_issue_key(Result.from_values('ABear', 'message', 'f', 1)))
+        self.assertEqual(get_issue_key(Result('ABear', 'message')),
+                         ('message', RESULT_SEVERITY.NORMAL, ()))
@@ -1,6 +1,8 @@
+import pickle
 import unittest
 
-from coalib.results.AbsolutePosition import AbsolutePosition, calc_line_col
+from coalib.results.AbsolutePosition import (
+    AbsolutePosition, LineOffsets, calc_line_col, get_line_offsets)
 from coalib.misc.Constants import COMPLEX_TEST_STRING
 
 
@@ -49,6 +51,42 @@ class AbsolutePositionTest(unittest.TestCase):
         z_pos = string_text.find('z')
         self.assertEqual(calc_line_col(text, z_pos), (2, 1))
 
+    def test_calc_line_col_empty_lines(self):
+        text = ('\n', '', 'a\n', '', '')
+        self.assertEqual(calc_line_col(text, 0), (1, 1))
+        self.assertEqual(calc_line_col(text, 1), (3, 1))
+        self.assertEqual(calc_line_col(text, 2), (3, 2))
+        with self.assertRaises(ValueError):
+            calc_line_col(text, 3)
+        with self.assertRaises(ValueError):
+            calc_line_col(text, -1)
+        with self.assertRaises(ValueError):
+            calc_line_col((), 0)
+
+    def test_line_offsets(self):
+        text = ('first\n', 'second\n', '\n', 'third')
+        string_text = ''.join(text)
+        uut = LineOffsets(text)
+        self.assertEqual(uut.starts, [0, 6, 13, 14])
+        self.assertEqual(len(uut), len(string_text))
+        for position in range(len(string_text)):
+            line, column = uut.line_col(position)
+            self.assertEqual(text[line - 1][column - 1],
+                             string_text[position])
+            self.assertEqual(uut.position(line, column), position)
+
+    def test_get_line_offsets_cached(self):
+        text = ('a\n', 'b\n')
+        self.assertIs(get_line_offsets(text), get_line_offsets(text))
+        self.assertIsNot(get_line_offsets(text),
+                         get_line_offsets(tuple(text)[:1]))
+
+        # Lists can change, so their offsets aren't cached.
+        text = ['a\n', 'b\n']
+        self.assertEqual(calc_line_col(text, 2), (2, 1))
+        text[0] = 'aa\n'
+        self.assertEqual(calc_line_col(text, 2), (1, 3))
+
     def test_property(self):
         uut = AbsolutePosition(('1', '2'), 1)
         self.assertEqual(uut.position, 1)
@@ -65,6 +103,18 @@ class AbsolutePositionTest(unittest.TestCase):
         self.assertEqual(uut.line, 1)
         self.assertEqual(uut.column, 1)
 
+    def test_pickle(self):
+        uut = AbsolutePosition(('a\n', 'b\n'), 2)
+        offsets = LineOffsets(('a\n', 'b'))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(uut, protocol))
+            self.assertEqual(unpickled.position, uut.position)
+            self.assertEqual(unpickled, uut)
+
+            unpickled = pickle.loads(pickle.dumps(offsets, protocol))
+            self.assertEqual(unpickled.starts, offsets.starts)
+            self.assertEqual(len(unpickled), len(offsets))
+
     def test_instantiation(self):
         with self.assertRaises(ValueError):
             uut = AbsolutePosition((), 0)
@@ -1,11 +1,15 @@
+import copy
+import io
 import json
 import logging
+import random
 import unittest
 
 from unidiff.errors import UnidiffParseError
 
 from coalib.output.JSONEncoder import create_json_encoder
 from coalib.results.Diff import ConflictError, Diff, SourceRange
+from coalib.results.TextRange import TextRange
 
 
 class DiffTest(unittest.TestCase):
@@ -147,6 +151,33 @@ class DiffTest(unittest.TestCase):
         del result_file[2]
         self.assertEqual(self.uut.modified, result_file)
 
+    def test_iter_modified(self):
+        self.uut.delete_line(2)
+        self.uut.add_lines(0, ['0.1', '0.2'])
+        modified = self.uut.iter_modified()
+        self.assertEqual(next(modified), '0.1\n')
+        self.assertEqual(list(modified), self.uut.modified[1:])
+
+        output = io.StringIO()
+        output.writelines(self.uut.iter_modified())
+        self.assertEqual(output.getvalue(), ''.join(self.uut.modified))
+
+        self.uut.delete = True
+        self.assertEqual(list(self.uut.iter_modified()), [])
+
+    def test_iter_unified_diff(self):
+        self.uut.modify_line(2, '2.changed')
+        self.assertEqual(''.join(self.uut.iter_unified_diff()),
+                         self.uut.unified_diff)
+
+        self.uut.rename = 'renamed'
+        lines = list(self.uut.iter_unified_diff(fromfile='a'))
+        self.assertEqual(lines[:2], ['--- a\n', '+++ renamed\n'])
+        lines = list(self.uut.iter_unified_diff(tofile='b'))
+        self.assertEqual(lines[:2], ['--- \n', '+++ b\n'])
+
+        self.assertEqual(list(Diff(self.file).iter_unified_diff()), [])
+
     def test_bool(self):
         self.assertFalse(self.uut)
         self.uut.add_line(4, '4')
@@ -188,6 +219,43 @@ class DiffTest(unittest.TestCase):
         # Make sure it didn't happen in place!
         self.assertNotEqual(self.uut.modified, result_file)
 
+    def test_addition_shares_original(self):
+        self.uut.modify_line(1, '1a')
+        self.uut.add_lines(2, ['2a'])
+        other = Diff(self.file)
+        other.add_lines(1, ['1b'])
+        other.delete_line(3)
+        result = self.uut + other
+
+        self.assertIs(result._file, self.uut._file)
+        for diff in result.split_diff(distance=0):
+            self.assertIs(diff._file, self.uut._file)
+        self.assertEqual(result.modified,
+                         ['1a\n', '1b\n', '2\n', '2a\n', '4'])
+        # The changed LineDiff objects were copied, not changed.
+        self.assertEqual(self.uut.modified,
+                         ['1a\n', '2\n', '2a\n', '3\n', '4'])
+        self.assertEqual(other.modified, ['1\n', '1b\n', '2\n', '4'])
+
+    def test_copy(self):
+        self.uut.delete_line(1)
+        copied = copy.copy(self.uut)
+        copied.add_lines(1, ['1a'])
+        copied.delete_line(2)
+
+        self.assertIs(copied._file, self.uut._file)
+        self.assertEqual(copied.modified, ['1a\n', '3\n', '4'])
+        self.assertEqual(self.uut.modified, ['2\n', '3\n', '4'])
+
+    def test_original(self):
+        self.assertEqual(self.uut.original, ['1\n', '2\n', '3\n', '4'])
+        self.assertIs(self.uut.original, self.uut.original)
+        self.assertEqual(Diff(()).original, [])
+
+        # The original file isn't affected by changes to the given list.
+        self.file.append('5')
+        self.assertEqual(self.uut.original, ['1\n', '2\n', '3\n', '4'])
+
     def test_addition_rename(self):
         uut = Diff(self.file, rename=False)
         other = Diff(self.file, rename=False)
@@ -228,6 +296,33 @@ class DiffTest(unittest.TestCase):
         self.uut = Diff.from_string_arrays(a, b)
         self.assertEqual(self.uut.modified, b)
 
+    def test_from_string_arrays_patience(self):
+        a = ['q\n', 'a\n', 'b\n', 'x\n', 'c\n', 'd\n']
+        b = ['a\n', 'b\n', 'y\n', 'c\n', 'd\n', 'f\n']
+        self.uut = Diff.from_string_arrays(a, b, algorithm='patience')
+        self.assertEqual(self.uut.modified, b)
+        self.assertEqual(self.uut, Diff.from_string_arrays(a, b))
+
+        # Repeated lines can't serve as anchors.
+        a = ['}\n', 'a\n', '}\n', '}\n']
+        b = ['}\n', '}\n', 'a\n', '}\n']
+        self.uut = Diff.from_string_arrays(a, b, algorithm='patience')
+        self.assertEqual(self.uut.modified, b)
+
+        for seed in range(200):
+            rng = random.Random(seed)
+            a = [rng.choice('abcdef') + '\n'
+                 for _ in range(rng.randint(0, 30))]
+            b = [rng.choice('abcdefg') + '\n'
+                 for _ in range(rng.randint(0, 30))]
+            self.uut = Diff.from_string_arrays(a, b, algorithm='patience')
+            self.assertEqual(self.uut.modified, b)
+            self.assertEqual(self.uut, Diff.from_string_arrays(a, b))
+
+    def test_from_string_arrays_unknown_algorithm(self):
+        with self.assertRaisesRegex(ValueError, 'difflib, patience'):
+            Diff.from_string_arrays(['a'], ['b'], algorithm='myers')
+
     def test_from_unified_diff_single_addition(self):
         source = ['single line']
         target = ['single line\n', 'another line added']
@@ -653,3 +748,72 @@ class DiffTest(unittest.TestCase):
             eof_ln)
 
         self.assertEqual(Diff._generate_linebreaks([]), [])
+
+    def test_line_translation(self):
+        self.uut.add_lines(0, ['a', 'b'])
+        self.uut.delete_line(2)
+        self.uut.modify_line(3, '3 changed')
+        self.uut.add_lines(3, ['c'])
+        self.assertEqual(self.uut.modified,
+                         ['a\n', 'b\n', '1\n', '3 changed\n', 'c\n', '4'])
+
+        self.assertEqual([self.uut.to_modified_line(line_nr)
+                          for line_nr in range(1, 6)],
+                         [3, None, 4, 6, None])
+
+        # The cached map is rebuilt after changes.
+        self.uut.delete_line(1)
+        self.assertEqual(self.uut.to_modified_line(4), 5)
+        self.uut.add_lines(2, ['d'])
+        self.assertEqual(self.uut.to_modified_line(4), 6)
+        self.uut.delete = True
+        self.assertEqual(self.uut.to_modified_line(4), None)
+
+    def test_line_translation_random(self):
+        rng = random.Random(0)
+        for _ in range(100):
+            file = ['line {}\n'.format(line_nr) for line_nr in range(1, 21)]
+            diff = Diff(file)
+            for line_nr in rng.sample(range(0, 21), 8):
+                choice = rng.random()
+                if line_nr > 0 and choice < 0.3:
+                    diff.delete_line(line_nr)
+                elif line_nr > 0 and choice < 0.5:
+                    diff.modify_line(line_nr, 'changed ' + file[line_nr - 1])
+                else:
+                    diff.add_lines(line_nr, ['added\n'] * rng.randint(1, 3))
+
+            # Brute force the mapping from the modified file.
+            expected = {}
+            for modified_line_nr, line in enumerate(diff.modified, 1):
+                if line.startswith(('line', 'changed')):
+                    expected[int(line.split()[-1])] = modified_line_nr
+
+            for line_nr in range(1, 21):
+                self.assertEqual(diff.to_modified_line(line_nr),
+                                 expected.get(line_nr))
+
+    def test_range_translation(self):
+        diff = Diff.from_string_arrays(['1', '2', '3', '4', '5'],
+                                       ['0', '1', '3', '4', '6', '5'])
+
+        range = diff.to_modified_range(TextRange.from_values(1, 2, 3, 4))
+        self.assertEqual(range, TextRange.from_values(2, 2, 3, 4))
+        # Deleted lines at the borders are cut off.
+        range = diff.to_modified_range(TextRange.from_values(2, 2, 3, 4))
+        self.assertEqual(range, TextRange.from_values(3, None, 3, 4))
+        range = diff.to_modified_range(TextRange.from_values(1, 2, 2, 4))
+        self.assertEqual(range, TextRange.from_values(2, 2, 2, 2))
+        self.assertIsNone(diff.to_modified_range(TextRange.from_values(2)))
+
+        # Ranges spanning the whole file stay so.
+        self.assertEqual(diff.to_modified_range(TextRange.from_values()),
+                         TextRange.from_values())
+
+    def test_source_range_translation(self):
+        diff = Diff(['1', '2'], rename='new_name')
+        diff.add_lines(0, ['0'])
+
+        source_range = SourceRange.from_values('name', 1, 1, 2, 1)
+        self.assertEqual(diff.to_modified_range(source_range),
+                         SourceRange.from_values('new_name', 2, 1, 3, 1))
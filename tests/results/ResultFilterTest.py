@@ -1,13 +1,16 @@
 import os
 import unittest
 from os.path import abspath
+from unittest.mock import patch
 
 from coalib.results.Diff import Diff
 from coalib.results.Result import RESULT_SEVERITY, Result
 from coalib.results.ResultFilter import (
+    filter_result_tables,
     filter_results,
     remove_range,
     remove_result_ranges_diffs)
+from coalib.results.ResultTable import ResultTable
 from coalib.results.SourceRange import SourceRange
 
 
@@ -336,7 +339,7 @@ class ResultFilterTest(unittest.TestCase):
                            res1_pre_addition,     # correctly filtered out
                            res1_addition,         # correctly kept
                            res1_post_addition,    # correctly filtered out
-                           res1_around_addition,  # FALSE POSITIVE (close-line)
+                           res1_around_addition,  # correctly filtered out
                            res1_with_addition,    # correctly kept
                            res1_whole_addition]   # correctly kept
 
@@ -345,7 +348,6 @@ class ResultFilterTest(unittest.TestCase):
                                   res1_whole_change,     # correct
 
                                   res1_addition,         # correct
-                                  res1_around_addition,  # WRONG: line-wise diff
                                   res1_with_addition,    # correct
                                   res1_whole_addition]   # correct
 
@@ -601,3 +603,86 @@ class ResultFilterTest(unittest.TestCase):
                                      [old_result_tf1, old_result_tf2],
                                      [new_result])
         self.assertEqual(new_results, [new_result])
+
+    def test_shifted_results(self):
+        original_file = ['line {}\n'.format(i) for i in range(100)]
+        modified_file = ['new line\n'] + original_file
+        tf1 = abspath('tf1')
+        tf2 = abspath('tf2')
+        original_file_dict = {tf1: original_file, tf2: original_file}
+        modified_file_dict = {tf1: modified_file, tf2: original_file}
+
+        def results(file_dict, first_line):
+            return [Result.from_values('origin', 'message', file_name, line)
+                    for file_name in sorted(file_dict)
+                    for line in range(first_line, first_line + 100)]
+
+        original_results = results(original_file_dict, 1)
+        modified_results = results(modified_file_dict, 1)
+
+        with patch('coalib.results.ResultFilter.Diff.from_string_arrays',
+                   wraps=Diff.from_string_arrays) as from_string_arrays:
+            new_results = filter_results(original_file_dict,
+                                         modified_file_dict,
+                                         original_results,
+                                         modified_results)
+
+        # Only the first result of the modified file is new, the other ones
+        # moved down one line.
+        self.assertEqual(new_results, [modified_results[0]])
+        # Only the affected files are diffed, each of them once.
+        self.assertEqual(from_string_arrays.call_count, 2)
+
+    def test_result_in_renamed_file_placeholder(self):
+        original_file = ['1\n', '2\n', '3\n']
+        tf1 = abspath('tf1')
+        tf1_new = abspath('tf1_new')
+        old_result = Result.from_values('origin', 'message', 'tf1', 1)
+        original_file_dict = {tf1: original_file}
+        modified_file_dict = {tf1_new: original_file}
+
+        # The original file name only exists as empty placeholder after the
+        # renaming, so the result doesn't affect any code of the new files.
+        new_results = filter_results(original_file_dict, modified_file_dict,
+                                     [old_result], [old_result])
+        self.assertEqual(new_results, [old_result])
+
+    def test_filter_result_tables(self):
+        original_file = ['line {}\n'.format(i) for i in range(20)]
+        modified_file = ['new line\n'] + original_file
+        tf1 = abspath('tf1')
+        tf2 = abspath('tf2')
+        original_file_dict = {tf1: original_file, tf2: original_file}
+        modified_file_dict = {tf1: modified_file, tf2: original_file}
+
+        original_results = [
+            Result.from_values('origin', 'message', file_name, line)
+            for file_name in (tf1, tf2)
+            for line in range(1, 21)] + [Result('origin', 'global')]
+        modified_results = [
+            Result.from_values('origin', 'message', file_name, line)
+            for file_name, lines in ((tf1, 21), (tf2, 20))
+            for line in range(1, lines + 1)] + [
+                Result('origin', 'global'), Result('origin', 'new global')]
+
+        # The columns are read directly, without building the rows.
+        with patch.object(ResultTable, 'row') as row:
+            new_table = filter_result_tables(
+                dict(original_file_dict),
+                dict(modified_file_dict),
+                ResultTable.from_results(original_results),
+                ResultTable.from_results(modified_results))
+        self.assertFalse(row.called)
+        new_results = filter_results(original_file_dict,
+                                     modified_file_dict,
+                                     original_results,
+                                     modified_results)
+
+        self.assertEqual(
+            [(row['file'], row['start_line'], row['message'])
+             for row in new_table.rows()],
+            [(tf1, 1, 'message'), (None, None, 'new global')])
+        self.assertEqual(
+            sorted(new_table.to_results(),
+                   key=lambda result: result.message),
+            sorted(new_results, key=lambda result: result.message))
@@ -0,0 +1,142 @@
+import json
+import unittest
+from os.path import abspath, relpath
+
+from coalib.output.JSONEncoder import create_json_encoder
+from coalib.results.Result import RESULT_SEVERITY, Result
+from coalib.results.ResultTable import ResultTable, StringTable
+from coalib.results.SourceRange import SourceRange
+
+
+class StringTableTest(unittest.TestCase):
+
+    def test_intern(self):
+        uut = StringTable()
+        self.assertEqual(uut.intern(None), 0)
+        self.assertEqual(uut.intern('a'), 1)
+        self.assertEqual(uut.intern('b'), 2)
+        self.assertEqual(uut.intern('a'), 1)
+        self.assertEqual(len(uut), 3)
+        self.assertEqual(uut[0], None)
+        self.assertEqual(uut[2], 'b')
+
+
+class ResultTableTest(unittest.TestCase):
+
+    def setUp(self):
+        self.results = [
+            Result.from_values('PEP8Bear', 'Line too long.', 'a.py',
+                               3, 80, 3, 90),
+            Result.from_values('PEP8Bear', 'Line too long.', 'b.py', 5,
+                               severity=RESULT_SEVERITY.MAJOR),
+            Result.from_values('PyLintBear', 'Unused import.', 'b.py', 1,
+                               debug_msg='W0611', confidence=50),
+            Result('LicenseBear', 'No license.',
+                   severity=RESULT_SEVERITY.INFO)]
+        self.uut = ResultTable.from_results(self.results)
+
+    def test_len(self):
+        self.assertEqual(len(ResultTable()), 0)
+        self.assertEqual(len(self.uut), 4)
+
+    def test_row(self):
+        self.assertEqual(dict(self.uut.row(0)),
+                         {'origin': 'PEP8Bear',
+                          'file': abspath('a.py'),
+                          'start_line': 3,
+                          'start_column': 80,
+                          'end_line': 3,
+                          'end_column': 90,
+                          'severity': RESULT_SEVERITY.NORMAL,
+                          'confidence': 100,
+                          'message': 'Line too long.',
+                          'debug_msg': ''})
+
+        row = self.uut.row(3)
+        self.assertEqual(row['file'], None)
+        self.assertEqual(row['start_line'], None)
+        self.assertEqual(row['severity'], RESULT_SEVERITY.INFO)
+        self.assertEqual(len(list(self.uut.rows())), 4)
+
+    def test_column(self):
+        column = self.uut.column('start_line')
+        self.assertEqual(column.tolist(), [3, 5, 1, 0])
+        # The column is exported without a copy.
+        self.uut.columns['start_line'][0] = 4
+        self.assertEqual(column[0], 4)
+        with self.assertRaises(BufferError):
+            self.uut.append(self.results[0])
+        column.release()
+        self.uut.append(self.results[0])
+
+    def test_strings_interned(self):
+        messages = self.uut.column('message').tolist()
+        self.assertEqual(messages[0], messages[1])
+        self.assertEqual(self.uut.strings[messages[0]], 'Line too long.')
+
+    def test_affected_code(self):
+        self.assertEqual(self.uut.affected_code(0),
+                         self.results[0].affected_code)
+        self.assertEqual(self.uut.affected_code(3), ())
+
+    def test_only_first_range(self):
+        result = Result('Bear', 'message', affected_code=(
+            SourceRange.from_values('a.py', 1),
+            SourceRange.from_values('b.py', 2)))
+        uut = ResultTable.from_results([result])
+        self.assertEqual(uut.affected_code(0), result.affected_code[:1])
+
+    def test_to_results(self):
+        results = self.uut.to_results()
+        self.assertEqual(results, self.results)
+        self.assertEqual(results[2].confidence, 50)
+        self.assertEqual(results[2].debug_msg, 'W0611')
+
+    def test_select(self):
+        self.assertEqual(len(self.uut.select()), 4)
+        self.assertEqual(
+            self.uut.select(min_severity=RESULT_SEVERITY.NORMAL).to_results(),
+            self.results[:3])
+        self.assertEqual(self.uut.select(file_glob='**.py').to_results(),
+                         self.results[:3])
+        self.assertEqual(self.uut.select(file_glob=['**a.py', '**c.py'])
+                         .to_results(),
+                         self.results[:1])
+        self.assertEqual(self.uut.select(origin='P*Bear').to_results(),
+                         self.results[:3])
+        self.assertEqual(self.uut.select(origin='PEP8Bear',
+                                         file_glob='**b.py').to_results(),
+                         self.results[1:2])
+        self.assertEqual(len(self.uut.select(origin='Unknown')), 0)
+
+    def test_select_shares_strings(self):
+        selected = self.uut.select(origin='LicenseBear')
+        self.assertIs(selected.strings, self.uut.strings)
+        self.assertEqual(selected.row(0)['message'], 'No license.')
+
+    def test_take(self):
+        self.assertEqual(self.uut.take([0, 1, 0, 1]).to_results(),
+                         self.results[1::2])
+
+    def test_count_by(self):
+        self.assertEqual(list(self.uut.count_by('origin').items()),
+                         [('PEP8Bear', 2), ('PyLintBear', 1),
+                          ('LicenseBear', 1)])
+        self.assertEqual(self.uut.count_by('file'),
+                         {abspath('a.py'): 1, abspath('b.py'): 2, None: 1})
+        self.assertEqual(self.uut.count_by('severity'),
+                         {RESULT_SEVERITY.INFO: 1,
+                          RESULT_SEVERITY.NORMAL: 2,
+                          RESULT_SEVERITY.MAJOR: 1})
+
+    def test_json(self):
+        JSONEncoder = create_json_encoder(use_relpath=True)
+        data = json.loads(json.dumps(self.uut, cls=JSONEncoder))
+        self.assertEqual(data['columns']['start_line'], [3, 5, 1, 0])
+        file_id = data['columns']['file'][0]
+        self.assertEqual(data['strings'][file_id], relpath('a.py'))
+        # The table itself keeps the absolute paths.
+        self.assertEqual(self.uut.row(0)['file'], abspath('a.py'))
+
+        data = json.loads(json.dumps(self.uut, cls=create_json_encoder()))
+        self.assertEqual(data['strings'][file_id], abspath('a.py'))
@@ -1,8 +1,11 @@
 import unittest
 import json
+import pickle
 from os.path import abspath
+from unittest.mock import patch
 
 from coalib.results.Diff import Diff
+from coalib.results.HiddenResult import HiddenResult
 from coalib.results.Result import RESULT_SEVERITY, Result
 from coalib.results.SourceRange import SourceRange
 from coalib.output.JSONEncoder import create_json_encoder
@@ -205,3 +208,37 @@ class ResultTest(unittest.TestCase):
         uut2 = Result('origin', 'msg', diffs={'f_b': diff})
 
         self.assertNotEqual(uut1, uut2)
+
+    def test_slots(self):
+        uut = Result.from_values('origin', 'msg', 'file', 1)
+        self.assertEqual(uut.__dict__, {})
+        self.assertFalse(hasattr(uut.affected_code[0], '__dict__'))
+        self.assertFalse(hasattr(uut.affected_code[0].start, '__dict__'))
+        with self.assertRaises(AttributeError):
+            uut.affected_code[0].unknown_attribute = 5
+
+        # Other attributes can still be set on results.
+        uut.unknown_attribute = 5
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(uut, protocol))
+            self.assertEqual(unpickled.unknown_attribute, 5)
+
+    def test_pickle(self):
+        for uut in (Result.from_values('origin', 'msg', 'file', 1, 2, 3, 4,
+                                       diffs={'file': Diff(['1'])}),
+                    HiddenResult('origin', {'contents': 1})):
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                unpickled = pickle.loads(pickle.dumps(uut, protocol))
+                self.assertEqual(unpickled, uut)
+                self.assertEqual(unpickled.id, uut.id)
+
+    def test_id(self):
+        ids = {Result('origin', 'msg').id for _ in range(1000)}
+        self.assertEqual(len(ids), 1000)
+
+        # Forked processes draw their own prefix.
+        uut = Result('origin', 'msg')
+        with patch('os.getpid', return_value=-1):
+            forked = Result('origin', 'msg')
+        self.assertNotEqual(forked.id >> 32, uut.id >> 32)
+        self.assertNotIn(forked.id, ids)
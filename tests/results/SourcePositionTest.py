@@ -19,6 +19,11 @@ class SourcePositionTest(unittest.TestCase):
         SourcePosition('file', 4, None)
         SourcePosition('file', 4, 5)
 
+    def test_file_interned(self):
+        first = SourcePosition(''.join(['fi', 'le']), 1)
+        second = SourcePosition('file', 2)
+        self.assertIs(first.file, second.file)
+
     def test_string_conversion(self):
         uut = SourcePosition('filename', 1)
         self.assertRegex(
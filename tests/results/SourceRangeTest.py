@@ -127,6 +127,20 @@ class SourceRangeTest(unittest.TestCase):
                 {abspath('test_file'): Diff([], rename='another_file')}),
             'another_file')
 
+    def test_modified_range(self):
+        src_range = SourceRange.from_values('test_file', 2, 1, 2, 3)
+        self.assertIs(src_range.modified_range({}), src_range)
+
+        diff = Diff(['1\n', '2\n'], rename='another_file')
+        diff.add_lines(0, ['0\n'])
+        self.assertEqual(
+            src_range.modified_range({abspath('test_file'): diff}),
+            SourceRange.from_values('another_file', 3, 1, 3, 3))
+
+        diff.delete_line(2)
+        self.assertIsNone(
+            src_range.modified_range({abspath('test_file'): diff}))
+
 
 class SourceRangeExpandTest(unittest.TestCase):
 
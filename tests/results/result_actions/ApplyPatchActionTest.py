@@ -1,11 +1,13 @@
 import unittest
 import os
+import stat
 from os.path import isfile
 
 from coala_utils.ContextManagers import make_temp
 from coalib.results.Diff import Diff
 from coalib.results.Result import Result
-from coalib.results.result_actions.ApplyPatchAction import ApplyPatchAction
+from coalib.results.result_actions.ApplyPatchAction import (
+    ApplyPatchAction, write_patched_file)
 from coalib.settings.Section import Section
 
 
@@ -144,6 +146,61 @@ class ApplyPatchActionTest(unittest.TestCase):
             # Recreate file so that context manager make_temp() can delete it
             open(f_a, 'w').close()
 
+    def test_apply_pending(self):
+        pending_files = {}
+        uut = ApplyPatchAction(pending_files)
+        with make_temp() as f_a:
+            file_dict = {f_a: ['1\n', '2\n', '3\n']}
+            file_diff_dict = {}
+
+            diff = Diff(file_dict[f_a], rename=f_a+'.renamed')
+            diff.delete_line(1)
+            uut.apply(Result('origin', 'msg', diffs={f_a: diff}),
+                      file_dict,
+                      file_diff_dict)
+            diff = Diff(file_dict[f_a])
+            diff.change_line(3, '3\n', '3_changed\n')
+            uut.apply(Result('origin', 'msg', diffs={f_a: diff}),
+                      file_dict,
+                      file_diff_dict)
+
+            # Nothing but the backup is written yet.
+            self.assertEqual(pending_files, {f_a: f_a})
+            self.assertTrue(isfile(f_a+'.orig'))
+            self.assertFalse(isfile(f_a+'.renamed'))
+
+            write_patched_file(f_a, file_diff_dict[f_a], pending_files[f_a])
+            self.assertFalse(isfile(f_a))
+            with open(f_a+'.renamed') as fh:
+                self.assertEqual(fh.readlines(), ['2\n', '3_changed\n'])
+
+            os.remove(f_a+'.orig')
+            os.remove(f_a+'.renamed')
+            # Recreate file so that context manager make_temp() can delete it
+            open(f_a, 'w').close()
+
+    def test_apply_atomically(self):
+        uut = ApplyPatchAction()
+        with make_temp() as f_a:
+            os.chmod(f_a, 0o640)
+            mode = stat.S_IMODE(os.stat(f_a).st_mode)
+            file_dict = {f_a: ['1\n']}
+            diff = Diff(file_dict[f_a])
+            diff.change_line(1, '1\n', '1_changed\n')
+            uut.apply(Result('origin', 'msg', diffs={f_a: diff}),
+                      file_dict,
+                      {},
+                      no_orig=True)
+
+            with open(f_a) as fh:
+                self.assertEqual(fh.readlines(), ['1_changed\n'])
+            self.assertEqual(stat.S_IMODE(os.stat(f_a).st_mode), mode)
+            # No temporary files are left over.
+            directory, name = os.path.split(f_a)
+            self.assertEqual([entry for entry in os.listdir(directory)
+                              if name in entry],
+                             [name])
+
     def test_is_applicable(self):
         diff = Diff(['1\n', '2\n', '3\n'])
         diff.delete_line(2)
@@ -209,6 +209,21 @@ class OpenEditorActionTest(unittest.TestCase):
                 ['vim', self.fa, '+12']
             )
 
+    def test_open_files_at_patched_position(self):
+        uut = OpenEditorAction()
+        result_mock = Result.from_values(
+            'test', '', self.fa, line=2, column=3,
+        )
+        file_dict = {self.fa: ['1\n', '2\n']}
+        diff = Diff(file_dict[self.fa])
+        diff.add_lines(0, ['0\n'])
+        with unittest.mock.patch('subprocess.call') as call:
+            uut.apply(result_mock, file_dict, {self.fa: diff}, editor='subl')
+            call.assert_called_with(
+                ['subl', '--wait', '{0}:3:3'.format(self.fa)],
+                stdout=subprocess.PIPE
+            )
+
     def test_open_files_at_position_no_position(self):
         uut = OpenEditorAction()
         result_mock = Result.from_values(
@@ -3,6 +3,7 @@ import tempfile
 import unittest
 import logging
 import sys
+from unittest.mock import patch
 
 from pyprint.ClosableObject import close_objects
 from pyprint.NullPrinter import NullPrinter
@@ -17,6 +18,8 @@ from coala_utils.ContextManagers import (
     make_temp, change_directory, retrieve_stdout)
 from coalib.output.printers.LogPrinter import LogPrinter
 from coala_utils.string_processing import escape
+from coalib.parsing.ConfParser import ConfParser
+from coalib.settings import ConfigurationGathering
 from coalib.settings.ConfigurationGathering import (
     aspectize_sections,
     validate_aspect_config,
@@ -25,6 +28,7 @@ from coalib.settings.ConfigurationGathering import (
     gather_configuration,
     get_filtered_bears,
     load_configuration,
+    parse_config_file,
 )
 from coalib.settings.Setting import Setting
 from coalib.misc.Constants import get_system_coafile
@@ -38,10 +42,30 @@ from tests.TestUtilities import (
 from testfixtures import log_capture
 
 
+def isolate_config_cache(test_case):
+    """
+    Stores the sections of the config files parsed during a test in
+    ``test_case.stored_config_files`` instead of the user data directory.
+    """
+    test_case.stored_config_files = stored = {}
+    for patcher in (
+            patch.object(ConfigurationGathering, '_parsed_config_files',
+                         None),
+            patch.object(ConfigurationGathering, 'pickle_load',
+                         lambda _, identifier, fallback:
+                             stored.get(identifier, fallback)),
+            patch.object(ConfigurationGathering, 'pickle_dump',
+                         lambda _, identifier, data:
+                             stored.update({identifier: dict(data)}))):
+        patcher.start()
+        test_case.addCleanup(patcher.stop)
+
+
 @pytest.mark.usefixtures('disable_bears')
 class ConfigurationGatheringTest(unittest.TestCase):
 
     def setUp(self):
+        isolate_config_cache(self)
         self.log_printer = LogPrinter(NullPrinter())
 
         # Needed so coala doesn't error out
@@ -149,6 +173,74 @@ class ConfigurationGatheringTest(unittest.TestCase):
                                  self.log_printer,
                                  arg_list=[])
 
+    def test_parse_config_file_cached(self):
+        original_parse = ConfParser.parse
+        with make_temp() as filename, \
+                patch.object(ConfParser, 'parse', autospec=True,
+                             side_effect=original_parse) as parse:
+            with open(filename, 'w') as file:
+                file.write('[test]\nvalue = 1\n')
+
+            sections = parse_config_file(filename)
+            sections['test']['value'] = '2'
+            self.assertEqual(str(parse_config_file(filename)['test']),
+                             "test {value : '1'}")
+            self.assertEqual(parse.call_count, 1)
+
+            # A new process only needs the stored sections.
+            ConfigurationGathering._parsed_config_files = None
+            sections = parse_config_file(filename)
+            self.assertEqual(sections['test']['value'].origin, filename)
+            self.assertEqual(parse.call_count, 1)
+
+            with open(filename, 'w') as file:
+                file.write('[test]\nvalue = 3\n')
+            self.assertEqual(str(parse_config_file(filename)['test']),
+                             "test {value : '3'}")
+            self.assertEqual(parse.call_count, 2)
+
+            # Files parsed by other coala or Python versions are parsed again.
+            ConfigurationGathering._parsed_config_files = None
+            with patch.object(sys, 'version_info', (2, 7, 0)):
+                parse_config_file(filename)
+            self.assertEqual(parse.call_count, 3)
+
+    def test_parse_config_file_cache_pruned(self):
+        stored = self.stored_config_files
+        with make_temp() as filename, \
+                patch.object(ConfigurationGathering, 'CONFIG_CACHE_SIZE', 2):
+            with make_temp() as deleted_filename:
+                with open(deleted_filename, 'w') as file:
+                    file.write('[test]\n')
+                parse_config_file(deleted_filename)
+
+            with open(filename, 'w') as file:
+                file.write('[test]\n')
+            parse_config_file(filename)
+            self.assertEqual(
+                list(stored[ConfigurationGathering.CONFIG_CACHE_IDENTIFIER]),
+                [filename])
+
+            with make_temp() as second, make_temp() as third:
+                for other in (second, third):
+                    with open(other, 'w') as file:
+                        file.write('[test]\n')
+                    parse_config_file(other)
+                self.assertEqual(
+                    list(stored[
+                        ConfigurationGathering.CONFIG_CACHE_IDENTIFIER]),
+                    [second, third])
+
+    def test_parse_config_file_warnings(self):
+        with make_temp() as filename:
+            with open(filename, 'w') as file:
+                file.write('value = 1\n')
+
+            for _ in range(2):
+                with self.assertLogs(level='WARNING'):
+                    parse_config_file(filename)
+            self.assertEqual(self.stored_config_files, {})
+
     def test_merge(self):
         Constants.system_coafile = os.path.abspath(os.path.join(
             os.path.dirname(os.path.realpath(__file__)),
@@ -443,6 +535,7 @@ class ValidateAndInjectLanguageTest(unittest.TestCase):
 class ConfigurationGatheringCollectionTest(unittest.TestCase):
 
     def setUp(self):
+        isolate_config_cache(self)
         self.old_argv = sys.argv
         self.log_printer = LogPrinter(NullPrinter())
 
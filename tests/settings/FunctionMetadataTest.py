@@ -1,4 +1,6 @@
 import unittest
+from inspect import getfullargspec
+from unittest.mock import patch
 
 from coalib.settings.FunctionMetadata import FunctionMetadata
 from coalib.settings.Section import Section
@@ -71,6 +73,58 @@ class FunctionMetadataTest(unittest.TestCase):
                            int,
                            6)})
 
+    def test_from_function_cached(self):
+        FunctionMetadata.invalidate_cache(TestClass.__init__)
+        with patch('coalib.settings.FunctionMetadata.getfullargspec',
+                   side_effect=getfullargspec) as argspec:
+            first = FunctionMetadata.from_function(TestClass(5, 5).__init__)
+            second = FunctionMetadata.from_function(TestClass(6, 6).__init__)
+            self.assertEqual(argspec.call_count, 1)
+
+            # The class' function has an additional self parameter.
+            unbound = FunctionMetadata.from_function(TestClass.__init__)
+            self.assertEqual(argspec.call_count, 2)
+            self.assertIn('self', unbound.non_optional_params)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first.non_optional_params, second.non_optional_params)
+        first.add_deprecated_param('param1', 'alias')
+        first.desc = 'changed'
+        self.assertNotIn('alias', second.optional_params)
+        self.assertEqual(second.desc, 'Description')
+        self.assertNotIn(
+            'alias',
+            FunctionMetadata.from_function(TestClass.__init__).optional_params)
+
+    def test_invalidate_cache(self):
+        def function(param):
+            pass
+
+        self.assertEqual(
+            FunctionMetadata.from_function(function).non_optional_params,
+            {'param': (FunctionMetadata.str_nodesc, None)})
+        function.__doc__ = ':param param: desc'
+        self.assertEqual(
+            FunctionMetadata.from_function(function).non_optional_params,
+            {'param': (FunctionMetadata.str_nodesc, None)})
+
+        FunctionMetadata.invalidate_cache(function)
+        self.assertEqual(
+            FunctionMetadata.from_function(function).non_optional_params,
+            {'param': ('desc', None)})
+
+        function.__doc__ = ':param param: other desc'
+        FunctionMetadata.invalidate_cache()
+        self.assertEqual(
+            FunctionMetadata.from_function(function).non_optional_params,
+            {'param': ('other desc', None)})
+
+    def test_from_builtin(self):
+        uut = FunctionMetadata.from_function(len)
+        self.assertEqual(uut.name, 'len')
+        self.assertEqual(list(uut.non_optional_params), ['obj'])
+        FunctionMetadata.invalidate_cache(len)
+
     def test_create_params_from_section_invalid(self):
         section = Section('name')
         section.append(Setting('bad_param', 'value'))
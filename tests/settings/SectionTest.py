@@ -1,5 +1,6 @@
 import unittest
 import os
+import sys
 
 from coalib.bearlib.aspects import AspectList, Root, get as get_aspect
 from coalib.bearlib.aspects.meta import issubaspect
@@ -187,6 +188,16 @@ class SectionTest(unittest.TestCase):
         path = os.path.join(glob_escape(root), glob_escape('test2 (1)'), '**')
         self.assertIn(path, section.bear_dirs())
 
+    def test_bear_dirs_sys_path(self):
+        section = Section('section', None)
+        section.append(Setting('bear_dirs', 'test_sys_path'))
+        section.bear_dirs()
+        section.bear_dirs()
+        bear_dir = os.path.join(get_config_directory(section),
+                                'test_sys_path')
+        self.assertEqual(sys.path.count(bear_dir), 1)
+        sys.path.remove(bear_dir)
+
     def test_set_default_section(self):
         section = Section('section')
 
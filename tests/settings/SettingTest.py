@@ -1,4 +1,5 @@
 import os
+import pickle
 import unittest
 from collections import OrderedDict
 
@@ -11,6 +12,16 @@ from coalib.settings.Setting import (
 )
 from coalib.parsing.DefaultArgParser import PathArg
 from coalib.parsing.Globbing import glob_escape
+from coalib.settings.Section import Section
+from coala_utils.ContextManagers import change_directory
+
+
+converted_values = []
+
+
+def convert_int(value):
+    converted_values.append(value)
+    return int(value)
 
 
 class SettingTest(unittest.TestCase):
@@ -175,3 +186,80 @@ class SettingTest(unittest.TestCase):
                                     'Iteration on this object is invalid'):
             self.uut = Setting('key', '1, 2, 3', '.', to_append=True)
             list(self.uut)
+
+    def test_cached_conversions(self):
+        calls = converted_values
+        del calls[:]
+
+        converter = typed_list(convert_int)
+        self.uut = Setting('key', '1, 2', origin='origin')
+        self.assertEqual(converter(self.uut), [1, 2])
+        converted = converter(self.uut)
+        self.assertEqual(converted, [1, 2])
+        self.assertEqual(len(calls), 2)
+
+        # The cached value can't be modified through the returned one.
+        converted.append(3)
+        self.assertEqual(converter(self.uut), [1, 2])
+
+        # Copies handed out by sections reuse the cache, but conversions of
+        # the copies aren't added to it.
+        section = Section('section')
+        section.append(self.uut)
+        self.assertEqual(converter(section['key']), [1, 2])
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(typed_list(str)(section['key']), ['1', '2'])
+        self.assertEqual(len(self.uut._conversions), 1)
+
+        self.uut.origin = 'other'
+        self.assertEqual(converter(self.uut), [1, 2])
+        self.assertEqual(len(calls), 4)
+
+        self.uut.value = '3'
+        self.assertEqual(converter(self.uut), [3])
+        self.assertEqual(converter(section['key']), [3])
+        self.assertEqual(len(calls), 5)
+
+    def test_cached_conversions_new_converters(self):
+        self.uut = Setting('key', 'a, b')
+        for _ in range(3):
+            self.assertEqual(typed_list(str)(self.uut), ['a', 'b'])
+            self.assertEqual(typed_dict(str, int, 0)(self.uut),
+                             {'a': 0, 'b': 0})
+        self.assertEqual(len(self.uut._conversions), 2)
+
+        # Unhashable arguments can't be part of the key.
+        self.assertEqual(typed_dict(str, int, [])(self.uut),
+                         {'a': [], 'b': []})
+        self.assertEqual(len(self.uut._conversions), 2)
+
+        # Lambdas and local functions are new objects every time, so they
+        # would never hit the cache.
+        def local_str(value):
+            return str(value)
+
+        for _ in range(3):
+            self.assertEqual(typed_list(lambda value: str(value))(self.uut),
+                             ['a', 'b'])
+            self.assertEqual(typed_ordered_dict(local_str, int, 0)(self.uut),
+                             OrderedDict([('a', 0), ('b', 0)]))
+        self.assertEqual(len(self.uut._conversions), 2)
+
+    def test_cached_path_conversions(self):
+        self.uut = Setting('key', 'a, b', origin=os.path.join('dir', 'file'))
+        with change_directory(os.path.dirname(os.path.abspath(__file__))):
+            expected = [os.path.abspath(os.path.join('dir', 'a')),
+                        os.path.abspath(os.path.join('dir', 'b'))]
+            self.assertEqual(path_list(self.uut), expected)
+            self.assertEqual(glob_list(self.uut), expected)
+        self.assertEqual(path_list(self.uut),
+                         [os.path.abspath(os.path.join('dir', 'a')),
+                          os.path.abspath(os.path.join('dir', 'b'))])
+
+    def test_pickle(self):
+        self.uut = Setting('key', '1, 2', origin='origin')
+        int_list(self.uut)
+        copied = pickle.loads(pickle.dumps(self.uut))
+        self.assertEqual((copied.key, copied.value, copied.origin),
+                         ('key', '1, 2', 'origin'))
+        self.assertEqual(int_list(copied), [1, 2])